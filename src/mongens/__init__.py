@@ -1,10 +1,21 @@
-from mongens import *
-from mongens.data.data import *
+import importlib
 
 
 initialized = True
 
 
+def __getattr__(name):
+    # The data tables used to be star-imported here. Resolve them on first access
+    # instead, so importing a submodule (e.g. the CLI) doesn't load every table.
+    if name.isupper():
+        data = importlib.import_module(".data.data", __name__)
+        try:
+            return getattr(data, name)
+        except AttributeError:
+            pass
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def main():
     pass
 
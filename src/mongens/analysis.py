@@ -0,0 +1,300 @@
+"""
+Exact probability distributions of the generator, computed from the loaded tables.
+
+Every function here returns what the sampler would produce in the limit of
+infinitely many draws, with no sampling: type pairs, forms and habitats per
+type, forge-time and apply_mutagens() mutagen picks (including weighted
+sampling without replacement), held items, physical traits and tempers.
+Balance reports and tests can compare against these directly instead of
+running thousands of trials.
+
+Distributions are plain dicts of outcome -> probability, in data order.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple
+
+from .data import data
+from .monsterseed import (
+    HELD_ITEM_CHANCE,
+    SINGLE_TRAIT_CHANCE,
+    check_type_pair,
+    form_choices,
+    habitat_choices,
+    mutagen_choices,
+)
+
+Distribution = Tuple[Tuple[Any, float], ...]
+
+
+def table_distribution(table: Optional[Tuple[Tuple[str, ...], Tuple[float, ...]]]) -> Distribution:
+    """
+    Summary:
+        Probabilities of a type_pair_space draw table: each item's share of the
+        cumulative range it is bisected from. Zero-weight items are left out.
+    """
+    if table is None:
+        return ()
+    items, cumulative = table
+    total = cumulative[-1]
+    out, previous = [], 0.0
+    for item, upto in zip(items, cumulative):
+        if upto > previous:
+            out.append((item, (upto - previous) / total))
+        previous = upto
+    return tuple(out)
+
+
+def choice_distribution(raw: Any, default: Optional[str] = None) -> Distribution:
+    """
+    Summary:
+        Probabilities of one forge-time choice, mirroring how forge() draws it:
+        weighted_choice() for a weight mapping, rng.choice() for a list, the
+        value itself for a scalar and `default` when empty.
+
+    Raises:
+        ValueError: If a weight mapping has no positive total.
+    """
+    if isinstance(raw, Mapping):
+        weights = [(item, float(w["weight"] if isinstance(w, Mapping) else w)) for item, w in raw.items()]
+        total = sum(w for _, w in weights)
+        if total <= 0:
+            raise ValueError(f"total weight must be > 0: {dict(raw)!r}")
+        return tuple((item, w / total) for item, w in weights if w > 0)
+    if isinstance(raw, (list, tuple)):
+        if not raw:
+            return ((default, 1.0),)
+        probs: Dict[Any, float] = {}
+        for item in raw:
+            probs[item] = probs.get(item, 0.0) + 1.0 / len(raw)
+        return tuple(probs.items())
+    return ((raw or default, 1.0),)
+
+
+def pair_distribution(spec: Any = None) -> Distribution:
+    """
+    Summary:
+        Exact probability of every (primary, secondary) pair a spec can draw,
+        as monsterseed.sample_type_pair() samples them.
+
+    Args:
+        spec: A pipeline.Spec or a mapping of its fields (defaults to fully random types).
+
+    Returns:
+        A tuple of ((primary, secondary or None), probability) in data order.
+
+    Raises:
+        ValueError: If no legal pair meets the spec.
+    """
+    from .pipeline import Spec
+
+    spec = Spec.coerce(spec)
+    check_type_pair(spec.primary_type, spec.secondary_type)
+    space = data.derived("type_pair_space")
+    chance = min(max(spec.secondary_chance, 0.0), 1.0)
+
+    if spec.secondary_type not in ("random", "none"):
+        s = spec.secondary_type
+        if spec.primary_type != "random":
+            return (((spec.primary_type, s), 1.0),)
+        return tuple(((p, s), prob) for p, prob in table_distribution(space["primaries_for"][s]))
+
+    if spec.primary_type == "random":
+        primaries = table_distribution(space["primaries"])
+    else:
+        primaries = ((spec.primary_type, 1.0),)
+    out: List[Tuple[Tuple[str, Optional[str]], float]] = []
+    for p, p_prob in primaries:
+        secondaries = table_distribution(space["secondaries"][p]) if spec.secondary_type == "random" else ()
+        alone = 1.0 if not secondaries else 1.0 - chance
+        if alone > 0:
+            out.append(((p, None), p_prob * alone))
+        if chance > 0:
+            out.extend(((p, s), p_prob * chance * s_prob) for s, s_prob in secondaries)
+    return tuple(out)
+
+
+# -- Types
+
+def type_pairs(spec: Any = None) -> Dict[Tuple[str, Optional[str]], float]:
+    """Joint distribution of (primary, secondary or None) under a spec."""
+    return dict(pair_distribution(spec))
+
+
+def primary_types(spec: Any = None) -> Dict[str, float]:
+    """Marginal distribution of the primary type under a spec."""
+    out: Dict[str, float] = {}
+    for (p, _), prob in pair_distribution(spec):
+        out[p] = out.get(p, 0.0) + prob
+    return out
+
+
+def secondary_types(spec: Any = None, primary_type: Optional[str] = None) -> Dict[Optional[str], float]:
+    """
+    Summary:
+        Distribution of the secondary type (None for none) under a spec,
+        conditional on `primary_type` when one is given.
+    """
+    out: Dict[Optional[str], float] = {}
+    for (p, s), prob in pair_distribution(spec):
+        if primary_type is None or p == primary_type:
+            out[s] = out.get(s, 0.0) + prob
+    total = sum(out.values())
+    if primary_type is not None and total > 0:
+        out = {s: prob / total for s, prob in out.items()}
+    return out
+
+
+# -- Forge-time choices
+
+def forms(primary_type: str) -> Dict[str, float]:
+    """Distribution of the form forge() picks for a primary type."""
+    return dict(choice_distribution(form_choices(primary_type), "Unknown"))
+
+
+def habitats(primary_type: str) -> Dict[str, float]:
+    """Distribution of the habitat forge() picks for a primary type."""
+    return dict(choice_distribution(habitat_choices(primary_type), "Generic"))
+
+
+def _mods(bucket: str) -> Mapping[str, Any]:
+    if bucket == "major":
+        return data.MAJOR_MODS
+    if bucket == "utility":
+        return data.UTILITY_MODS
+    raise ValueError(f"Unknown mutagen bucket {bucket!r}; use 'major' or 'utility'")
+
+
+def forge_mutagens(bucket: str, primary_type: str, secondary_type: Optional[str] = None) -> Dict[str, float]:
+    """Distribution of the single mutagen forge() picks for a bucket and type pair."""
+    return dict(choice_distribution(mutagen_choices(_mods(bucket), primary_type, secondary_type)))
+
+
+# -- apply_mutagens()
+
+def mutagen_weights(
+    bucket: str,
+    primary_type: str,
+    secondary_type: Optional[str] = None,
+    existing: Iterable[str] = (),
+) -> Dict[str, float]:
+    """
+    Summary:
+        The weight table apply_mutagens() samples a bucket from: type-gated,
+        synergy-weighted, with the seed's existing mutagens removed.
+
+    Args:
+        bucket: "major" or "utility".
+        primary_type: The primary type of the monster.
+        secondary_type: The optional secondary type of the monster.
+        existing: Mutagens the seed already carries (any bucket).
+    """
+    from .mon_forge import _eligible_mutagens
+
+    _mods(bucket)
+    types = {primary_type} | ({secondary_type} if secondary_type else set())
+    return _eligible_mutagens(bucket, types, {str(m) for m in existing})
+
+
+def selections(weights: Mapping[str, float], k: int) -> Dict[FrozenSet[str], float]:
+    """
+    Summary:
+        Exact distribution of the set weighted_sample_without_replacement()
+        returns for `k` picks. Each pick is proportional to the weights still in
+        the pool; the order of the picks is summed out.
+
+    Returns:
+        A dict of frozenset of picked keys -> probability.
+    """
+    keys = [key for key, w in weights.items() if w > 0]
+    if k <= 0 or not keys:
+        return {frozenset(): 1.0}
+    if k >= len(weights):
+        return {frozenset(weights): 1.0}
+
+    total = sum(float(weights[key]) for key in keys)
+    level: Dict[FrozenSet[str], Tuple[float, float]] = {frozenset(): (1.0, total)}
+    for _ in range(min(k, len(keys))):
+        following: Dict[FrozenSet[str], Tuple[float, float]] = {}
+        for chosen, (prob, remaining) in level.items():
+            for key in keys:
+                if key in chosen:
+                    continue
+                w = float(weights[key])
+                picked = chosen | {key}
+                previous = following.get(picked, (0.0, remaining - w))[0]
+                following[picked] = (previous + prob * w / remaining, remaining - w)
+        level = following
+    return {chosen: prob for chosen, (prob, _) in level.items()}
+
+
+def inclusion(weights: Mapping[str, float], k: int) -> Dict[str, float]:
+    """
+    Summary:
+        Probability that each key is among `k` picks made without replacement;
+        the values sum to min(k, len(weights)).
+    """
+    out = {key: 0.0 for key in weights}
+    for chosen, prob in selections(weights, k).items():
+        for key in chosen:
+            out[key] += prob
+    return out
+
+
+def applied_mutagens(
+    bucket: str, primary_type: str, secondary_type: Optional[str] = None, count: int = 1
+) -> Dict[str, float]:
+    """
+    Summary:
+        Probability that each mutagen ends up in a seed's bucket after forge()
+        and apply_mutagens(count) for a type pair: the forge-time pick plus the
+        `count` picks made without replacement from the rest.
+
+    Returns:
+        A dict of mutagen key -> probability it is present; the values sum to
+        the expected number of mutagens in the bucket.
+    """
+    out: Dict[str, float] = {}
+    other = "utility" if bucket == "major" else "major"
+    other_picks = forge_mutagens(other, primary_type, secondary_type)
+    for picked, prob in forge_mutagens(bucket, primary_type, secondary_type).items():
+        out[picked] = out.get(picked, 0.0) + prob
+        # apply_mutagens() skips the seed's forge-time picks from both buckets.
+        for other_pick, other_prob in other_picks.items():
+            existing = {picked, other_pick}
+            for key, p_in in inclusion(mutagen_weights(bucket, primary_type, secondary_type, existing), count).items():
+                out[key] = out.get(key, 0.0) + prob * other_prob * p_in
+    return out
+
+
+# -- Details rolled for every seed
+
+def held_items() -> Dict[Optional[str], float]:
+    """Distribution of the held item (None for no item)."""
+    out: Dict[Optional[str], float] = {None: 1.0 - HELD_ITEM_CHANCE}
+    for item, prob in choice_distribution(data.HELD_ITEMS):
+        out[item] = HELD_ITEM_CHANCE * prob
+    return out
+
+
+def physical_traits() -> Dict[str, float]:
+    """Distribution of a single physical trait draw."""
+    return dict(choice_distribution(data.PHYSICAL_TRAITS))
+
+
+def trait_rates() -> Dict[str, float]:
+    """
+    Summary:
+        Probability that a seed shows each physical trait at least once: one
+        trait with SINGLE_TRAIT_CHANCE, otherwise two independent draws.
+    """
+    return {
+        trait: SINGLE_TRAIT_CHANCE * q + (1.0 - SINGLE_TRAIT_CHANCE) * (1.0 - (1.0 - q) ** 2)
+        for trait, q in physical_traits().items()
+    }
+
+
+def tempers(kind: str) -> Dict[str, float]:
+    """Distribution of a temper ("mood" or "affinity")."""
+    return dict(choice_distribution(data.TEMPERS_COUPLED[kind]))
@@ -0,0 +1,621 @@
+"""
+`mongen batch`: runs many generation jobs from one JSON Lines spec file.
+
+Each non-blank line is one job:
+
+    {"id": "axioms", "primary_type": "Axiom", "secondary_type": "none",
+     "majors": 2, "utils": 1, "count": 500, "seed": 7,
+     "outputs": {"dex": "out/axioms.txt", "jsonl": "out/all.jsonl"}}
+
+Every field is optional. Job fields:
+    id: Label used in progress messages (default "job<line number>").
+    primary_type, secondary_type, secondary_chance: As in pipeline.Spec.
+    majors, utils: Major and utility mutagens per monster (default 1 each).
+    count: Monsters to generate (default 1).
+    start: Dex number of the job's first monster (default 1); entries depend
+        only on the seed and their number, so a large run can be split into shards.
+    seed: Run seed for the job (default: derived from the batch seed and the job's position).
+    name: Name the monsters (default true).
+    dedup: Drop monsters identical (MonsterSeed.content_hash()) to one already
+        kept by a dedup job of this batch, or recorded in the batch's dedup
+        index (default false).
+    reroll_duplicates: Re-roll a duplicate up to this many times before dropping
+        it (default 0); implies dedup.
+    cache: Also save every monster to the monster cache (default false);
+        "compact" stores compact records (see monster_cache.save_monster()).
+    outputs: Map of format to path. "dex" appends dex entries, "jsonl" appends
+        one seed JSON object per line, "json" writes a JSON array of seeds, and
+        "markdown", "csv", "html" and "ndjson" (or any other registered
+        renderer, see mongens.renderers) render the monsters in that format.
+        Every output is fed from the same pass. "-" means stdout (not for
+        "json"). Default: the batch --format list (default "dex") written next
+        to the batch --output, or stdout (see default_outputs()).
+
+All jobs run in one process with the data loaded once and share one worker
+pool. Jobs naming the same output path share one open file (one JSON array for
+"json"), written in job order.
+
+With a checkpoint manifest (run_batch(checkpoint=...), `--checkpoint`), every
+output is forced to disk every `checkpoint_every` monsters and at the end of
+each job, and the manifest records the position reached and every output's
+size at that point. resume_batch() (`mongen resume <manifest>`) cuts each output
+back to those sizes and carries on, so a run killed at any point ends with the
+same files as one that never stopped. Monsters are derived from (job seed,
+dex number), so the manifest needs no RNG state.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+from dataclasses import asdict, dataclass, field, fields, replace
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+from .monsterseed import check_type_pair, spawn_rng
+from .renderers import RENDERERS, open_renderer
+
+# Written by the sink itself; every other format is a renderer (renderers.RENDERERS).
+SINK_FORMATS = ("dex", "jsonl", "json")
+FORMATS = SINK_FORMATS + tuple(fmt for fmt in RENDERERS if fmt not in SINK_FORMATS)
+MANIFEST_VERSION = 1
+CHECKPOINT_EVERY = 1000
+
+
+@dataclass(frozen=True)
+class Job:
+    """One line of a batch spec file; see the module docstring for the fields."""
+
+    id: str
+    primary_type: str = "random"
+    secondary_type: str = "random"
+    secondary_chance: float = 0.65
+    majors: int = 1
+    utils: int = 1
+    count: int = 1
+    start: int = 1
+    seed: Optional[int] = None
+    name: bool = True
+    dedup: bool = False
+    reroll_duplicates: int = 0
+    cache: Union[bool, str] = False
+    outputs: Mapping[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, record: Mapping[str, Any], default_id: str) -> "Job":
+        """
+        Summary:
+            Builds and validates a job from one parsed spec line.
+
+        Raises:
+            ValueError: If a field is unknown or has an invalid value.
+        """
+        if not isinstance(record, Mapping):
+            raise ValueError("a job must be a JSON object")
+        known = {f.name for f in fields(cls)}
+        unknown = sorted(set(record) - known)
+        if unknown:
+            raise ValueError(f"unknown field(s): {', '.join(unknown)}")
+
+        job = cls(**{"id": default_id, **record})
+        check_type_pair(job.primary_type, job.secondary_type)
+        for key in ("majors", "utils", "count", "reroll_duplicates"):
+            value = getattr(job, key)
+            if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+                raise ValueError(f"{key} must be a non-negative integer, got {value!r}")
+        if not isinstance(job.start, int) or isinstance(job.start, bool) or job.start < 1:
+            raise ValueError(f"start must be a dex number >= 1, got {job.start!r}")
+        if job.seed is not None and (not isinstance(job.seed, int) or isinstance(job.seed, bool)):
+            raise ValueError(f"seed must be an integer, got {job.seed!r}")
+        if job.cache not in (True, False, "compact"):
+            raise ValueError(f"cache must be true, false or \"compact\", got {job.cache!r}")
+        if not isinstance(job.outputs, Mapping):
+            raise ValueError("outputs must be an object mapping format to path")
+        for fmt, path in job.outputs.items():
+            if fmt not in FORMATS:
+                raise ValueError(f"unknown output format {fmt!r}; use one of {', '.join(FORMATS)}")
+            if not isinstance(path, str) or not path:
+                raise ValueError(f"output path for {fmt!r} must be a non-empty string")
+            if fmt == "json" and path == "-":
+                raise ValueError("'json' output needs a file path, not stdout")
+        return job
+
+
+def load_jobs(source: Union[str, Path, IO[str]]) -> List[Job]:
+    """
+    Summary:
+        Reads and validates every job in a spec file before anything runs, so a
+        typo on line 300 does not surface after 299 jobs have been written.
+
+    Args:
+        source: Path to a JSON Lines file, "-" for stdin, or an open text stream.
+
+    Returns:
+        The jobs in file order.
+
+    Raises:
+        ValueError: If a line is not valid JSON or not a valid job; the message
+            names the file and line.
+    """
+    if isinstance(source, (str, Path)) and str(source) != "-":
+        label = str(source)
+        with Path(source).open("r", encoding="utf-8") as f:
+            lines = f.readlines()
+    else:
+        stream = sys.stdin if isinstance(source, (str, Path)) else source
+        label = getattr(stream, "name", "<stream>")
+        lines = stream.readlines()
+
+    jobs = []
+    for lineno, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            jobs.append(Job.from_dict(json.loads(line), f"job{lineno}"))
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"{label}:{lineno}: {e}") from None
+    return jobs
+
+
+def default_outputs(formats: Iterable[str], output: Optional[str] = None) -> Dict[str, str]:
+    """
+    Summary:
+        Output paths for formats written side by side from one output path:
+        "dex" goes to `output` itself, "json" to '<output>.seed.json' and every
+        other format to `output` with that format's extension (.jsonl, .md,
+        .csv, .html, .ndjson, ...). Without an output path, one format goes to
+        stdout ("-").
+
+    Raises:
+        ValueError: If a format is unknown, or several formats would share stdout
+            or one file.
+    """
+    formats = list(dict.fromkeys(formats))
+    unknown = [fmt for fmt in formats if fmt not in FORMATS]
+    if unknown:
+        raise ValueError(f"unknown output format(s) {', '.join(unknown)}; use {', '.join(FORMATS)}")
+    if not output or output == "-":
+        if len(formats) > 1:
+            raise ValueError(f"{len(formats)} formats cannot share stdout; give an output file")
+        if formats == ["json"]:
+            raise ValueError("'json' output needs a file path, not stdout")
+        return {fmt: "-" for fmt in formats}
+    base = Path(output)
+    targets = {}
+    for fmt in formats:
+        if fmt == "dex":
+            targets[fmt] = output
+        elif fmt == "json":
+            targets[fmt] = str(base.with_suffix(base.suffix + ".seed.json"))
+        elif fmt == "jsonl":
+            targets[fmt] = str(base.with_suffix(".jsonl"))
+        else:
+            targets[fmt] = str(base.with_suffix(RENDERERS[fmt].extension))
+    if len(set(targets.values())) < len(targets):
+        raise ValueError(f"formats {', '.join(formats)} would share a file next to {output}; rename it")
+    return targets
+
+
+def _sync(handle: IO[str]) -> int:
+    # Forces a text handle's writes to disk and returns the file size.
+    handle.flush()
+    os.fsync(handle.fileno())
+    return os.fstat(handle.fileno()).st_size
+
+
+def _truncate(path: Path, size: int) -> None:
+    actual = path.stat().st_size if path.exists() else 0
+    if actual < size:
+        raise ValueError(f"{path} is shorter ({actual:,} bytes) than at the checkpoint ({size:,} bytes)")
+    if path.exists():
+        with path.open("r+b") as f:
+            f.truncate(size)
+
+
+class _Outputs:
+    # Opens each output path once for the whole batch, so jobs that name the same
+    # file append to one handle (or add to one JSON array) in job order.
+
+    def __init__(self) -> None:
+        self._open: Dict[Path, Tuple[str, Any]] = {}
+        self._stdout: Dict[str, Any] = {}
+
+    def get(self, fmt: str, path: str) -> Any:
+        from .writers import JsonArrayWriter
+
+        if path == "-":
+            if fmt in SINK_FORMATS:
+                return sys.stdout
+            # One renderer per format on stdout, so its header is written once.
+            if fmt not in self._stdout:
+                self._stdout[fmt] = open_renderer(fmt, sys.stdout)
+            return self._stdout[fmt]
+        key = Path(path).resolve()
+        if key in self._open:
+            opened_fmt, handle = self._open[key]
+            if opened_fmt != fmt:
+                raise ValueError(f"{path} is used for both {opened_fmt!r} and {fmt!r} output")
+            return handle
+        key.parent.mkdir(parents=True, exist_ok=True)
+        if fmt == "json":
+            handle = JsonArrayWriter(key)
+        elif fmt not in SINK_FORMATS:
+            handle = open_renderer(fmt, key)
+        else:
+            handle = key.open("a", encoding="utf-8")
+        self._open[key] = (fmt, handle)
+        return handle
+
+    def restore(self, saved: Mapping[str, Mapping[str, Any]]) -> None:
+        """Reopens outputs recorded by sync(), cut back to their recorded size."""
+        from .writers import JsonArrayWriter
+
+        for path, state in saved.items():
+            key = Path(path)
+            _truncate(key, state["offset"])
+            if state["format"] == "json":
+                handle = JsonArrayWriter(key, resume_at=(state["offset"], state["count"]))
+            elif state["format"] not in SINK_FORMATS:
+                handle = open_renderer(state["format"], key, resume_at=(state["offset"], state["count"]))
+            else:
+                handle = key.open("a", encoding="utf-8")
+            self._open[key] = (state["format"], handle)
+
+    def sync(self) -> Dict[str, Dict[str, Any]]:
+        """Forces every open output to disk and returns its size (and JSON element count)."""
+        saved: Dict[str, Dict[str, Any]] = {}
+        for key, (fmt, handle) in self._open.items():
+            if fmt not in ("dex", "jsonl"):
+                offset, count = handle.sync()
+                saved[str(key)] = {"format": fmt, "offset": offset, "count": count}
+            else:
+                saved[str(key)] = {"format": fmt, "offset": _sync(handle)}
+        return saved
+
+    def close(self) -> None:
+        for _, handle in self._open.values():
+            handle.close()
+        for renderer in self._stdout.values():
+            renderer.close()
+        self._open.clear()
+        self._stdout.clear()
+
+
+class _Progress:
+    # Throttled progress line on stderr; rewritten in place on a terminal.
+
+    def __init__(self, stream: Optional[IO[str]], total: int, interval: float = 1.0):
+        self.stream = stream
+        self.total = total
+        self.interval = interval
+        self.done = 0
+        self.started = time.perf_counter()
+        self._last = self.started
+        self._tty = bool(stream is not None and getattr(stream, "isatty", lambda: False)())
+
+    def rate(self) -> float:
+        elapsed = time.perf_counter() - self.started
+        return self.done / elapsed if elapsed > 0 else 0.0
+
+    def tick(self, label: str) -> None:
+        self.done += 1
+        now = time.perf_counter()
+        if self.stream is None or now - self._last < self.interval:
+            return
+        self._last = now
+        line = f"[batch] {label}: {self.done:,}/{self.total:,} monsters ({self.rate():,.0f}/s)"
+        self.stream.write(("\r" + line) if self._tty else line + "\n")
+        self.stream.flush()
+
+    def log(self, message: str) -> None:
+        if self.stream is None:
+            return
+        self.stream.write(("\r\033[K" if self._tty else "") + message + "\n")
+        self.stream.flush()
+
+
+class _Manifest:
+    # The checkpoint file of a run: the jobs (seeds and output paths resolved),
+    # the position reached, per-job results so far and the output sizes at that
+    # point. Rewritten atomically, so a crash leaves the previous checkpoint.
+
+    def __init__(self, path: Path, state: Dict[str, Any]):
+        self.path = path
+        self.state = state
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "_Manifest":
+        from .monster_cache import data_hash
+        from .pipeline import GENERATOR_VERSION
+
+        path = Path(path)
+        try:
+            state = json.loads(path.read_text(encoding="utf-8"))
+        except json.JSONDecodeError as e:
+            raise ValueError(f"{path} is not a checkpoint manifest: {e}") from None
+        if not isinstance(state, dict) or state.get("version") != MANIFEST_VERSION:
+            raise ValueError(f"{path} is not a version {MANIFEST_VERSION} checkpoint manifest")
+        if state["generator"] != GENERATOR_VERSION or state["data"] != data_hash():
+            raise ValueError(
+                f"The data or generator changed since {path} was written; resuming would "
+                "append different monsters. Restore them or start the run again."
+            )
+        return cls(path, state)
+
+    def save(self, outputs: _Outputs, cache: Optional[Path], index: Any = None) -> None:
+        self.state["outputs"] = outputs.sync()
+        if index is not None and index.path is not None:
+            self.state["dedup_index"] = {"path": str(index.path), "offset": index.sync()}
+        if cache is not None:
+            size = 0
+            if cache.exists():
+                with cache.open("rb") as f:
+                    os.fsync(f.fileno())
+                size = cache.stat().st_size
+            self.state["cache"] = {"path": str(cache), "offset": size}
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump(self.state, f, indent=2)
+            f.write("\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+
+
+# Position of a run: the job reached, monsters done in it, and its counters so far.
+_START = {"job": 0, "done": 0, "written": 0, "skipped": 0, "checked": 0, "duplicates": 0, "rerolled": 0}
+
+
+def run_batch(
+    jobs: Iterable[Job],
+    workers: int = 1,
+    run_seed: Optional[int] = None,
+    default_output: Optional[str] = None,
+    progress: Optional[IO[str]] = sys.stderr,
+    checkpoint: Union[str, Path, None] = None,
+    checkpoint_every: int = CHECKPOINT_EVERY,
+    dedup_index: Union[str, Path, None] = None,
+    default_formats: Iterable[str] = ("dex",),
+    render_cache: Union[str, Path, None] = None,
+) -> Dict[str, Any]:
+    """
+    Summary:
+        Runs the jobs in order through one shared worker pool, streaming each
+        monster to its job's outputs as soon as it is ready.
+
+    Args:
+        jobs: The jobs to run (see load_jobs()).
+        workers: Worker processes shared by all jobs; 1 runs everything in this process.
+        run_seed: Batch seed that jobs without their own seed derive theirs from
+            (default: random).
+        default_output: Output for jobs without `outputs` (default: stdout).
+        progress: Stream for progress and throughput messages, or None for quiet.
+        checkpoint: Manifest file to record checkpoints in, for resume_batch().
+            Every output must then be a file, not stdout.
+        checkpoint_every: Monsters between checkpoints.
+        dedup_index: File of content hashes that dedup jobs check against and add
+            to, so duplicates are caught across runs (default: in memory only; a
+            checkpointed run keeps it next to the manifest).
+        default_formats: Formats written for jobs without `outputs`, side by
+            side from default_output (see default_outputs()).
+        render_cache: RenderCache file that dex text is taken from and added to,
+            so monsters rendered by earlier builds are not formatted again.
+
+    Returns:
+        A dict with per-job results ("jobs": id, seed, written, skipped,
+        duplicates, rerolled, seconds) and the batch totals ("written",
+        "skipped", "duplicates", "seconds").
+
+    Raises:
+        ValueError: If checkpointing and an output is stdout, or the default
+            formats cannot be written to default_output.
+    """
+    import random
+
+    from .monster_cache import data_hash
+    from .pipeline import GENERATOR_VERSION
+
+    if run_seed is None:
+        run_seed = random.getrandbits(63)
+    resolved = []
+    defaults = default_outputs(default_formats, default_output)
+    for number, job in enumerate(jobs):
+        targets = dict(job.outputs) or defaults
+        if checkpoint is not None:
+            if "-" in targets.values():
+                raise ValueError(f"{job.id}: a checkpointed run cannot write to stdout; give output files")
+            targets = {fmt: str(Path(path).resolve()) for fmt, path in targets.items()}
+        seed = job.seed if job.seed is not None else spawn_rng(run_seed, number).getrandbits(63)
+        resolved.append(replace(job, seed=seed, outputs=targets))
+    if checkpoint is not None and dedup_index is None and any(job.dedup or job.reroll_duplicates for job in resolved):
+        # The resumed part of the run must see the hashes kept before the checkpoint.
+        dedup_index = Path(str(checkpoint) + ".dedup")
+
+    state = {
+        "version": MANIFEST_VERSION,
+        "generator": GENERATOR_VERSION,
+        "data": data_hash(),
+        "checkpoint_every": checkpoint_every,
+        "jobs": [asdict(job) for job in resolved],
+        "position": dict(_START),
+        "results": [],
+        "outputs": {},
+        "cache": None,
+        "dedup_index": {"path": str(Path(dedup_index).resolve()), "offset": None} if dedup_index else None,
+        "render_cache": str(Path(render_cache).resolve()) if render_cache else None,
+        "complete": False,
+    }
+    manifest = _Manifest(Path(checkpoint), state) if checkpoint is not None else None
+    return _execute(resolved, state, workers, progress, manifest)
+
+
+def resume_batch(
+    checkpoint: Union[str, Path], workers: int = 1, progress: Optional[IO[str]] = sys.stderr
+) -> Dict[str, Any]:
+    """
+    Summary:
+        Continues a checkpointed run from its last checkpoint. Outputs are cut
+        back to their size at that checkpoint first, so monsters written after
+        it are not duplicated; the finished files match an uninterrupted run.
+
+    Args:
+        checkpoint: The manifest written by run_batch(checkpoint=...).
+        workers: Worker processes; need not match the original run.
+        progress: Stream for progress and throughput messages, or None for quiet.
+
+    Returns:
+        The same summary as run_batch(), covering the whole run.
+
+    Raises:
+        ValueError: If the manifest is unreadable, the data or generator changed
+            since it was written, or an output is shorter than at the checkpoint.
+    """
+    manifest = _Manifest.load(checkpoint)
+    jobs = [Job(**record) for record in manifest.state["jobs"]]
+    return _execute(jobs, manifest.state, workers, progress, manifest)
+
+
+def _execute(
+    jobs: List[Job],
+    state: Dict[str, Any],
+    workers: int,
+    progress: Optional[IO[str]],
+    manifest: Optional[_Manifest],
+) -> Dict[str, Any]:
+    from . import monster_cache
+    from .pipeline import ContentIndex, Dedup, Spec, dex_text, make_pool, mutate, name, sink, source
+    from .render_cache import RenderCache
+
+    position = state["position"]
+    results: List[Dict[str, Any]] = state["results"]
+    every = max(int(state["checkpoint_every"]), 1)
+    first = position["job"]
+    remaining = sum(job.count for job in jobs[first:]) - position["done"]
+    meter = _Progress(progress, remaining)
+    outputs = _Outputs()
+    cache = None
+    index = None
+    if state["dedup_index"] is not None and not state["complete"]:
+        saved = state["dedup_index"]
+        index = ContentIndex(saved["path"], truncate_at=saved["offset"] if manifest is not None else None)
+    elif any(job.dedup or job.reroll_duplicates for job in jobs):
+        index = ContentIndex()
+    if manifest is not None and not state["complete"]:
+        outputs.restore(state["outputs"])
+        if state["cache"] is not None:
+            # The cache is shared: drop only this run's records saved after the
+            # checkpoint, never what other commands appended since.
+            monster_cache.discard_run_records(
+                state["cache"]["offset"], {job.seed for job in jobs}, Path(state["cache"]["path"])
+            )
+        if any(job.cache for job in jobs):
+            cache = monster_cache.CACHE_FILE.resolve()
+        # Open every output now, so the first checkpoint records its starting size.
+        for job in jobs[first:]:
+            for fmt, path in job.outputs.items():
+                outputs.get(fmt, path)
+        manifest.save(outputs, cache, index)
+
+    # Only a memo: its contents never change the outputs, so it is not checkpointed.
+    renders = RenderCache(state["render_cache"]) if state.get("render_cache") else None
+    pool = make_pool(workers) if workers > 1 and first < len(jobs) else None
+    try:
+        for number in range(first, len(jobs)):
+            job = jobs[number]
+            done = position["done"] if number == first else 0
+            targets = job.outputs
+            out = sink(
+                txt=outputs.get("dex", targets["dex"]) if "dex" in targets else None,
+                jsonl=outputs.get("jsonl", targets["jsonl"]) if "jsonl" in targets else None,
+                json=outputs.get("json", targets["json"]) if "json" in targets else None,
+                cache=job.cache,
+                render={fmt: outputs.get(fmt, path) for fmt, path in targets.items() if fmt not in SINK_FORMATS},
+            )
+            skipped = 0
+            deduper = Dedup(index, job.reroll_duplicates) if job.dedup or job.reroll_duplicates else None
+            if done:
+                # A resumed job: entries continue the separators of the ones already written.
+                out.written, skipped = position["written"], position["skipped"]
+                if deduper is not None:
+                    deduper.checked, deduper.duplicates = position["checked"], position["duplicates"]
+                    deduper.rerolled = position["rerolled"]
+
+            run = source(
+                Spec(job.primary_type, job.secondary_type, job.secondary_chance),
+                job.count - done,
+                job.seed,
+                start=job.start - 1 + done,
+            ) | mutate(job.majors, job.utils)
+            if job.name:
+                run = run | name()
+            if deduper is not None:
+                run = run | deduper
+            if "dex" in targets:
+                run = run | dex_text(renders)
+            run = run | out
+
+            started = time.perf_counter()
+            for item in run.iterate(workers=workers, pool=pool):
+                done += 1
+                if item.skipped and not item.duplicate:
+                    skipped += 1
+                    meter.log(f"[batch] {job.id}: {item.skipped}")
+                meter.tick(job.id)
+                if manifest is not None and done % every == 0 and done < job.count:
+                    position.update(job=number, done=done, written=out.written, skipped=skipped)
+                    if deduper is not None:
+                        position.update(
+                            checked=deduper.checked, duplicates=deduper.duplicates, rerolled=deduper.rerolled
+                        )
+                    manifest.save(outputs, cache, index)
+            seconds = time.perf_counter() - started
+            results.append(
+                {
+                    "id": job.id,
+                    "seed": job.seed,
+                    "written": out.written,
+                    "skipped": skipped,
+                    "duplicates": deduper.duplicates if deduper is not None else 0,
+                    "rerolled": deduper.rerolled if deduper is not None else 0,
+                    "seconds": seconds,
+                }
+            )
+            position.clear()
+            position.update(_START, job=number + 1)
+            if manifest is not None:
+                manifest.save(outputs, cache, index)
+            meter.log(
+                f"[batch] {job.id}: {out.written:,} written"
+                + (f", {skipped:,} skipped" if skipped else "")
+                + f" in {seconds:.2f}s (job {number + 1}/{len(jobs)})"
+                + (f"; {deduper.report()}" if deduper is not None else "")
+            )
+    finally:
+        outputs.close()
+        if renders is not None:
+            renders.close()
+        if pool is not None:
+            pool.shutdown()
+    if manifest is not None and not state["complete"]:
+        state["complete"] = True
+        manifest.save(outputs, cache, index)
+    if index is not None:
+        index.close()
+
+    seconds = time.perf_counter() - meter.started
+    written = sum(r["written"] for r in results)
+    duplicates = sum(r.get("duplicates", 0) for r in results)
+    meter.log(
+        f"[batch] done: {written:,} monsters from {len(results)} job(s) in {seconds:.2f}s ({meter.rate():,.0f}/s)"
+        + (f", {duplicates:,} duplicate(s) found" if duplicates else "")
+        + (f"; {renders.report()}" if renders is not None else "")
+    )
+    return {
+        "jobs": results,
+        "written": written,
+        "skipped": sum(r["skipped"] for r in results),
+        "duplicates": duplicates,
+        "seconds": seconds,
+    }
@@ -1,37 +1,151 @@
+from __future__ import annotations
+
 import argparse
+import io
 from dataclasses import asdict
-import json, sys
+import sys
 from pprint import pprint
-from random import choice, random
+import random
+from random import choice
 from pathlib import Path
+from typing import TYPE_CHECKING, Iterable
+
+# Only the type-name manifest is needed to build the parser. Each command imports
+# the modules it uses (data tables, forge, formatter, ...) inside its handler, so
+# `mongen --help` does not load the data tables or the name forge.
+from .data import seed_type_names
+
+if TYPE_CHECKING:
+    from .monsterseed import MonsterSeed
+
+# Mirrors monster_cache.OUTPUT_PATH without importing it.
+DEFAULT_DEX_OUTPUT = Path(__file__).parent / "assets" / "generated_monsters.txt"
+
+
+def _strip_client_options(argv: list[str]) -> list[str]:
+    """
+    Summary:
+        Drops the top-level --remote/--socket options, leaving the subcommand and
+        its arguments to forward to the daemon.
+    """
+    forwarded = []
+    rest = iter(argv)
+    for arg in rest:
+        if arg == "--remote" or arg.startswith("--socket="):
+            continue
+        if arg == "--socket":
+            next(rest, None)
+            continue
+        forwarded.append(arg)
+        if not arg.startswith("-"):
+            forwarded.extend(rest)  # the subcommand; everything after belongs to it
+    return forwarded
 
-# The CLI should only need to import the high-level functions.
-from .data.data import *
-from .dex_entries import dex_formatter
-from .forge_name import *
-from .mon_forge import apply_mutagens
-from .monster_cache import CACHE_FILE, OUTPUT_PATH, load_monster, save_monster
-from .prompt_engine import construct_mon_prompt
-from .monsterseed import MonsterSeed, choose_type_pair, weighted_choice
+
+def _count(value: str) -> int:
+    """
+    Summary:
+        argparse type for counts (monsters, mutagens): any non-negative integer.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid count: {value!r}") from None
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"count must be 0 or more, got {number}")
+    return number
 
 
-def main():
+def _report_outputs(outputs: dict, written: int) -> None:
+    """
+    Summary:
+        Prints where a dexentry run wrote its entries (files only; the seed JSON
+        is reported with the cache).
+    """
+    for fmt, path in outputs.items():
+        if path == "-" or fmt == "json":
+            continue
+        if fmt == "dex":
+            print(f"Successfully appended {written} entries to {path}")
+        else:
+            print(f"Wrote {written} {fmt} entries to {path}")
+
+
+def _read_pins(source: str) -> list:
+    """
+    Summary:
+        Reads a PIN list for --pins-file: one PIN per line ('-' reads stdin);
+        blank lines and '#' comments are ignored. Exits if the file is unreadable.
+    """
+    if source == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        try:
+            lines = Path(source).read_text(encoding="utf-8").splitlines()
+        except OSError as e:
+            print(f"Error: Could not read {source}: {e}", file=sys.stderr)
+            sys.exit(1)
+    return [line.strip() for line in lines if line.strip() and not line.lstrip().startswith("#")]
+
+
+def _formats(value: str) -> list:
+    """
+    Summary:
+        argparse type for --format: one or more comma-separated output formats.
+    """
+    from .batch import FORMATS
+
+    formats = [fmt.strip() for fmt in value.split(",") if fmt.strip()]
+    unknown = [fmt for fmt in formats if fmt not in FORMATS]
+    if not formats or unknown:
+        raise argparse.ArgumentTypeError(
+            f"invalid format {', '.join(unknown) or value!r}; use one or more of {', '.join(FORMATS)}"
+        )
+    return formats
+
+
+def _seed_json_path(output_path: str) -> Path:
+    """
+    Summary:
+        Path of the '<output>.seed.json' file written alongside an output file.
+    """
+    out = Path(output_path)
+    return out.with_suffix(out.suffix + '.seed.json')
+
+
+def main(argv: list[str] | None = None):
     '''
     Summary:
         The main entry point for the monster generator command-line interface.
         This function parses command-line arguments and calls the appropriate
         functions to generate monsters, dex entries, and other related data.
 
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:]).
+
     Returns:
         None.
     '''
+    argv = sys.argv[1:] if argv is None else list(argv)
     parser = argparse.ArgumentParser(
         description="A command-line tool for generating fantasy monsters.",
         epilog="Use 'mongen <command> --help' for more information on a specific command.",
     )
+    parser.add_argument(
+        "--remote",
+        action="store_true",
+        help="Run the command in a 'mongen serve' daemon; runs in-process if none is listening.",
+    )
+    parser.add_argument(
+        "--socket",
+        type=str,
+        default=None,
+        help="Daemon socket for 'serve' and --remote (default: $MONGENS_SOCKET or a per-user socket).",
+    )
     subparsers = parser.add_subparsers(
         dest="command", required=True, help="Available commands"
     )
+    type_names = seed_type_names()
 
     # 'dexentry' command - Generates CANONICAL/TEMPLATE entries
     parser_dex = subparsers.add_parser(
@@ -42,7 +156,7 @@ def main():
         "--primary_type",
         type=str,
         default="random",
-        choices=SEED_TYPES + ["random"],
+        choices=[*type_names, "random"],
         help="Primary type of the monster.",
     )
     parser_dex.add_argument(
@@ -50,41 +164,104 @@ def main():
         "--secondary_type",
         type=str,
         default="random",
-        choices=SEED_TYPES + ["random", "none"],
+        choices=[*type_names, "random", "none"],
         help="Optional secondary type.",
     )
     parser_dex.add_argument(
         "-maj",
         "--majors",
-        type=int, # Corrected from str to int
+        type=_count,
         default=1,
-        choices=range(3),
         help="Number of major mutagens."
     )
     parser_dex.add_argument(
         "-ut",
         "--utils", # Corrected from str to int
-        type=int,
+        type=_count,
         default=1,
-        choices=range(2),
         help="Number of utility mutagens.",
     )
     parser_dex.add_argument(
-        "-c", "--count", type=int, default=1, help="Number of monsters to generate."
+        "-c", "--count", type=_count, default=1, help="Number of monsters to generate."
     )
     parser_dex.add_argument(
         "-o",
         "--output",
         type=str,
-        default=str(OUTPUT_PATH),
+        default=str(DEFAULT_DEX_OUTPUT),
         help="Optional file path to save the generated dex entries.",
     )
+    parser_dex.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes to forge entries in; output is identical for any count.",
+    )
+    parser_dex.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Run seed; the same seed reproduces the same entries (default: random, printed).",
+    )
+    parser_dex.add_argument(
+        "--start",
+        type=int,
+        default=1,
+        help="Dex number of the first entry; with --seed, '--start 48213 -c 1' reprints entry 48213 of that run.",
+    )
+    parser_dex.add_argument(
+        "--format",
+        type=_formats,
+        default=["dex"],
+        metavar="FMT[,FMT...]",
+        help="Output formats, all written in one pass: dex, markdown, csv, html, ndjson, jsonl, json. "
+        "Formats other than dex go next to --output with their own extension (default: dex).",
+    )
+    parser_dex.add_argument(
+        "--render-cache",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help="Reuse dex text rendered by earlier runs from PATH (and add new entries to it).",
+    )
     parser_dex.add_argument(
         "--json",
         action="store_true",
         # default=True, # Let default be False, more intuitive for a flag
         help="Also save the raw seed JSON to '<output>.seed.json'.",
     )
+    parser_dex.add_argument(
+        "--compact",
+        action="store_true",
+        help="With --json, cache each seed as a compact record that is rebuilt on load.",
+    )
+    parser_dex.add_argument(
+        "--checkpoint",
+        type=str,
+        default=None,
+        metavar="MANIFEST",
+        help="Record periodic checkpoints in MANIFEST; continue an interrupted run with 'mongen resume MANIFEST'.",
+    )
+    parser_dex.add_argument(
+        "--dedup",
+        action="store_true",
+        help="Drop entries identical (all but number and name) to one already generated.",
+    )
+    parser_dex.add_argument(
+        "--reroll-duplicates",
+        type=_count,
+        default=0,
+        metavar="N",
+        help="Re-roll a duplicate up to N times before dropping it (implies --dedup).",
+    )
+    parser_dex.add_argument(
+        "--dedup-index",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help="File of content hashes kept across runs, so --dedup also catches earlier runs' entries.",
+    )
 
 
     # 'unique' command - Generates WILD/RANDOMIZED instances
@@ -97,7 +274,7 @@ def main():
         "--primary_type",
         type=str,
         default="random",
-        choices=SEED_TYPES + ["random"],
+        choices=[*type_names, "random"],
         help="Primary type of the monster.",
     )
     parser_unique.add_argument(
@@ -105,21 +282,19 @@ def main():
         "--secondary_type",
         type=str,
         default="random",
-        choices=SEED_TYPES + ["random", "none"],
+        choices=[*type_names, "random", "none"],
         help="Optional secondary type. Set to 'random' for a 60%% chance of a secondary type.",
     )
     parser_unique.add_argument(
         "--majors",
-        type=int,
+        type=_count,
         default=1,
-        choices=range(3),
         help="Number of major mutagens.",
     )
     parser_unique.add_argument(
         "--utils",
-        type=int,
+        type=_count,
         default=1,
-        choices=range(2),
         help="Number of utility mutagens.",
     )
 
@@ -128,6 +303,14 @@ def main():
         action="store_true",
         help="Save the raw seed JSON to the cache file.",
     )
+    parser_unique.add_argument(
+        "--format",
+        type=_formats,
+        default=None,
+        metavar="FMT[,FMT...]",
+        help="Print the monster in these formats (dex, markdown, csv, html, ndjson, jsonl, json), "
+        "one after another, instead of as a dict.",
+    )
 
     # 'alternatives' command - Generates a list of names for a monster
     parser_alt = subparsers.add_parser(
@@ -144,7 +327,7 @@ def main():
         "--primary_type",
         type=str,
         default="random",
-        choices=SEED_TYPES + ["random"],
+        choices=[*type_names, "random"],
         help="Primary type of the monster (used if --pin is not provided).",
     )
     parser_alt.add_argument(
@@ -152,21 +335,19 @@ def main():
         "--secondary_type",
         type=str,
         default="random",
-        choices=SEED_TYPES + ["random", "none"],
+        choices=[*type_names, "random", "none"],
         help="Optional secondary type (used if --pin is not provided).",
     )
     parser_alt.add_argument(
         "--majors",
-        type=int,
+        type=_count,
         default=1,
-        choices=range(3),
         help="Number of major mutagens (used if --pin is not provided).",
     )
     parser_alt.add_argument(
         "--utils",
-        type=int,
+        type=_count,
         default=1,
-        choices=range(2),
         help="Number of utility mutagens (used if --pin is not provided).",
     )
     parser_alt.add_argument(
@@ -199,7 +380,7 @@ def main():
         "--primary_type",
         type=str,
         default="random",
-        choices=SEED_TYPES + ["random"],
+        choices=[*type_names, "random"],
         help="Primary type for the monster (used if --pin is not provided).",
     )
     parser_prompt.add_argument(
@@ -207,23 +388,21 @@ def main():
         "--secondary_type",
         type=str,
         default="random",
-        choices=SEED_TYPES + ["random", "none"],
+        choices=[*type_names, "random", "none"],
         help="Optional secondary type (used if --pin is not provided).",
     )
     parser_prompt.add_argument(
         "-maj",
         "--majors",
-        type=int,
+        type=_count,
         default=1,
-        choices=range(3),
         help="Number of major mutagens (used if --pin is not provided).",
     )
     parser_prompt.add_argument(
         "-ut",
         "--utils",
-        type=int,
+        type=_count,
         default=1,
-        choices=range(2),
         help="Number of utility mutagens (used if --pin is not provided).",
     )
     parser_prompt.add_argument(
@@ -239,6 +418,26 @@ def main():
         # default=True, # Let default be False
         help="Also save the raw seed JSON to '<output>.seed.json'.",
     )
+    parser_prompt.add_argument(
+        "--pins-file",
+        type=str,
+        default=None,
+        help="Queue prompts for every PIN in this file (one per line, '-' for stdin) "
+        "as JSON Lines to --queue, writing identical prompts once.",
+    )
+    parser_prompt.add_argument(
+        "--queue",
+        type=str,
+        default=str(Path(__file__).parent / "assets" / "art_prompts.jsonl"),
+        help="JSON Lines file that --pins-file prompts are appended to.",
+    )
+    parser_prompt.add_argument(
+        "--render-cache",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help="Reuse the prompt rendered by an earlier run from PATH (and add it if new).",
+    )
 
     # ===================================================================
     # 'list' command
@@ -289,13 +488,183 @@ def main():
         "reroll", help="Re-roll attributes of a cached monster."
     )
     parser_reroll.add_argument(
-        "pin", type=str, help="The 10-character ID of the monster to re-roll."
+        "pin", type=str, nargs="?", help="The 10-character ID of the monster to re-roll."
+    )
+    parser_reroll.add_argument(
+        "--pins-file",
+        type=str,
+        default=None,
+        metavar="FILE",
+        help="Re-roll every PIN in FILE (one per line, '-' for stdin) in one pass.",
+    )
+    parser_reroll.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for --pins-file; output is identical for any count.",
+    )
+    parser_reroll.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Run seed for --pins-file; the same seed re-rolls each PIN the same way (default: random, printed).",
     )
     parser_reroll.add_argument(
         "--traits", action="store_true", help="Re-roll the physical traits."
     )
     parser_reroll.add_argument(
-        "--majors", action="store_true", help="Re-roll the major mutagen."
+        "--majors", action="store_true", help="Re-roll the major mutagens (recomputes stats, meta and name)."
+    )
+    parser_reroll.add_argument(
+        "--utilities", action="store_true", help="Re-roll the utility mutagens (recomputes stats and meta)."
+    )
+    parser_reroll.add_argument(
+        "--held-item", action="store_true", help="Re-roll the held item."
+    )
+    parser_reroll.add_argument(
+        "--tempers", action="store_true", help="Re-roll the mood and affinity."
+    )
+    parser_reroll.add_argument(
+        "--habitat", action="store_true", help="Re-roll the habitat."
+    )
+
+    # ===================================================================
+    # 'lineage' command - Shows a monster's reroll family
+    # ===================================================================
+    parser_lineage = subparsers.add_parser(
+        "lineage",
+        help="Show the reroll family tree of a cached monster.",
+        description="Prints every reroll descended from the monster's root, one per line, "
+        "indented by generation. The newest variant is marked.",
+    )
+    parser_lineage.add_argument(
+        "pin", type=str, nargs="?", help="The 10-character ID of any monster in the family."
+    )
+    parser_lineage.add_argument(
+        "--prune",
+        action="store_true",
+        help="Remove every reroll family member except its newest variant from the cache.",
+    )
+
+    # ===================================================================
+    # 'batch' command - Runs many generation jobs in one process
+    # ===================================================================
+    parser_batch = subparsers.add_parser(
+        "batch",
+        help="Run every generation job in a JSON Lines spec file in one process.",
+        description="Each line of the spec file is a job: type constraints, major/utility "
+        "counts, count, seed and outputs (format -> path). All jobs share the loaded "
+        "data and one worker pool; results stream to their outputs as they are made. "
+        "Progress and throughput are reported on stderr. See mongens/batch.py for the fields.",
+    )
+    parser_batch.add_argument(
+        "specs", type=str, help="Spec file, one JSON job per line ('-' for stdin)."
+    )
+    parser_batch.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes shared by all jobs; output is identical for any count.",
+    )
+    parser_batch.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Batch seed for jobs that don't set their own (default: random, printed).",
+    )
+    parser_batch.add_argument(
+        "-o",
+        "--output",
+        type=str,
+        default=None,
+        help="Output for jobs without 'outputs' (default: stdout).",
+    )
+    parser_batch.add_argument(
+        "--format",
+        type=_formats,
+        default=["dex"],
+        metavar="FMT[,FMT...]",
+        help="Formats for jobs without 'outputs', written next to --output with their own extension (default: dex).",
+    )
+    parser_batch.add_argument(
+        "--checkpoint",
+        type=str,
+        default=None,
+        metavar="MANIFEST",
+        help="Record periodic checkpoints in MANIFEST; continue an interrupted run with 'mongen resume MANIFEST'.",
+    )
+    parser_batch.add_argument(
+        "--render-cache",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help="Reuse dex text rendered by earlier builds from PATH, so only changed monsters are formatted.",
+    )
+    parser_batch.add_argument(
+        "--checkpoint-every",
+        type=int,
+        default=1000,
+        help="Monsters between checkpoints (default: 1000).",
+    )
+    parser_batch.add_argument(
+        "--dedup-index",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help="File of content hashes that 'dedup' jobs check and extend across runs.",
+    )
+    parser_batch.add_argument(
+        "-q", "--quiet", action="store_true", help="Don't report progress on stderr."
+    )
+
+    # 'resume' command - Continues a checkpointed dexentry or batch run
+    parser_resume = subparsers.add_parser(
+        "resume",
+        help="Continue an interrupted dexentry/batch run from its checkpoint manifest.",
+        description="Cuts every output back to the last checkpoint and generates the rest; "
+        "the finished files are the same as if the run had never stopped.",
+    )
+    parser_resume.add_argument("manifest", type=str, help="Manifest given to --checkpoint.")
+    parser_resume.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes; output is identical for any count.",
+    )
+    parser_resume.add_argument(
+        "-q", "--quiet", action="store_true", help="Don't report progress on stderr."
+    )
+
+    # ===================================================================
+    # 'compile-data' command - Precompiles the YAML data into one bundle
+    # ===================================================================
+    parser_compile = subparsers.add_parser(
+        "compile-data",
+        help="Compile the YAML data files into a binary bundle loaded at startup.",
+        description="Builds every data table and derived sampling structure once and writes "
+        "them to a versioned bundle. Later runs load the bundle instead of parsing YAML "
+        "as long as its source hash matches the data files.",
+    )
+    parser_compile.add_argument(
+        "-o",
+        "--output",
+        type=str,
+        default=None,
+        help="Bundle path (default: data.bundle next to the data files, or $MONGENS_DATA_BUNDLE).",
+    )
+
+    # ===================================================================
+    # 'serve' command - Keeps the data loaded and answers --remote calls
+    # ===================================================================
+    subparsers.add_parser(
+        "serve",
+        help="Run a daemon that keeps data and caches loaded for 'mongen --remote'.",
+        description="Listens on a Unix domain socket and runs the commands that "
+        "'mongen --remote <command> ...' forwards to it, without re-importing or "
+        "re-loading the data for each call. Stop it with Ctrl+C or SIGTERM.",
     )
 
     # ===================================================================
@@ -313,6 +682,9 @@ def main():
         Returns:
             A dictionary containing the generated Kin properties (passive, drive, wound, spark).
         '''
+        from .data import data
+        from .monsterseed import weighted_choice
+
         # This is a placeholder for more complex logic.
         # In the future, this could be its own module.
         kin_passives = ["Lumen Resonance: +5% healing received", "Kinetic Shield: +5% DEF when below 50% HP"]
@@ -331,62 +703,55 @@ def main():
         return {
             "kin_passive": choice(kin_passives),
             "kin_drive": drive_choice,
-            "kin_wound": weighted_choice(KIN_WOUNDS),
+            "kin_wound": weighted_choice(data.KIN_WOUNDS),
             "kin_spark": choice(kin_sparks)
         }
 
     # --- Execution Logic ---
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
-    # --- Helper functions ---
-    def _get_monster_types_from_args(primary_arg: str, secondary_arg: str) -> tuple[str, str | None]:
-        '''
-        Summary:
-            Determines the primary and secondary monster types based on command-line arguments.
-            It handles cases where types are specified directly or chosen randomly.
+    if args.command == "serve":
+        from .server import serve
 
-        Args:
-            primary_arg: The value of the primary_type argument.
-            secondary_arg: The value of the secondary_type argument.
+        try:
+            serve(args.socket)
+        except (OSError, RuntimeError) as e:
+            print(f"Error starting daemon: {e}", file=sys.stderr)
+            sys.exit(1)
+        return
 
-        Returns:
-            A tuple containing the determined primary type (str) and an optional secondary type (str | None).
-        '''
-        # If both are random, use the new weighted function.
-        if primary_arg == "random" and secondary_arg == "random":
-            return choose_type_pair()
-
-        # Handle cases where one or both are specified.
-        p_type = weighted_choice(SEED_TYPES_WEIGHTED) if primary_arg == "random" else primary_arg
-
-        s_type = None
-        if secondary_arg == "random":
-            # Use the new function but force the primary type.
-            _, s_type = choose_type_pair(primary_type_override=p_type)
-        elif secondary_arg != "none":
-            s_type = secondary_arg
-        return p_type, s_type
-
-    def _forge_seed_no_cache(idnum: int, primary_type: str, secondary_type: str | None, major_count: int, util_count: int) -> MonsterSeed:
-        """
-        Summary:
-            Creates a fully forged MonsterSeed without writing to the cache.
-        """
-        seed = MonsterSeed.forge(idnum, primary_type, secondary_type)
-        seed = apply_mutagens(seed, major_count=major_count, util_count=util_count)
-        seed.name = forge_monster_name(seed)
-        return seed
+    if args.remote:
+        from .server import reads_stdin, request
+
+        forwarded = _strip_client_options(argv)
+        stdin = sys.stdin.read() if reads_stdin(forwarded) else None
+        try:
+            response = request(forwarded, args.socket, stdin=stdin)
+        except PermissionError as e:
+            print(f"Warning: {e}; running in-process", file=sys.stderr)
+            response = None
+        if stdin is not None:
+            sys.stdin = io.StringIO(stdin)  # already read; replay it for an in-process run
+        if response is not None:
+            sys.stdout.write(response["stdout"])
+            sys.stderr.write(response["stderr"])
+            if response["exit"]:
+                sys.exit(response["exit"])
+            return
+        # No daemon listening: run the command here instead.
 
-    def _write_seed_json(output_path: str, seeds: list[MonsterSeed]) -> None:
+    # --- Helper functions ---
+    def _write_seed_json(output_path: str, seeds: Iterable[MonsterSeed]) -> None:
         """
         Summary:
-            Writes seed JSON alongside an output file path as '<output>.seed.json'.
+            Writes seed JSON alongside an output file path as '<output>.seed.json',
+            one seed at a time.
         """
-        out = Path(output_path)
-        json_path = out.with_suffix(out.suffix + '.seed.json')
-        payload = [asdict(s) for s in seeds]
-        with json_path.open('w', encoding='utf-8') as f:
-            json.dump(payload, f, ensure_ascii=False, indent=2)
+        from .writers import JsonArrayWriter
+
+        with JsonArrayWriter(_seed_json_path(output_path), indent=2, ensure_ascii=False) as out:
+            for s in seeds:
+                out.write(asdict(s))
 
     def _get_or_generate_seed(args: argparse.Namespace, idnum: int = 1) -> MonsterSeed | None:
         '''
@@ -401,19 +766,20 @@ def main():
         Returns:
             A MonsterSeed object if successfully loaded or generated, otherwise None.
         '''
+        from .monster_cache import load_monster
+        from .pipeline import Spec, forge_monster
+
         try:
             if hasattr(args, "pin") and args.pin:
                 print(f"Loading pinned monster '{args.pin}'...")
                 return load_monster(args.pin)
             
             print("Generating a temporary monster...")
-            p_type, s_type = _get_monster_types_from_args(args.primary_type, args.secondary_type)
-            return _forge_seed_no_cache(
-                idnum=idnum,
-                primary_type=p_type,
-                secondary_type=s_type,
+            return forge_monster(
+                Spec(args.primary_type, args.secondary_type),
                 major_count=args.majors,
                 util_count=args.utils,
+                idnum=idnum,
             )
         except (ValueError, KeyError, FileNotFoundError) as e:
             print(f"Error: {e}", file=sys.stderr)
@@ -423,66 +789,143 @@ def main():
 
     # --- Command Logic ---
     if args.command == "dexentry":
-        print(f"Generating {args.count} canonical dex entries...")
-        output_lines = []
-        generated_seeds = []
-        for i in range(args.count):
-            p_type, s_type = _get_monster_types_from_args(args.primary_type, args.secondary_type)
+        from .monster_cache import CACHE_FILE
+        from .pipeline import Spec, dedup, dex_text, mutate, name, sink, source
+
+        from .batch import SINK_FORMATS, default_outputs
+
+        deduplicate = args.dedup or args.reroll_duplicates > 0 or args.dedup_index is not None
+        run_seed = args.seed if args.seed is not None else random.getrandbits(63)
+        try:
+            if args.start < 1:
+                raise ValueError(f"--start must be >= 1, got {args.start}")
+            base = source(Spec(args.primary_type, args.secondary_type), args.count, run_seed, start=args.start - 1)
+            # Every format is written from this one pass, next to --output.
+            outputs = default_outputs(args.format, args.output)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(2)
+        if args.json and args.output:
+            # Raw seed JSON goes to '<output>.seed.json' as a JSON array, element by element.
+            outputs.setdefault("json", str(_seed_json_path(args.output)))
+
+        def _target(fmt: str):
+            return sys.stdout if outputs[fmt] == "-" else outputs[fmt]
+
+        output = sink(
+            # append textual dex entries (preserve existing file but allow overwrite option later)
+            txt=_target("dex") if "dex" in outputs else None,
+            jsonl=_target("jsonl") if "jsonl" in outputs else None,
+            json=outputs.get("json"),
+            cache=("compact" if args.compact else True) if args.json else False,
+            render={fmt: _target(fmt) for fmt in outputs if fmt not in SINK_FORMATS},
+        )
+        print(f"Generating {args.count} canonical dex entries (run seed {run_seed})...")
+        if args.checkpoint:
+            from .batch import Job, run_batch
+
+            job = Job(
+                "dexentry",
+                args.primary_type,
+                args.secondary_type,
+                majors=args.majors,
+                utils=args.utils,
+                count=args.count,
+                start=args.start,
+                seed=run_seed,
+                dedup=deduplicate,
+                reroll_duplicates=args.reroll_duplicates,
+                cache=("compact" if args.compact else True) if args.json else False,
+                outputs=outputs,
+            )
             try:
-                monster_template = _forge_seed_no_cache(
-                    idnum=i + 1,
-                    primary_type=p_type,
-                    secondary_type=s_type,
-                    major_count=args.majors,
-                    util_count=args.utils,
+                result = run_batch(
+                    [job],
+                    workers=args.workers,
+                    checkpoint=args.checkpoint,
+                    dedup_index=args.dedup_index,
+                    progress=None,
+                    render_cache=args.render_cache,
                 )
-                entry_text = dex_formatter(monster_template)
-                output_lines.append(entry_text)
-                generated_seeds.append(monster_template)
-            except ValueError as e:
-                print(f"Skipping combination {p_type}/{s_type}: {e}")
-                continue
-
-        full_output = ("\n\n" + "-" * 60 + "\n\n").join(output_lines)
-        if args.output:
-            # append textual dex entries (preserve existing file but allow overwrite option later)
-            out_path = Path(args.output)
-            out_path.parent.mkdir(parents=True, exist_ok=True)
-            with out_path.open("a", encoding="utf-8") as f:
-                f.write(full_output + "\n")
-            print(f"Successfully appended {len(output_lines)} entries to {args.output}")
-        else:
-            print(full_output)
+            except (OSError, ValueError) as e:
+                print(f"Error: {e}", file=sys.stderr)
+                sys.exit(2)
+            if deduplicate:
+                print(f"Dropped {result['duplicates'] - result['jobs'][0]['rerolled']} duplicate(s), "
+                      f"re-rolled {result['jobs'][0]['rerolled']}")
+            _report_outputs(outputs, result["written"])
+            return
+        run = base | mutate(args.majors, args.utils) | name()
+        deduper = dedup(args.dedup_index, args.reroll_duplicates) if deduplicate else None
+        if deduper is not None:
+            # Before formatting, so repeats are never formatted or written.
+            run = run | deduper
+        renders = None
+        if "dex" in outputs:
+            if args.render_cache:
+                from .render_cache import RenderCache
 
-        # Save raw seed JSON: write the entire batch as a JSON array (append-safe)
+                renders = RenderCache(args.render_cache)
+            run = run | dex_text(renders)
+        run = run | output
+        # Entries come back in index order and are written as soon as they are made.
+        try:
+            for item in run.iterate(workers=args.workers):
+                if item.skipped and not item.duplicate:
+                    print(item.skipped)
+        finally:
+            if deduper is not None:
+                deduper.index.close()
+            if renders is not None:
+                renders.close()
+        if deduper is not None:
+            print(deduper.report())
+        if renders is not None:
+            print(renders.report())
+        _report_outputs(outputs, output.written)
         if args.json:
-            for seed in generated_seeds:
-                save_monster(seed)
-            if args.output:
-                _write_seed_json(args.output, generated_seeds)
-            print(f"Saved {len(generated_seeds)} seed object(s) to {CACHE_FILE}")
+            print(f"Saved {output.written} seed object(s) to {CACHE_FILE}")
 
     elif args.command == "unique":
-        print("Generating raw data for one unique monster instance...")
-        p_type, s_type = _get_monster_types_from_args(args.primary_type, args.secondary_type)
+        from .monster_cache import CACHE_FILE, save_monster
+        from .pipeline import Spec, forge_monster
+
+        # With --format, stdout carries only the rendered monster; the rest goes to stderr.
+        status = sys.stderr if args.format else sys.stdout
+        print("Generating raw data for one unique monster instance...", file=status)
         try:
-            wild_monster = _forge_seed_no_cache(
-                idnum=1,
-                primary_type=p_type,
-                secondary_type=s_type,
+            wild_monster = forge_monster(
+                Spec(args.primary_type, args.secondary_type),
                 major_count=args.majors,
                 util_count=args.utils,
             )
 
-            pprint(asdict(wild_monster))
-            print(f"\nMonster Pin ID: {wild_monster.meta.get('unique_id')}")
+            if args.format:
+                import json
+
+                from .renderers import open_renderer
+
+                # Each format in turn on stdout; json/jsonl as the sink would write them.
+                for fmt in args.format:
+                    if fmt == "json":
+                        print(json.dumps([asdict(wild_monster)], indent=2, ensure_ascii=False))
+                    elif fmt == "jsonl":
+                        print(json.dumps(asdict(wild_monster), ensure_ascii=False))
+                    else:
+                        with open_renderer(fmt, sys.stdout) as out:
+                            out.write(wild_monster)
+            else:
+                pprint(asdict(wild_monster))
+            print(f"\nMonster Pin ID: {wild_monster.meta.get('unique_id')}", file=status)
             if args.json:
                 save_monster(wild_monster)
-                print(f"Saved seed object to {CACHE_FILE}")
+                print(f"Saved seed object to {CACHE_FILE}", file=status)
         except ValueError as e:
             print(f"Error generating monster: {e}")
 
     elif args.command == "alternatives":
+        from .forge_name import generate_alternative_names
+
         base_seed = _get_or_generate_seed(args)
         if base_seed:
             print(f"Generating {args.count} alternative names for '{base_seed.name}'...")
@@ -498,9 +941,42 @@ def main():
                 print(f"- {name}")
 
     elif args.command == "artprompt":
+        from .monster_cache import CACHE_FILE, save_monster
+        from .prompt_engine import construct_mon_prompt, construct_mon_prompts
+
+        if args.pins_file is not None:
+            from .monster_cache import load_monsters
+
+            seeds, failed = load_monsters(_read_pins(args.pins_file))
+            for pin, reason in failed.items():
+                print(f"Skipped {pin}: {reason}", file=sys.stderr)
+            renders = None
+            if args.render_cache:
+                from .render_cache import RenderCache
+
+                renders = RenderCache(args.render_cache)
+            try:
+                counts = construct_mon_prompts(seeds.values(), args.queue, cache=renders)
+            finally:
+                if renders is not None:
+                    renders.close()
+            print(f"Queued {counts['written']} prompt(s) to {args.queue}: {counts['unique']} unique, "
+                  f"{counts['duplicates']} identical to an earlier one, {counts['skipped']} already queued; "
+                  f"skipped {len(failed)}")
+            if failed:
+                sys.exit(1)
+            return
+
         monster_seed = _get_or_generate_seed(args)
         if monster_seed:
-            art_prompt = construct_mon_prompt(monster_seed)
+            if args.render_cache:
+                from .render_cache import RenderCache, pin_key
+
+                with RenderCache(args.render_cache) as renders:
+                    # A pinned monster is keyed by its PIN; a temporary one by its fields.
+                    art_prompt = renders.render("artprompt", monster_seed, pin_key(monster_seed) if args.pin else None)
+            else:
+                art_prompt = construct_mon_prompt(monster_seed)
             print("\n=== ART PROMPT ===\n")
             print(art_prompt)
             print("\n==================\n")
@@ -522,19 +998,25 @@ def main():
 
     elif args.command == "list":
         if args.types:
-            print("--- Available Monster Types ---", *sorted(SEED_TYPES), sep="\n- ")
+            print("--- Available Monster Types ---", *sorted(type_names), sep="\n- ")
+        if args.habitats or args.mutagens:
+            from .data import data
         if args.habitats:
-            print("\n--- Available Habitats ---", *sorted(ALL_HABITATS), sep="\n- ")
+            print("\n--- Available Habitats ---", *sorted(data.ALL_HABITATS), sep="\n- ")
         if args.mutagens:
-            print("\n--- Major Mutagens ---", *sorted(MAJOR_MODS.keys()), sep="\n- ")
+            print("\n--- Major Mutagens ---", *sorted(data.MAJOR_MODS.keys()), sep="\n- ")
             print(
-                "\n--- Utility Mutagens ---", *sorted(UTILITY_MODS.keys()), sep="\n- "
+                "\n--- Utility Mutagens ---", *sorted(data.UTILITY_MODS.keys()), sep="\n- "
             )
         if not any([args.types, args.habitats, args.mutagens]):
             parser_list.print_help()
 
 
     elif args.command == "lumenkin":
+        from .monster_cache import CACHE_FILE, save_monster
+        from .monsterseed import choose_type_pair
+        from .pipeline import Spec, forge_monster
+
         print(f"Generating Lumen-Kin candidate for archetype: {args.archetype}...")
 
         resonance_profile = {
@@ -550,8 +1032,8 @@ def main():
         p_type, s_type = choose_type_pair()
         
         try:
-            lumen_kin_seed = _forge_seed_no_cache(
-                idnum=1, primary_type=p_type, secondary_type=s_type, major_count=1, util_count=1
+            lumen_kin_seed = forge_monster(
+                Spec(p_type, s_type or "none"), major_count=1, util_count=1, idnum=1
             )
             
             # Generate and add the Kin properties to the monster's metadata
@@ -566,18 +1048,117 @@ def main():
             print(f"Error generating Lumen-Kin: {e}", file=sys.stderr)
 
     elif args.command == "reroll":
-        if not args.traits and not args.majors:
-            print("Error: You must specify an attribute to re-roll (e.g., --traits, --majors).", file=sys.stderr)
-            print("Usage: mongen reroll <pin> [--traits] [--majors]")
-            sys.exit(1)
-
         reroll_options = {
             "traits": args.traits,
             "majors": args.majors,
+            "utilities": args.utilities,
+            "held_item": args.held_item,
+            "tempers": args.tempers,
+            "habitat": args.habitat,
         }
-        
-        from .reroll import reroll_monster_attributes
-        reroll_monster_attributes(args.pin, reroll_options)
+        problem = None
+        if not any(reroll_options.values()):
+            problem = "You must specify an attribute to re-roll (e.g., --traits, --majors)."
+        elif (args.pin is None) == (args.pins_file is None):
+            problem = "Give either a PIN or --pins-file."
+        if problem:
+            print(f"Error: {problem}", file=sys.stderr)
+            print("Usage: mongen reroll (<pin> | --pins-file FILE) [--traits] [--majors] [--utilities] "
+                  "[--held-item] [--tempers] [--habitat]")
+            sys.exit(1)
+
+        if args.pins_file is None:
+            from .reroll import reroll_monster_attributes
+            reroll_monster_attributes(args.pin, reroll_options)
+        else:
+            from .reroll import reroll_many
+
+            pins = _read_pins(args.pins_file)
+            options = [option for option, wanted in reroll_options.items() if wanted]
+            result = reroll_many(pins, options, run_seed=args.seed, workers=args.workers)
+            # Old and new PIN per line on stdout; the summary goes to stderr.
+            for old_pin, new_pin in result["rerolled"].items():
+                print(f"{old_pin} {new_pin}")
+            for pin, reason in result["failed"].items():
+                print(f"Skipped {pin}: {reason}", file=sys.stderr)
+            print(f"Re-rolled {len(result['rerolled'])} monster(s), skipped {len(result['failed'])} "
+                  f"(seed {result['run_seed']})", file=sys.stderr)
+            if result["failed"]:
+                sys.exit(1)
+
+    elif args.command == "lineage":
+        from . import monster_cache
+
+        if args.prune:
+            removed = monster_cache.prune_lineages()
+            print(f"Removed {removed} superseded reroll(s) from {monster_cache.CACHE_FILE}")
+        if args.pin:
+            try:
+                family = monster_cache.lineage(args.pin)
+            except KeyError as e:
+                print(f"Error: {e.args[0]}", file=sys.stderr)
+                sys.exit(1)
+            for pin, _, generation, cached in family["members"]:
+                marks = [m for m, on in (("latest", pin == family["latest"]), ("pruned", not cached),
+                                         ("this", pin == args.pin)) if on]
+                suffix = f"  ({', '.join(marks)})" if marks else ""
+                print(f"{'  ' * generation}{pin}  gen {generation}{suffix}")
+        elif not args.prune:
+            print("Usage: mongen lineage <pin> [--prune]", file=sys.stderr)
+            sys.exit(1)
+
+    elif args.command == "batch":
+        from .batch import load_jobs, run_batch
+
+        try:
+            jobs = load_jobs(args.specs)
+        except (OSError, ValueError) as e:
+            print(f"Error reading batch specs: {e}", file=sys.stderr)
+            sys.exit(2)
+        run_seed = args.seed if args.seed is not None else random.getrandbits(63)
+        progress = None if args.quiet else sys.stderr
+        if progress:
+            print(f"[batch] {len(jobs)} job(s), batch seed {run_seed}", file=progress)
+        try:
+            run_batch(
+                jobs,
+                workers=args.workers,
+                run_seed=run_seed,
+                default_output=args.output,
+                progress=progress,
+                checkpoint=args.checkpoint,
+                checkpoint_every=args.checkpoint_every,
+                dedup_index=args.dedup_index,
+                default_formats=args.format,
+                render_cache=args.render_cache,
+            )
+        except (OSError, ValueError) as e:
+            print(f"Error running batch: {e}", file=sys.stderr)
+            sys.exit(1)
+
+    elif args.command == "resume":
+        from .batch import resume_batch
+
+        try:
+            resume_batch(args.manifest, workers=args.workers, progress=None if args.quiet else sys.stderr)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Error resuming {args.manifest}: {e}", file=sys.stderr)
+            sys.exit(1)
+
+    elif args.command == "compile-data":
+        from .data.data import compile_bundle
+        from . import mon_forge  # registers the derived sampling pools  # noqa: F401
+
+        try:
+            result = compile_bundle(args.output)
+        except (OSError, ValueError) as e:
+            print(f"Error compiling data: {e}", file=sys.stderr)
+            sys.exit(1)
+        print(
+            f"Wrote {result['path']} ({result['bytes']:,} bytes): "
+            f"{len(result['tables'])} tables, {len(result['derived'])} derived structures"
+        )
+        print(f"Source hash: {result['source_hash']}")
 
 if __name__ == "__main__":
     main()
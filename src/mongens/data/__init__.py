@@ -1,3 +1,40 @@
+import re
+from pathlib import Path
+
+# Top-level `- name: X` entries of seed_types.yaml.
+_SEED_TYPE_NAME = re.compile(r"^- name:\s*[\"']?([^\"'#\n]+?)[\"']?\s*(?:#.*)?$", re.MULTILINE)
+
+
+def seed_type_names():
+    """
+    Sorted seed type names, read from the `- name:` lines of types/seed_types.yaml
+    without parsing YAML or building the data tables. Meant for cheap lookups such
+    as argparse choices; falls back to data.SEED_TYPES if the file is not shipped.
+    """
+    path = Path(__file__).parent / "types" / "seed_types.yaml"
+    try:
+        text = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        from .data import SEED_TYPES
+
+        return list(SEED_TYPES)
+    return sorted(_SEED_TYPE_NAME.findall(text))
+
+
+def reload(changed=None):
+    """Re-read changed data files in place; see mongens.data.data.reload()."""
+    from .data import reload as _reload
+
+    return _reload(changed)
+
+
+def watch(interval: float = 1.0, on_reload=None, on_error=None):
+    """Start polling the data files for edits; see mongens.data.data.watch()."""
+    from .data import watch as _watch
+
+    return _watch(interval, on_reload=on_reload, on_error=on_error)
+
+
 def main():
     return
 
@@ -1,6 +1,101 @@
-from typing import Dict, Any, Tuple, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Callable, FrozenSet, List, NamedTuple, Optional, Tuple, Iterable, Union
 from pathlib import Path
-import yaml
+from types import MappingProxyType
+import copy
+import gc
+import hashlib
+import marshal
+import os
+import struct
+import sys
+import threading
+import time
+import warnings
+
+DATA_DIR = Path(__file__).parent
+
+
+def _yaml() -> Any:
+    """
+    Imports PyYAML on first use. Processes that load a compiled bundle (see
+    compile_bundle()) never parse YAML, so they don't pay for the import.
+    """
+
+    import yaml
+
+    return yaml
+
+
+def _yaml_loader() -> type:
+    # Prefer the libyaml-backed loader when PyYAML was built with it; it parses the
+    # same safe subset as yaml.SafeLoader, just several times faster.
+    yaml = _yaml()
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def __getattr__(name: str) -> Any:
+    # `data.yaml` and `data.YAML_LOADER` stay available without importing PyYAML
+    # at module import time.
+    if name == "yaml":
+        return _yaml()
+    if name == "YAML_LOADER":
+        return _yaml_loader()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Parsed documents keyed by relative path, with the (mtime, size) stamp of the
+# file they were parsed from. Loaders hand out copies, so the cached documents
+# stay pristine and can be reused when an unrelated file is reloaded.
+_DOCS: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
+
+def _parse_yaml(filepath: Path, loader: Optional[type] = None) -> Any:
+    """
+    Parse a single YAML file with the given loader (defaults to YAML_LOADER).
+    """
+
+    with open(filepath, "r", encoding="utf-8") as f:
+        return _yaml().load(f, Loader=loader or _yaml_loader())
+
+
+def _default_yaml_workers() -> int:
+    """
+    Thread count for _prefetch_yaml(). libyaml builds Python objects with the GIL
+    held, so a pool only overlaps parsing on free-threaded interpreters.
+    """
+
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    return 1 if gil_enabled else min(8, os.cpu_count() or 1)
+
+
+def _prefetch_yaml(
+    filenames: Iterable[str],
+    loader: Optional[type] = None,
+    max_workers: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Parse several independent YAML files concurrently.
+    Args:
+                    filenames: Relative filenames (in the same directory as this module).
+                    loader: PyYAML loader class to use (defaults to YAML_LOADER).
+                    max_workers: Thread pool size; 1 parses sequentially in the caller.
+                                    Defaults to _default_yaml_workers().
+    Returns:
+                    A mapping of filename -> parsed document. Missing files are left out
+                    so the individual loaders can raise their usual FileNotFoundError.
+    """
+
+    base = DATA_DIR
+    present = [name for name in filenames if (base / name).exists()]
+
+    def _parse(name: str) -> Any:
+        return _parse_yaml(base / name, loader)
+
+    workers = min(max_workers or _default_yaml_workers(), len(present))
+    if workers <= 1:
+        return {name: _parse(name) for name in present}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return dict(zip(present, pool.map(_parse, present)))
 
 
 def _load_yaml(filename: str) -> Any:
@@ -9,17 +104,79 @@ def _load_yaml(filename: str) -> Any:
     Args:
                     filename: Relative filename (in the same directory as this module).
     Returns:
-                    The Python object produced by yaml.safe_load() for the file contents.
+                    The Python object produced by parsing the file contents with YAML_LOADER.
     Raises:
                     FileNotFoundError: If the target file does not exist.
                     yaml.YAMLError: If the file exists but cannot be parsed as valid YAML.
     """
 
-    filepath = Path(__file__).parent / filename
+    filepath = DATA_DIR / filename
     if not filepath.exists():
         raise FileNotFoundError(f"Data file not found: {filepath}")
-    with open(filepath, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    stamp = _file_stamp(filepath)
+    cached = _DOCS.get(filename)
+    if cached is None or cached[0] != stamp:
+        cached = _DOCS[filename] = (stamp, _parse_yaml(filepath))
+    return copy.deepcopy(cached[1])
+
+
+def _freeze(value: Any, memo: Optional[Dict[int, Any]] = None) -> Any:
+    """
+    Returns a read-only version of a loaded table: dicts become MappingProxyType
+    views, lists and tuples become tuples, sets become frozensets (recursively).
+    Containers shared through `memo` (keyed by id) stay shared once frozen.
+    """
+
+    if memo is not None and id(value) in memo:
+        return memo[id(value)]
+    if isinstance(value, dict):
+        frozen: Any = MappingProxyType({k: _freeze(v, memo) for k, v in value.items()})
+    elif isinstance(value, list) or type(value) is tuple:
+        frozen = tuple(_freeze(v, memo) for v in value)
+    elif isinstance(value, set):
+        return frozenset(value)
+    else:
+        return value
+    if memo is not None:
+        memo[id(value)] = frozen
+    return frozen
+
+
+def _thaw(value: Any, memo: Dict[int, Any]) -> Any:
+    """
+    Inverse of _freeze() for the bundle: MappingProxyType views become plain dicts
+    again (recursively). Views shared through `memo` stay shared in the copy.
+    """
+
+    if id(value) in memo:
+        return memo[id(value)]
+    if isinstance(value, MappingProxyType):
+        thawed: Any = {k: _thaw(v, memo) for k, v in value.items()}
+    elif type(value) is tuple:
+        thawed = tuple(_thaw(v, memo) for v in value)
+    else:
+        return value
+    memo[id(value)] = thawed
+    return thawed
+
+
+def _file_stamp(filepath: Path) -> Tuple[int, int]:
+    st = filepath.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+def _cache_docs(filenames: Iterable[str]) -> None:
+    """
+    Parse the given files in one _prefetch_yaml() pass and seed the document cache.
+    """
+
+    stamps = {
+        name: _file_stamp(DATA_DIR / name)
+        for name in filenames
+        if (DATA_DIR / name).exists()
+    }
+    for name, doc in _prefetch_yaml(stamps).items():
+        _DOCS[name] = (stamps[name], doc)
 
 
 def _load_seed_types_data(filename: str) -> Tuple[Dict[str, Any], Dict[str, float]]:
@@ -37,16 +194,13 @@ def _load_seed_types_data(filename: str) -> Tuple[Dict[str, Any], Dict[str, floa
             FileNotFoundError: If the target file does not exist.
             ValueError: If the parsed YAML is not a list, contains entries that are
                     not mappings, or if any entry is missing the required 'name' key.
-            yaml.YAMLError: If the YAML cannot be parsed (propagated from yaml.safe_load).
+            yaml.YAMLError: If the YAML cannot be parsed (propagated from _load_yaml).
     """
 
-    filepath = Path(__file__).parent / filename
-    if not filepath.exists():
-        raise FileNotFoundError(f"Data file not found: {filepath}")
-    with open(filepath, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+    data = _load_yaml(filename)
 
     if not isinstance(data, list):
+        filepath = Path(__file__).parent / filename
         raise ValueError(f"Expected a list of seed type definitions in {filepath}")
 
     types_data: Dict[str, Any] = {}
@@ -83,11 +237,7 @@ def _load_weighted_yaml(filename: str) -> Dict[str, float]:
     """
     Load a weighted list from YAML (sequence of mappings with "name" and optional "weight").
     """
-    filepath = Path(__file__).parent / filename
-    if not filepath.exists():
-        raise FileNotFoundError(f"Data file not found: {filepath}")
-    with open(filepath, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+    data = _load_yaml(filename)
 
     if not isinstance(data, list):
         raise ValueError(
@@ -356,8 +506,21 @@ def _load_manifest(manifest: Dict[str, str]) -> Dict[str, Any]:
     return loaded
 
 
-TYPE_SYSTEM = _load_manifest(TYPE_SYSTEM_MANIFEST)
-_validate_type_system(TYPE_SYSTEM)
+# Every YAML file read at import time. They are independent of each other, so a
+# cold start parses them all up front in one _cache_docs() pass and the loaders
+# below just copy the parsed documents.
+DATA_FILES = (
+    *TYPE_SYSTEM_MANIFEST.values(),
+    "types/seed_types.yaml",
+    "type_forms.yaml",
+    "mutagens/major_mods.yaml",
+    "mutagens/utility_mods.yaml",
+    "physical_traits.yaml",
+    "held_items.yaml",
+    "kin_wounds.yaml",
+    "naming/type_parts.yaml",
+)
+
 
 # -- Baseline stats (can override per species later, after mutagens do # there thing and populate stat boxes)
 BASE_STATS: Dict[str, int] = {
@@ -398,18 +561,6 @@ def _normalize_seed_type_data(
     return normalized
 
 
-# -- Loader
-SEED_TYPE_DATA, SEED_TYPES_WEIGHTED = _load_seed_types_data("types/seed_types.yaml")
-FORMS_BY_TYPE = _load_yaml("type_forms.yaml")
-
-# -- Normalizer
-SEED_TYPES = sorted(list(SEED_TYPES_WEIGHTED.keys()))
-SEED_TYPE_DATA = _normalize_seed_type_data(SEED_TYPE_DATA)
-
-# -- Validator
-_validate_seed_type_data(SEED_TYPE_DATA, BASE_STATS)
-_validate_type_forms(FORMS_BY_TYPE, SEED_TYPE_DATA)
-
 """ Maps frozenset({primary, secondary}) -> multiplicative boost to apply when that pair is being considered. Values >1.0 = positive synergy, values <1.0 = penalty (but use INCOMPATIBLE_TYPE_PAIRS for hard forbids). """
 TYPE_SYNERGY_BOOSTS = {
     frozenset(["Spur", "Axiom"]): 1.2,  # (Kinetic, Argent)
@@ -429,10 +580,6 @@ INCOMPATIBLE_TYPE_PAIRS = {
     frozenset(["Rift", "Axiom"]),  # (Chrono, Arcane)
 }
 
-MAJOR_MODS = _load_mods_yaml("mutagens/major_mods.yaml")
-UTILITY_MODS = _load_mods_yaml("mutagens/utility_mods.yaml")
-ALL_MODS = [MAJOR_MODS, UTILITY_MODS]
-
 
 LEGACY_TYPE_MAP: Dict[str, str] = {
     # Legacy -> new type mapping to help migrate existing mod and habitat data. Keys that are not present in this map will be left unchanged
@@ -511,10 +658,6 @@ def _normalize_habitats(
     return new_map
 
 
-# Normalize existing mod datasets and habitats to the new canonical types.
-_normalize_mods(MAJOR_MODS)
-_normalize_mods(UTILITY_MODS)
-
 # Migrate legacy HABITATS_BY_TYPE to remapped keys (safe fallback for old code).
 try:
     HABITATS_BY_TYPE = _normalize_habitats(HABITATS_BY_TYPE)
@@ -545,15 +688,633 @@ def _cleanup_mods(mods: Dict[str, Dict[str, Any]]) -> None:
             mod["synergy_bonus"] = dict(sorted(new_sb.items()))
 
 
-_cleanup_mods(MAJOR_MODS)
-_cleanup_mods(UTILITY_MODS)
+# -- Table builders
+# Each builder loads, normalizes and validates one group of public tables. It
+# receives the tables built so far for the same generation, so cross-file
+# checks (e.g. forms against seed types) see consistent data.
+def _build_type_system(tables: Dict[str, Any]) -> Dict[str, Any]:
+    type_system = _load_manifest(TYPE_SYSTEM_MANIFEST)
+    _validate_type_system(type_system)
+    return {"TYPE_SYSTEM": type_system}
+
+
+def _build_seed_types(tables: Dict[str, Any]) -> Dict[str, Any]:
+    seed_type_data, seed_types_weighted = _load_seed_types_data("types/seed_types.yaml")
+    seed_type_data = _normalize_seed_type_data(seed_type_data)
+    _validate_seed_type_data(seed_type_data, BASE_STATS)
+    return {
+        "SEED_TYPE_DATA": seed_type_data,
+        "SEED_TYPES_WEIGHTED": seed_types_weighted,
+        "SEED_TYPES": sorted(list(seed_types_weighted.keys())),
+    }
+
+
+def _build_type_forms(tables: Dict[str, Any]) -> Dict[str, Any]:
+    forms_by_type = _load_yaml("type_forms.yaml")
+    _validate_type_forms(forms_by_type, tables["SEED_TYPE_DATA"])
+    return {"FORMS_BY_TYPE": forms_by_type}
+
+
+def _build_mods(filename: str, seed_types: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+    # Normalize mod datasets to the new canonical types, then dedupe and validate.
+    mods = _load_mods_yaml(filename)
+    _normalize_mods(mods)
+    _cleanup_mods(mods)
+    _validate_mods(mods, BASE_STATS, seed_types, Path(filename).name)
+    return mods
+
+
+def _build_major_mods(tables: Dict[str, Any]) -> Dict[str, Any]:
+    return {"MAJOR_MODS": _build_mods("mutagens/major_mods.yaml", tables["SEED_TYPES"])}
+
+
+def _build_utility_mods(tables: Dict[str, Any]) -> Dict[str, Any]:
+    return {"UTILITY_MODS": _build_mods("mutagens/utility_mods.yaml", tables["SEED_TYPES"])}
+
+
+def _build_type_name_parts(tables: Dict[str, Any]) -> Dict[str, Any]:
+    # Per-type naming pools: {type: {"prefix": [...], "stem": [...], "suffix": [...]}}
+    parts = _load_yaml("naming/type_parts.yaml")
+    if not isinstance(parts, dict):
+        raise ValueError("naming/type_parts.yaml must be a mapping of type -> name parts")
+    return {"TYPE_NAME_PARTS": parts}
+
+
+class _TableSpec(NamedTuple):
+    provides: Tuple[str, ...]
+    sources: Tuple[str, ...]
+    after: Tuple[str, ...]
+    build: Callable[[Dict[str, Any]], Dict[str, Any]]
+
+
+# -- Table graph
+# Ordered so every entry comes after the tables listed in its `after`. A table
+# is rebuilt when one of its source files changes or when anything it is built
+# after was rebuilt.
+_TABLE_GRAPH: Tuple[_TableSpec, ...] = (
+    _TableSpec(("TYPE_SYSTEM",), tuple(TYPE_SYSTEM_MANIFEST.values()), (), _build_type_system),
+    _TableSpec(
+        ("SEED_TYPE_DATA", "SEED_TYPES_WEIGHTED", "SEED_TYPES"),
+        ("types/seed_types.yaml",),
+        (),
+        _build_seed_types,
+    ),
+    _TableSpec(("FORMS_BY_TYPE",), ("type_forms.yaml",), ("SEED_TYPE_DATA",), _build_type_forms),
+    _TableSpec(("MAJOR_MODS",), ("mutagens/major_mods.yaml",), ("SEED_TYPES",), _build_major_mods),
+    _TableSpec(("UTILITY_MODS",), ("mutagens/utility_mods.yaml",), ("SEED_TYPES",), _build_utility_mods),
+    _TableSpec(
+        ("ALL_MODS",),
+        (),
+        ("MAJOR_MODS", "UTILITY_MODS"),
+        lambda t: {"ALL_MODS": [t["MAJOR_MODS"], t["UTILITY_MODS"]]},
+    ),
+    _TableSpec(
+        ("PHYSICAL_TRAITS",),
+        ("physical_traits.yaml",),
+        (),
+        lambda t: {"PHYSICAL_TRAITS": _load_weighted_yaml("physical_traits.yaml")},
+    ),
+    _TableSpec(
+        ("HELD_ITEMS",),
+        ("held_items.yaml",),
+        (),
+        lambda t: {"HELD_ITEMS": _load_weighted_yaml("held_items.yaml")},
+    ),
+    _TableSpec(
+        ("KIN_WOUNDS",),
+        ("kin_wounds.yaml",),
+        (),
+        lambda t: {"KIN_WOUNDS": _load_weighted_yaml("kin_wounds.yaml")},
+    ),
+    _TableSpec(("TYPE_NAME_PARTS",), ("naming/type_parts.yaml",), (), _build_type_name_parts),
+)
+
+
+def _build_tables(
+    changed: Optional[Iterable[str]] = None,
+    report: Optional[List[Dict[str, Any]]] = None,
+) -> Dict[str, Any]:
+    """
+    Summary:
+        Rebuilds the tables fed by the changed files (all tables when None).
+
+    Args:
+        changed: Relative paths of the data files that changed.
+        report: If given, each rebuilt table group appends a result dict here
+            (tables, sources, ok, error, build_ms) and a failure skips only the
+            groups built after it instead of raising.
+
+    Returns:
+        A mapping of table name -> new (frozen) value for every rebuilt table.
+        Nothing is published here; the caller swaps the result in.
+    """
+    changed_set = None if changed is None else set(changed)
+    current = globals()
+    tables: Dict[str, Any] = {}
+    rebuilt: Dict[str, Any] = {}
+    failed: set = set()
+    for spec in _TABLE_GRAPH:
+        dirty = (
+            changed_set is None
+            or not changed_set.isdisjoint(spec.sources)
+            or not rebuilt.keys().isdisjoint(spec.after)
+            or not failed.isdisjoint(spec.after)
+        )
+        if not dirty:
+            tables.update({name: current[name] for name in spec.provides})
+            continue
+        if report is None:
+            built = {name: _freeze(value) for name, value in spec.build(tables).items()}
+            rebuilt.update(built)
+            tables.update(built)
+            continue
+
+        result: Dict[str, Any] = {
+            "tables": list(spec.provides),
+            "sources": list(spec.sources),
+            "ok": True,
+            "error": None,
+            "build_ms": 0.0,
+        }
+        report.append(result)
+        blocked = sorted(failed.intersection(spec.after))
+        if blocked:
+            result.update(ok=False, error=f"skipped: depends on failed {', '.join(blocked)}")
+            failed.update(spec.provides)
+            continue
+        start = time.perf_counter()
+        try:
+            built = {name: _freeze(value) for name, value in spec.build(tables).items()}
+        except Exception as e:
+            result.update(ok=False, error=f"{type(e).__name__}: {e}")
+            failed.update(spec.provides)
+        else:
+            rebuilt.update(built)
+            tables.update(built)
+        result["build_ms"] = (time.perf_counter() - start) * 1000.0
+    return rebuilt
+
+
+# -- Derived structures
+# Lookup tables computed from the public tables (sampler weights, eligibility
+# indexes, ...). Modules register a builder plus the tables it reads; values are
+# built on first use, frozen like the tables, and dropped/rebuilt by reload()
+# when those tables change.
+_DERIVED: Dict[str, Tuple[Callable[[], Any], FrozenSet[str]]] = {}
+_DERIVED_VALUES: Dict[str, Any] = {}
+_RELOAD_LOCK = threading.RLock()
+
+# Derived values read from a compiled bundle: name -> (tables read, builder hash,
+# raw value). derived() uses them instead of calling the builder while the builder
+# is unchanged (see _builder_hash), until a reload makes them stale.
+_BUNDLED_DERIVED: Dict[str, Tuple[FrozenSet[str], str, Any]] = {}
+
+# Bumped on every successful reload(); handy as a cache key.
+DATA_VERSION = 0
+
+# (mtime, size) of each data file as of the tables currently published.
+_APPLIED_STAMPS: Dict[str, Tuple[int, int]] = {}
+
+
+def register_derived(
+    name: str, builder: Callable[[], Any], depends_on: Iterable[str]
+) -> None:
+    """
+    Summary:
+        Registers a structure derived from the data tables.
+
+    Args:
+        name: Unique name used with derived().
+        builder: Zero-argument callable that computes the structure from this module's
+            tables. Its result is frozen (see _freeze) before it is cached.
+        depends_on: Names of the tables the builder reads (e.g. "MAJOR_MODS").
+    """
+    unknown = set(depends_on) - {n for spec in _TABLE_GRAPH for n in spec.provides}
+    if unknown:
+        raise ValueError(f"Derived structure '{name}' depends on unknown tables: {sorted(unknown)}")
+    with _RELOAD_LOCK:
+        _DERIVED[name] = (builder, frozenset(depends_on))
+        _DERIVED_VALUES.pop(name, None)
+
+
+def _builder_hash(builder: Callable[[], Any]) -> str:
+    """
+    Hash of a derived builder: the source of the module defining it, which holds
+    its helpers too, so editing either invalidates the bundled value.
+    """
+    digest = hashlib.sha256(getattr(builder, "__qualname__", "").encode("utf-8") + b"\0")
+    path = getattr(sys.modules.get(getattr(builder, "__module__", "")), "__file__", None)
+    if path and os.path.exists(path):
+        digest.update(Path(path).read_bytes())
+    else:
+        digest.update(getattr(getattr(builder, "__code__", None), "co_code", b""))
+    return digest.hexdigest()
+
+
+def derived(name: str) -> Any:
+    """
+    Summary:
+        Returns a registered derived structure, building it on first use.
+
+    Raises:
+        KeyError: If no structure was registered under that name.
+    """
+    try:
+        return _DERIVED_VALUES[name]
+    except KeyError:
+        pass
+    with _RELOAD_LOCK:
+        if name not in _DERIVED_VALUES:
+            builder, _ = _DERIVED[name]
+            bundled = _BUNDLED_DERIVED.pop(name, None)
+            if bundled is not None and bundled[1] == _builder_hash(builder):
+                value = bundled[2]
+            else:
+                value = builder()
+            _DERIVED_VALUES[name] = _freeze(value)
+        return _DERIVED_VALUES[name]
+
+
+def _relative_data_path(path: Union[str, Path]) -> str:
+    p = Path(path)
+    if p.is_absolute():
+        try:
+            p = p.resolve().relative_to(DATA_DIR.resolve())
+        except ValueError:
+            pass
+    return p.as_posix()
+
+
+def changed_files() -> List[str]:
+    """
+    Summary:
+        Lists the data files whose contents changed since the published tables were built.
+    """
+    changed = []
+    for name in DATA_FILES:
+        path = DATA_DIR / name
+        stamp = _file_stamp(path) if path.exists() else None
+        if stamp != _APPLIED_STAMPS.get(name):
+            changed.append(name)
+    return changed
+
+
+def reload(changed: Optional[Iterable[Union[str, Path]]] = None) -> Dict[str, List[str]]:
+    """
+    Summary:
+        Re-reads changed data files and swaps the rebuilt tables into this module.
+        Only tables fed by those files (and tables built after them) are rebuilt,
+        and only derived structures that read a rebuilt table are refreshed. If
+        loading or validation fails, the published tables are left untouched.
+
+    Args:
+        changed: Paths (absolute, or relative to the data directory) of the files to
+            reload. Defaults to every file whose mtime or size changed.
+
+    Returns:
+        A dict with the reloaded "files", rebuilt "tables" and refreshed "derived" names.
+
+    Raises:
+        FileNotFoundError, ValueError, yaml.YAMLError: If the new data does not load.
+    """
+    with _RELOAD_LOCK:
+        files = _resolve_changed(changed)
+        if not files:
+            return {"files": [], "tables": [], "derived": []}
+
+        for name in files:
+            _DOCS.pop(name, None)
+        rebuilt = _build_tables(files)
+        stale = _publish(files, rebuilt)
+
+    return {"files": sorted(files), "tables": sorted(rebuilt), "derived": sorted(stale)}
+
+
+def _resolve_changed(changed: Optional[Iterable[Union[str, Path]]]) -> List[str]:
+    if changed is None:
+        return changed_files()
+    return [f for f in dict.fromkeys(map(_relative_data_path, changed)) if f in DATA_FILES]
+
+
+def _publish(files: Iterable[str], rebuilt: Dict[str, Any]) -> List[str]:
+    """
+    Swaps rebuilt tables into the module and refreshes the derived structures that
+    read them. Must be called with _RELOAD_LOCK held. Returns the stale derived names.
+    """
+    global DATA_VERSION
+    stale = [
+            name for name, (_, deps) in _DERIVED.items()
+            if not deps.isdisjoint(rebuilt)
+        ]
+    warm = [name for name in stale if name in _DERIVED_VALUES]
+    for name in stale:
+        _DERIVED_VALUES.pop(name, None)
+    for name, (deps, _, _) in list(_BUNDLED_DERIVED.items()):
+        if not deps.isdisjoint(rebuilt):
+            del _BUNDLED_DERIVED[name]
+    globals().update(rebuilt)
+    DATA_VERSION += 1
+    for name in files:
+        if name in _DOCS:
+            _APPLIED_STAMPS[name] = _DOCS[name][0]
+    # Rebuild what was in use so a warm process stays warm.
+    for name in warm:
+        derived(name)
+    return stale
+
+
+def validate(
+    changed: Optional[Iterable[Union[str, Path]]] = None, publish: bool = False
+) -> Dict[str, Any]:
+    """
+    Summary:
+        Validates changed data files in-process, together with every table that
+        depends on them. Unchanged files are not parsed again. Unlike reload(),
+        problems are reported rather than raised, one entry per file and per
+        rebuilt table group, each with its own timing.
+
+    Args:
+        changed: Paths (absolute, or relative to the data directory) to validate.
+            Defaults to every file whose mtime or size changed.
+        publish: If everything validates, swap the rebuilt tables in as reload() would,
+            so later validations are checked against the new data.
+
+    Returns:
+        {"ok": bool, "elapsed_ms": float,
+         "files": [{"file", "ok", "error", "parse_ms"}, ...],
+         "tables": [{"tables", "sources", "ok", "error", "build_ms"}, ...]}
+    """
+    start = time.perf_counter()
+    file_results: List[Dict[str, Any]] = []
+    table_results: List[Dict[str, Any]] = []
+    with _RELOAD_LOCK:
+        files = _resolve_changed(changed)
+        for name in files:
+            _DOCS.pop(name, None)
+            parse_start = time.perf_counter()
+            error = None
+            try:
+                _load_yaml(name)
+            except (OSError, _yaml().YAMLError) as e:
+                error = f"{type(e).__name__}: {e}"
+            file_results.append(
+                {
+                    "file": name,
+                    "ok": error is None,
+                    "error": error,
+                    "parse_ms": (time.perf_counter() - parse_start) * 1000.0,
+                }
+            )
+        rebuilt = _build_tables(files, report=table_results) if files else {}
+        ok = all(r["ok"] for r in file_results + table_results)
+        if ok and publish and files:
+            _publish(files, rebuilt)
+
+    return {
+        "ok": ok,
+        "elapsed_ms": (time.perf_counter() - start) * 1000.0,
+        "files": file_results,
+        "tables": table_results,
+    }
+
+
+def freeze_for_fork() -> None:
+    """
+    Summary:
+        Moves every object allocated so far, the loaded tables included, into the
+        garbage collector's permanent generation (gc.freeze()). Call it in the
+        parent right before starting a fork-based worker pool: collections in the
+        children then never write to those objects' GC headers, so the pages
+        holding the tables stay shared copy-on-write.
+    """
+    gc.freeze()
 
-_validate_mods(MAJOR_MODS, BASE_STATS, SEED_TYPES, "major_mods.yaml")
-_validate_mods(UTILITY_MODS, BASE_STATS, SEED_TYPES, "utility_mods.yaml")
 
-PHYSICAL_TRAITS = _load_weighted_yaml("physical_traits.yaml")
-HELD_ITEMS = _load_weighted_yaml("held_items.yaml")
-KIN_WOUNDS = _load_weighted_yaml("kin_wounds.yaml")
+def watch(
+    interval: float = 1.0,
+    on_reload: Optional[Callable[[Dict[str, List[str]]], None]] = None,
+    on_error: Optional[Callable[[Exception], None]] = None,
+) -> Callable[[], None]:
+    """
+    Summary:
+        Starts a daemon thread that polls the data files and calls reload() when
+        any of them changes. A file that fails to load is reported once and
+        retried when it changes again.
+
+    Args:
+        interval: Seconds between polls.
+        on_reload: Called with reload()'s result after every successful reload.
+        on_error: Called with the exception when a reload fails (default: print to stderr).
+
+    Returns:
+        A function that stops the watcher.
+    """
+    stop = threading.Event()
+    failed: Dict[str, Optional[Tuple[int, int]]] = {}
+
+    def _stamp(name: str) -> Optional[Tuple[int, int]]:
+        path = DATA_DIR / name
+        return _file_stamp(path) if path.exists() else None
+
+    def _loop() -> None:
+        while not stop.wait(interval):
+            pending = [name for name in changed_files() if failed.get(name, False) != _stamp(name)]
+            if not pending:
+                continue
+            try:
+                result = reload(pending)
+            except Exception as e:
+                failed.update({name: _stamp(name) for name in pending})
+                if on_error:
+                    on_error(e)
+                else:
+                    print(f"[mongens.data] reload failed: {e}", file=sys.stderr)
+                continue
+            for name in pending:
+                failed.pop(name, None)
+            if on_reload:
+                on_reload(result)
+
+    threading.Thread(target=_loop, name="mongens-data-watch", daemon=True).start()
+    return stop.set
+
+
+# -- Compiled bundle
+# `mongen compile-data` writes the built tables, plus the derived structures
+# registered at that point, to one versioned file. On import it is used instead
+# of the YAML files when its embedded source hash matches the data files on disk,
+# or when the YAML files were not shipped at all.
+# Layout: header (magic, format, source hash, payload SHA-256), then the payload,
+# marshal'd plain containers: loading it cannot run code, unlike a pickle.
+BUNDLE_FORMAT = 3
+_BUNDLE_MAGIC = b"MONGENSDATA"
+_BUNDLE_HEADER = struct.Struct(">11sH32s32s")
+
+# MONGENS_DATA_BUNDLE=<path> points at another bundle; MONGENS_DATA_BUNDLE=off ignores it.
+_BUNDLE_ENV = os.environ.get("MONGENS_DATA_BUNDLE", "")
+BUNDLE_PATH: Optional[Path] = (
+    None if _BUNDLE_ENV == "off" else Path(_BUNDLE_ENV) if _BUNDLE_ENV else DATA_DIR / "data.bundle"
+)
+
+
+def source_hash() -> Optional[str]:
+    """
+    Summary:
+        Hashes the data files together with this module's source, which holds the
+        normalization and validation rules the tables are built with.
+
+    Returns:
+        A hex SHA-256 digest, or None if none of the data files are present.
+    """
+    digest = hashlib.sha256(struct.pack(">H", BUNDLE_FORMAT))
+    found = False
+    for name in DATA_FILES:
+        path = DATA_DIR / name
+        digest.update(name.encode("utf-8") + b"\0")
+        if path.exists():
+            found = True
+            digest.update(path.read_bytes())
+        digest.update(b"\0")
+    if not found:
+        return None
+    digest.update(Path(__file__).read_bytes())
+    return digest.hexdigest()
+
+
+def compile_bundle(path: Optional[Union[str, Path]] = None) -> Dict[str, Any]:
+    """
+    Summary:
+        Writes every table and registered derived structure to a binary bundle that
+        later imports load instead of parsing YAML. Data files edited since they
+        were loaded are reloaded first, so the bundle matches the hash it carries.
+        Each derived structure carries its builder's hash; an import after the
+        builder's module changed rebuilds it instead.
+
+    Args:
+        path: Output file. Defaults to BUNDLE_PATH (data.bundle next to the YAML files).
+
+    Returns:
+        A dict with the bundle "path", "source_hash", "tables", "derived" and "bytes".
+
+    Raises:
+        FileNotFoundError: If the data files are not present to compile from.
+    """
+    target = Path(path) if path else BUNDLE_PATH or DATA_DIR / "data.bundle"
+    with _RELOAD_LOCK:
+        reload()
+        digest = source_hash()
+        if digest is None:
+            raise FileNotFoundError(f"No data files to compile in {DATA_DIR}")
+        memo: Dict[int, Any] = {}
+        tables = {
+            name: _thaw(globals()[name], memo)
+            for spec in _TABLE_GRAPH
+            for name in spec.provides
+        }
+        derived_values = {
+            name: (deps, _builder_hash(builder), _thaw(derived(name), memo))
+            for name, (builder, deps) in _DERIVED.items()
+        }
+    payload = marshal.dumps({"tables": tables, "derived": derived_values})
+    tmp = target.with_name(target.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(_BUNDLE_HEADER.pack(
+            _BUNDLE_MAGIC, BUNDLE_FORMAT, bytes.fromhex(digest), hashlib.sha256(payload).digest()
+        ))
+        f.write(payload)
+    os.replace(tmp, target)
+    return {
+        "path": str(target),
+        "source_hash": digest,
+        "tables": sorted(tables),
+        "derived": sorted(derived_values),
+        "bytes": _BUNDLE_HEADER.size + len(payload),
+    }
+
+
+def _read_bundle(path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Reads a bundle written by compile_bundle(). Returns None, with a warning, if it
+    has another format version, does not match the data files on disk, or its
+    payload is truncated or corrupt.
+    """
+    with open(path, "rb") as f:
+        header = f.read(_BUNDLE_HEADER.size)
+        if len(header) != _BUNDLE_HEADER.size:
+            warnings.warn(f"Ignoring truncated data bundle {path}", RuntimeWarning)
+            return None
+        magic, version, digest, payload_digest = _BUNDLE_HEADER.unpack(header)
+        if magic != _BUNDLE_MAGIC or version != BUNDLE_FORMAT:
+            warnings.warn(
+                f"Ignoring data bundle {path}: format {version}, expected {BUNDLE_FORMAT}",
+                RuntimeWarning,
+            )
+            return None
+        current = source_hash()
+        if current is not None and current != digest.hex():
+            warnings.warn(
+                f"Ignoring stale data bundle {path}; run 'mongen compile-data' to rebuild it",
+                RuntimeWarning,
+            )
+            return None
+        payload = f.read()
+    if hashlib.sha256(payload).digest() != payload_digest:
+        warnings.warn(f"Ignoring corrupt data bundle {path}: payload checksum mismatch", RuntimeWarning)
+        return None
+    try:
+        bundle = marshal.loads(payload)
+        if not isinstance(bundle, dict) or not {"tables", "derived"} <= bundle.keys():
+            raise ValueError("missing tables")
+    except (EOFError, ValueError, TypeError) as e:
+        warnings.warn(f"Ignoring corrupt data bundle {path}: {e}", RuntimeWarning)
+        return None
+    return bundle
+
+
+def _load_bundle(path: Path) -> bool:
+    """
+    Publishes the tables from a bundle. Returns False if the bundle was not usable.
+    """
+    bundle = _read_bundle(path)
+    if bundle is None:
+        return False
+    expected = {name for spec in _TABLE_GRAPH for name in spec.provides}
+    if set(bundle["tables"]) != expected:
+        warnings.warn(f"Ignoring data bundle {path}: table set does not match", RuntimeWarning)
+        return False
+    memo: Dict[int, Any] = {}
+    globals().update({name: _freeze(value, memo) for name, value in bundle["tables"].items()})
+    _BUNDLED_DERIVED.update(bundle["derived"])
+    return True
+
+
+# -- Loader
+# Published below and replaced wholesale by reload(); read them as attributes of
+# this module (data.MAJOR_MODS) in long-running code so reloads are picked up.
+TYPE_SYSTEM: Dict[str, Any]
+SEED_TYPE_DATA: Dict[str, Any]
+SEED_TYPES_WEIGHTED: Dict[str, float]
+SEED_TYPES: List[str]
+FORMS_BY_TYPE: Dict[str, Dict[str, Any]]
+MAJOR_MODS: Dict[str, Dict[str, Any]]
+UTILITY_MODS: Dict[str, Dict[str, Any]]
+ALL_MODS: List[Dict[str, Dict[str, Any]]]
+PHYSICAL_TRAITS: Dict[str, float]
+HELD_ITEMS: Dict[str, float]
+KIN_WOUNDS: Dict[str, float]
+TYPE_NAME_PARTS: Dict[str, Dict[str, List[str]]]
+
+# "yaml", or the path of the compiled bundle the tables were loaded from.
+DATA_SOURCE = "yaml"
+if BUNDLE_PATH is not None and BUNDLE_PATH.exists() and _load_bundle(BUNDLE_PATH):
+    DATA_SOURCE = str(BUNDLE_PATH)
+    _APPLIED_STAMPS.update(
+        {name: _file_stamp(DATA_DIR / name) for name in DATA_FILES if (DATA_DIR / name).exists()}
+    )
+else:
+    _cache_docs(DATA_FILES)
+    globals().update(_build_tables())
+    _APPLIED_STAMPS.update({name: stamp for name, (stamp, _) in _DOCS.items()})
 
 TEMPERS_COUPLED: Dict[str, Dict[str, float]] = {
     "mood": {
@@ -908,3 +1669,16 @@ HABITATS_BY_TYPE: Dict[str, Dict[str, float]] = {
     },
     "Anomalous": dict(_ALL_HABITATS_RAW),
 }
+
+
+# -- Read-only views
+# The hand-written tables are frozen like the YAML-backed ones, so nothing this
+# module exports can be mutated in place by a consumer.
+TYPE_SYSTEM_MANIFEST = _freeze(TYPE_SYSTEM_MANIFEST)
+BASE_STATS = _freeze(BASE_STATS)
+TYPE_SYNERGY_BOOSTS = _freeze(TYPE_SYNERGY_BOOSTS)
+INCOMPATIBLE_TYPE_PAIRS = _freeze(INCOMPATIBLE_TYPE_PAIRS)
+LEGACY_TYPE_MAP = _freeze(LEGACY_TYPE_MAP)
+TEMPERS_COUPLED = _freeze(TEMPERS_COUPLED)
+ALL_HABITATS = _freeze(ALL_HABITATS)
+HABITATS_BY_TYPE = _freeze(HABITATS_BY_TYPE)
@@ -1,11 +1,18 @@
-from pathlib import Path
+import functools
+import io
+import operator
+from typing import IO, Callable, Iterable, List, Tuple
 
 from .forge_name import format_dual_type
-from typing import List
+from .monster_cache import OUTPUT_PATH
+from .monsterseed import MonsterSeed
+from .pipeline import DEX_SEPARATOR
 
-from .mon_forge import apply_mutagens, forge_seed_monster
-from .monster_cache import OUTPUT_PATH, save_monster
-from .monsterseed import MonsterSeed, choose_type_pair
+
+# Stats shown in a dex entry's Base Profile line, in order; others are left out.
+STAT_ORDER = ("HP", "ATK", "DEF", "SPATK", "SPDEF", "SPD", "ACC", "EVA", "LUCK")
+_SEP_LINE = "-" * 60
+_NO_DETAILS = "Distinctive features have not yet been documented."
 
 
 def _summarize_stats(stats: dict) -> str:
@@ -20,14 +27,20 @@ def _summarize_stats(stats: dict) -> str:
         A formatted string summarizing the monster's stats.
         Example: 'HP 62 • ATK 54 • DEF 60 • SPATK 55 • SPDEF 58 • SPD 49'
     """
-    order = ["HP", "ATK", "DEF", "SPATK", "SPDEF", "SPD", "ACC", "EVA", "LUCK"]
-    pieces = []
+    template, values = _stat_layout(tuple(stats))
+    return template % values(stats)
+
 
-    for key in order:
-        if key in stats:
-            pieces.append(f"{key} {stats[key]}")
-    stat_summary = str(" • ".join(pieces) + "\n")
-    return stat_summary
+@functools.lru_cache(maxsize=256)
+def _stat_layout(keys: Tuple[str, ...]) -> Tuple[str, Callable[[dict], tuple]]:
+    # One per stat key layout (nearly always the same one): the Base Profile
+    # line as a %-template and a getter for the shown stats in STAT_ORDER, so
+    # formatting a seed is a single % over one tuple.
+    shown = [key for key in STAT_ORDER if key in keys]
+    template = " • ".join(f"{key} %s" for key in shown) + "\n"
+    if len(shown) > 1:
+        return template, operator.itemgetter(*shown)
+    return template, lambda stats: tuple(stats[key] for key in shown)
 
 
 def _summarize_physical_details(
@@ -45,23 +58,40 @@ def _summarize_physical_details(
         A formatted string detailing the physical traits and held item, or a default
         message if no details are available.
     """
-    parts = []
     if physical_traits:
-        parts.append(f"Physical Traits: {', '.join(physical_traits)}")
-    if held_item:
-        parts.append(f"Observed carrying: {held_item}")
+        traits = "Physical Traits: " + ", ".join(physical_traits)
+        return f"{traits}\nObserved carrying: {held_item}" if held_item else traits
+    return f"Observed carrying: {held_item}" if held_item else _NO_DETAILS
+
+
+@functools.lru_cache(maxsize=None)
+def _type_line(primary_type: str, secondary_type: str | None) -> str:
+    # One per type pair: the dual-type label never changes for a pair.
+    if not secondary_type:
+        return f"  -Type: {primary_type}"
+    # prefer adjective-noun formatting for readability
+    formatted = format_dual_type(primary_type, secondary_type, style="adj-n")
+    return f"  -Types: {formatted} ({primary_type}/{secondary_type})"
 
-    if not parts:
-        return "Distinctive features have not yet been documented."
 
-    return "\n".join(parts)
+@functools.lru_cache(maxsize=4096)
+def _mutagen_line(major: Tuple[str, ...], utility: Tuple[str, ...]) -> str:
+    # Mutagen lists repeat across a dex, so their (list repr) line is cached.
+    parts = []
+    if major:
+        parts.append(f"Documented Near-Lumen Mutagen: {list(major)}")
+    if utility:
+        parts.append(f"Known Utility: {list(utility)}")
+    return " | ".join(parts)
 
 
 def dex_formatter(seed: MonsterSeed) -> str:
     """
     Summary:
         Main formatter that takes a fully prepared MonsterSeed and returns a
-        Pokédex-style text block.
+        Pokédex-style text block. The type line is built once per type pair
+        and the entry is assembled in a single format, so large dex dumps
+        spend little time here.
 
     Args:
         seed: The MonsterSeed object to format.
@@ -69,135 +99,106 @@ def dex_formatter(seed: MonsterSeed) -> str:
     Returns:
         A string containing the formatted Pokédex-style entry.
     """
-    idnum = seed.idnum
-    name = seed.name
-    form = seed.form
-    habitat = seed.habitat
-    primary_type = seed.primary_type
-    secondary_type = seed.secondary_type
     mutagens = seed.mutagens
-    traits_line = _summarize_physical_details(seed.physical_traits, seed.held_item)
-    stat_line = _summarize_stats(seed.stats)
-    # Simple tags summary from meta, if present
-    tags = seed.meta.get("tags", []) or []
-    resist = seed.meta.get("resist", []) or []
-    weak = seed.meta.get("weak", []) or []
-
-    tags_str = ", ".join(tags)
-    resist_str = ", ".join(resist)
-    weak_str = ", ".join(weak)
-
-    # Build the final entry text
-    lines = []
-    sep_line = f"{'-' * 60}"
-	
-    lines.append(sep_line)
-    lines.append("")
-    header_line = f"#{idnum:03d}: '{name}' --- a(n) {form} monster"
-    lines.append(header_line)
-    lines.append("")
-
-    # Type (use formatted dual-type when available)
-    if not secondary_type:
-        type_line = f"  -Type: {primary_type}"
-    else:
-        # prefer adjective-noun formatting for readability
-        formatted = format_dual_type(primary_type, secondary_type, style="adj-n")
-        type_line = f"  -Types: {formatted} ({primary_type}/{secondary_type})"
-    lines.append(type_line)
-    lines.append("")
-
-    # Mutagens
-    mutagen_lines = []
-    if mutagens["major"]:
-        mutagen_lines.append(f"Documented Near-Lumen Mutagen: {mutagens['major']}")
-    if mutagens["utility"]:
-        mutagen_lines.append(f"Known Utility: {mutagens['utility']}")
-    lines.append(" | ".join(mutagen_lines))
-    lines.append("\n")  # blank line
-
-    # Stats
-    lines.append(f"Base Profile: {stat_line}")
-    lines.append("\n")
-
-    # Flavor text
-    habitat_line = f"Habitat: {habitat}"
-    lines.append(habitat_line)
-    lines.append("\n")
-    lines.append(traits_line)
+    text = (
+        f"{_SEP_LINE}\n\n#{seed.idnum:03d}: '{seed.name}' --- a(n) {seed.form} monster\n\n"
+        f"{_type_line(seed.primary_type, seed.secondary_type)}\n\n"
+        f"{_mutagen_line(tuple(mutagens['major']), tuple(mutagens['utility']))}\n\n\n"
+        f"Base Profile: {_summarize_stats(seed.stats)}\n\n\nHabitat: {seed.habitat}\n\n\n"
+        f"{_summarize_physical_details(seed.physical_traits, seed.held_item)}"
+    )
 
     # Optional meta info
-    if tags_str or resist_str or weak_str:
-        lines.append("")
-        if tags_str:
-            lines.append(f"Tags: {tags_str}")
-        if resist_str:
-            lines.append(f"Resists: {resist_str}")
-        if weak_str:
-            lines.append(f"Weak To: {weak_str}")
+    meta = seed.meta
+    tags = meta.get("tags", []) or []
+    resist = meta.get("resist", []) or []
+    weak = meta.get("weak", []) or []
+    if tags or resist or weak:
+        text += "\n"
+        if tags:
+            text += "\nTags: " + ", ".join(tags)
+        if resist:
+            text += "\nResists: " + ", ".join(resist)
+        if weak:
+            text += "\nWeak To: " + ", ".join(weak)
+    return text
+
+
+def write_dex_entries(
+    seeds: Iterable[MonsterSeed], out: IO[str], separator: str = DEX_SEPARATOR
+) -> int:
+    """
+    Summary:
+        Formats many seeds straight into one text stream (e.g. an io.StringIO or
+        an open file), exactly as sink(txt=...) writes them: entries joined with
+        `separator` and, if any were written, a final newline.
 
-    return "\n".join(lines)
+    Args:
+        seeds: The MonsterSeed objects to format, in order.
+        out: Text stream to write to.
+        separator: Text written between two entries.
+
+    Returns:
+        The number of entries written.
+    """
+    write = out.write
+    count = 0
+    for seed in seeds:
+        if count:
+            write(separator)
+        write(dex_formatter(seed))
+        count += 1
+    if count:
+        write("\n")
+    return count
+
+
+def render_dex_entries(seeds: Iterable[MonsterSeed], separator: str = DEX_SEPARATOR) -> str:
+    """
+    Summary:
+        Formats many seeds into one string through a single buffer; see
+        write_dex_entries().
+    """
+    buffer = io.StringIO()
+    write_dex_entries(seeds, buffer, separator)
+    return buffer.getvalue()
 
 
 def generate_dex_batch(
-    count: int, major_count: int, util_count: int, output_path: str
+    count: int,
+    major_count: int,
+    util_count: int,
+    output_path: str,
+    collect: bool = True,
 ) -> list[str]:
     """
     Summary:
         Forges a batch of monsters, formats each as a Dex entry, and optionally
-        writes them to a text file.
+        writes them to a text file. Each entry is written (and its seed saved to
+        the cache) as soon as it is made, so an interrupted run keeps its output.
 
     Args:
         count: The number of monsters to generate.
         major_count: The number of major mutagens for each monster.
         util_count: The number of utility mutagens for each monster.
         output_path: The path to the file to save the entries to.
+        collect: Also return the entries. Pass False for very large runs so
+            memory use doesn't grow with `count`.
 
     Returns:
-        A list of strings, where each string is a formatted dex entry.
+        A list of strings, where each string is a formatted dex entry (empty
+        when `collect` is False).
     """
-    entries: list[str] = []
-
-    for i in range(count):
-        dex_number = i + 1
-        seed = None
-        while seed is None:
-            try:
-                primary_type, secondary_type = choose_type_pair(secondary_chance=0.5)
-                seed = forge_seed_monster(
-                    idnum=dex_number,
-                    primary_type=primary_type,
-                    secondary_type=secondary_type,
-                )
-            except ValueError:
-                continue
-
-        # Layer 2: apply mutagens to flesh out stats/mutagens/meta
-        full_seed = apply_mutagens(
-            seed,
-            major_count=major_count,
-            util_count=util_count,
-        )
-
-        # Turn the fully-forged seed into Dex text
-        entry_text = dex_formatter(full_seed)
-        save_monster(full_seed)  # Also save the generated seed to the JSONL cache
-        entries.append(entry_text)
-
-    # If the caller gave us a path, write everything to disk
-    if output_path is not None:
-        path = Path(output_path)
-        path.parent.mkdir(parents=True, exist_ok=True)
-
-        with path.open("a", encoding="utf-8") as f:
-            for idx, entry in enumerate(entries):
-                f.write(entry)
-                f.write("\n")  # newline after each entry
-                if idx != len(entries) - 1:
-                    # divider between entries, but not after the last one
-                    f.write("-" * 60 + "\n\n")
-
-    return entries
+    from .pipeline import Spec, dex_text, mutate, sink, source
+
+    run = (
+        source(Spec(secondary_chance=0.5), count)
+        | mutate(major_count, util_count)
+        | dex_text()
+        # Also save each generated seed to the JSONL cache; divider between entries.
+        | sink(txt=output_path, cache=True, separator="\n" + "-" * 60 + "\n\n")
+    )
+    return [item.text for item in run if collect]
 
 
 if __name__ == "__main__":
@@ -1240,7 +1240,8 @@ def forge_monster_name(seed: MonsterSeed, salt: str = "") -> str:
     end_pool = flavor.get("suffixes", [])
 
     if secondary and secondary in _TYPE_FLAVORS:
-        mid_pool += _TYPE_FLAVORS[secondary].get("stems", [])
+        # Build a new list: `+=` would grow the primary type's shared stem list on every call.
+        mid_pool = mid_pool + _TYPE_FLAVORS[secondary].get("stems", [])
 
     begin = rng.choice(begin_pool) if begin_pool else ""
     mid = rng.choice(mid_pool) if mid_pool else ""
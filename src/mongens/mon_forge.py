@@ -2,11 +2,10 @@ from __future__ import annotations
 
 import os
 import random
-from typing import Any, List, Optional, Dict
+from typing import Any, FrozenSet, List, Optional, Dict, Tuple
 
 from . import monster_cache
-from .data.data import MAJOR_MODS, UTILITY_MODS
-from .forge_name import forge_monster_name
+from .data import data
 from .monsterseed import MonsterSeed
 
 
@@ -54,6 +53,75 @@ def rarity_to_weight(rarity_val: Any, alpha: float = RARITY_ALPHA) -> float:
     return 1.0 / (r ** float(alpha))
 
 
+def _mutagen_pools() -> Dict[str, Tuple[Tuple[str, float, FrozenSet[str], Dict[str, float]], ...]]:
+    """
+    Summary:
+        Precomputes the per-mutagen inputs apply_mutagens() filters and weights on,
+        so rarity weights and type lists are not re-derived for every monster.
+
+    Returns:
+        A dict with 'major' and 'utility' pools, each a tuple of
+        (key, rarity weight, incompatible types, synergy bonuses) in data order.
+    """
+    pools = {}
+    for bucket, mods in (("major", data.MAJOR_MODS), ("utility", data.UTILITY_MODS)):
+        pools[bucket] = tuple(
+            (
+                key,
+                rarity_to_weight(mod_def.get("rarity", 1.0)),
+                frozenset(mod_def.get("incompatible_types", []) or []),
+                {t: float(v) for t, v in (mod_def.get("synergy_bonus", {}) or {}).items()},
+            )
+            for key, mod_def in mods.items()
+        )
+    return pools
+
+
+data.register_derived(
+    "mutagen_pools", _mutagen_pools, depends_on=("MAJOR_MODS", "UTILITY_MODS")
+)
+
+
+def _eligible_mutagens(
+    bucket: str, monster_types: set, seed_mutagen_set: set
+) -> Dict[str, float]:
+    """
+    Summary:
+        Filters one mutagen pool by type compatibility and applies the
+        multiplicative type synergy to each remaining rarity weight.
+
+    Args:
+        bucket: 'major' or 'utility'.
+        monster_types: The monster's primary (and secondary) type.
+        seed_mutagen_set: Mutagens the seed already carries; these are skipped.
+
+    Returns:
+        A dict of mutagen key -> final sampling weight.
+    """
+    available: Dict[str, float] = {}
+    for key, base_w, incompatible, synergy_bonuses in data.derived("mutagen_pools")[bucket]:
+        if key in seed_mutagen_set:
+            continue
+
+        # Type gating: monster cannot have any incompatible types.
+        if not incompatible.isdisjoint(monster_types):
+            continue
+
+        # Multiplicative synergy stacking based on monster type
+        synergy_mult = 1.0
+        for monster_type in monster_types:
+            if monster_type in synergy_bonuses:
+                synergy_mult *= synergy_bonuses[monster_type]
+
+        final_w = base_w * min(synergy_mult, MAX_SYNERGY_MULT)
+        if final_w > 0.0:
+            available[key] = final_w
+            dbg(
+                f"{bucket} candidate: {key}, base_w={base_w:.6f}, synergy_mult={synergy_mult:.3f}, final_w={final_w:.6f}"
+            )
+    return available
+
+
 def forge_seed_monster(
     idnum: int, primary_type: str, secondary_type: Any
 ) -> MonsterSeed:
@@ -74,7 +142,7 @@ def forge_seed_monster(
 
 
 def weighted_sample_without_replacement(
-    weight_dict: Dict[str, float], k: int
+    weight_dict: Dict[str, float], k: int, rng: Optional[random.Random] = None
 ) -> List[str]:
     """
     Summary:
@@ -84,6 +152,7 @@ def weighted_sample_without_replacement(
     Args:
         weight_dict: A dictionary where keys are the items to sample and values are their weights.
         k: The number of items to sample.
+        rng: Random source to draw from (defaults to the global `random` module).
 
     Returns:
         A list of the selected keys. The length of the list may be less than k
@@ -107,7 +176,7 @@ def weighted_sample_without_replacement(
         if total <= 0:
             dbg("weighted_sample: total weight <= 0; stopping early")
             break
-        r = random.random() * total
+        r = (rng or random).random() * total
         upto = 0.0
         picked_idx = None
         for idx, w in enumerate(weights):
@@ -130,6 +199,7 @@ def apply_mutagens(
     seed: MonsterSeed,
     major_count: int = 0,
     util_count: int = 0,
+    rng: Optional[random.Random] = None,
 ) -> MonsterSeed:
     """
     Summary:
@@ -141,6 +211,7 @@ def apply_mutagens(
         seed: The MonsterSeed object to modify.
         major_count: The number of major mutagens to apply.
         util_count: The number of utility mutagens to apply.
+        rng: Random source to draw from (defaults to the global `random` module).
 
     Returns:
         The modified MonsterSeed object with the new mutagens applied.
@@ -167,65 +238,16 @@ def apply_mutagens(
     dbg("seed_mutagen_set:", seed_mutagen_set)
 
     # --- Filter Available Mutagens (with synergy multiplier) ---
-    available_majors: Dict[str, float] = {}
-    for key, mod_def in MAJOR_MODS.items():
-        if key in seed_mutagen_set:
-            continue
-
-        incompatible = mod_def.get("incompatible_types", []) or []
-
-        # Type gating: monster cannot have any incompatible types.
-        if any(t in monster_types for t in incompatible):
-            continue
-
-        base_w = rarity_to_weight(mod_def.get("rarity", 1.0))
-        # Multiplicative synergy stacking based on monster type
-        synergy_mult = 1.0
-        synergy_bonuses = mod_def.get("synergy_bonus", {})
-        for monster_type in monster_types:
-            if monster_type in synergy_bonuses:
-                synergy_mult *= float(synergy_bonuses[monster_type])
-
-        final_w = base_w * min(synergy_mult, MAX_SYNERGY_MULT)
-        if final_w > 0.0:
-            available_majors[key] = final_w
-            dbg(
-                f"major candidate: {key}, base_w={base_w:.6f}, synergy_mult={synergy_mult:.3f}, final_w={final_w:.6f}"
-            )
-
-    available_utilities = {}
-    for key, mod_def in UTILITY_MODS.items():
-        if key in seed_mutagen_set:
-            continue
-
-        incompatible = mod_def.get("incompatible_types", []) or []
-
-        # Type gating: monster cannot have any incompatible types.
-        if any(t in monster_types for t in incompatible):
-            continue
-
-        base_w = rarity_to_weight(mod_def.get("rarity", 1.0))
-        # Multiplicative synergy stacking based on monster type
-        synergy_mult = 1.0
-        synergy_bonuses = mod_def.get("synergy_bonus", {})
-        for monster_type in monster_types:
-            if monster_type in synergy_bonuses:
-                synergy_mult *= float(synergy_bonuses[monster_type])
-
-        final_w = base_w * min(synergy_mult, MAX_SYNERGY_MULT)
-        if final_w > 0.0:
-            available_utilities[key] = final_w
-            dbg(
-                f"util candidate: {key}, base_w={base_w:.6f}, synergy_mult={synergy_mult:.3f}, final_w={final_w:.6f}"
-            )
+    available_majors = _eligible_mutagens("major", monster_types, seed_mutagen_set)
+    available_utilities = _eligible_mutagens("utility", monster_types, seed_mutagen_set)
 
     dbg("available_majors:", available_majors)
     dbg("available_utilities:", available_utilities)
 
     # --- Select Mutagens using weighted sampling without replacement ---
-    chosen_majors = weighted_sample_without_replacement(available_majors, major_count)
+    chosen_majors = weighted_sample_without_replacement(available_majors, major_count, rng)
     chosen_utilities = weighted_sample_without_replacement(
-        available_utilities, util_count
+        available_utilities, util_count, rng
     )
 
     dbg("chosen_majors:", chosen_majors)
@@ -235,36 +257,48 @@ def apply_mutagens(
     seed.mutagens["major"].extend(chosen_majors)
     seed.mutagens["utility"].extend(chosen_utilities)
 
-    def apply_one(mod_def: dict):
-        # multiplicative adjustments
-        for stat, mult in mod_def.get("mul", {}).items():
-            if stat in seed.stats:
-                seed.stats[stat] = int(round(seed.stats[stat] * mult))
-        # additive adjustments
-        for stat, add in mod_def.get("add", {}).items():
-            if stat in seed.stats and isinstance(add, (int, float)):
-                seed.stats[stat] += int(round(add))
-        # tags/resists/weaknesses
-        for tag in mod_def.get("tags", []):
-            if isinstance(tag, str) and tag.startswith("Resist:"):
-                seed.meta.setdefault("resist", []).append(tag.split(":", 1)[1])
-            elif isinstance(tag, str) and tag.startswith("Weak:"):
-                seed.meta.setdefault("weak", []).append(tag.split(":", 1)[1])
-            else:
-                seed.meta.setdefault("tags", []).append(tag)
-
     for key in chosen_majors:
-        mod_def = MAJOR_MODS.get(key)
+        mod_def = data.MAJOR_MODS.get(key)
         if mod_def:
-            apply_one(mod_def)
+            apply_mutagen_effects(seed.stats, seed.meta, mod_def)
     for key in chosen_utilities:
-        mod_def = UTILITY_MODS.get(key)
+        mod_def = data.UTILITY_MODS.get(key)
         if mod_def:
-            apply_one(mod_def)
+            apply_mutagen_effects(seed.stats, seed.meta, mod_def)
 
     return seed
 
 
+def apply_mutagen_effects(stats: Dict[str, int], meta: Dict[str, Any], mod_def: Dict[str, Any]) -> None:
+    """
+    Summary:
+        Applies one mutagen's effects in place: its stat multipliers, then its
+        stat additions, then its tags (Resist:/Weak: tags go to meta's resist
+        and weak lists, the rest to tags).
+
+    Args:
+        stats: The stats to adjust.
+        meta: The meta dict to add tags to.
+        mod_def: The mutagen's definition from data.MAJOR_MODS or data.UTILITY_MODS.
+    """
+    # multiplicative adjustments
+    for stat, mult in mod_def.get("mul", {}).items():
+        if stat in stats:
+            stats[stat] = int(round(stats[stat] * mult))
+    # additive adjustments
+    for stat, add in mod_def.get("add", {}).items():
+        if stat in stats and isinstance(add, (int, float)):
+            stats[stat] += int(round(add))
+    # tags/resists/weaknesses
+    for tag in mod_def.get("tags", []):
+        if isinstance(tag, str) and tag.startswith("Resist:"):
+            meta.setdefault("resist", []).append(tag.split(":", 1)[1])
+        elif isinstance(tag, str) and tag.startswith("Weak:"):
+            meta.setdefault("weak", []).append(tag.split(":", 1)[1])
+        else:
+            meta.setdefault("tags", []).append(tag)
+
+
 def generate_monster(
     idnum: int,
     primary_type: str,
@@ -279,21 +313,24 @@ def generate_monster(
     Args:
         idnum: The ID number for the new monster.
         primary_type: The primary type of the monster.
-        secondary_type: The optional secondary type of the monster.
+        secondary_type: The optional secondary type of the monster; if None, one
+            may be rolled at random.
         major_count: The number of major mutagens to apply.
         util_count: The number of utility mutagens to apply.
 
     Returns:
         A fully generated MonsterSeed object, including a name and applied mutagens.
     """
-    generic = forge_seed_monster(idnum, primary_type, secondary_type)
-    seed_with_mutagens = apply_mutagens(generic, major_count, util_count)
-    seed_with_name = forge_monster_name(seed_with_mutagens)
+    from .pipeline import Spec, forge_monster
+
+    seed = forge_monster(
+        Spec(primary_type, secondary_type or "random"), major_count, util_count, idnum=idnum
+    )
 
     # Save the completed monster to the cache and embed the ID
-    monster_cache.save_monster(seed_with_name)
+    monster_cache.save_monster(seed)
 
-    return seed_with_name
+    return seed
 
 
 """
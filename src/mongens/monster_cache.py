@@ -1,15 +1,49 @@
 from dataclasses import asdict, is_dataclass
+import copy
+import functools
 import json
+import os
 import random
 import string
 from pathlib import Path
-from typing import Type
+from typing import IO, Any, Dict, Iterable, List, Mapping, Optional, Tuple, Type
 
+from .data import data
 from .monsterseed import MonsterSeed
+from .pipeline import GENERATOR_VERSION, rebuild
 
 CACHE_FILE = Path(__file__).parent / "assets" / "generated_monsters.jsonl"
 OUTPUT_PATH = Path(__file__).parent / "assets" / "generated_monsters.txt"
 
+# Compact records keep only what is needed to rebuild a monster, not the monster:
+#   {"meta": {"unique_id": PIN}, "compact": {"generator": GENERATOR_VERSION,
+#    "data": <data source hash prefix>, "origin": {...}, "overrides": {field: value}}}
+# "origin" is the seed's meta['origin'] (run seed, index, spec, stages) and
+# "overrides" holds every field that differs from the rebuilt monster, e.g. a
+# renamed or hand-edited one. MONGENS_CACHE_MODE=compact makes it the default.
+COMPACT = os.environ.get("MONGENS_CACHE_MODE", "full") == "compact"
+# Rebuilt monsters kept in memory, so repeated loads of a PIN skip the forge.
+REBUILD_CACHE_SIZE = 1024
+# Hex digits of the data hash kept in a compact record; enough to tell data apart.
+DATA_HASH_DIGITS = 16
+
+_data_hash: Tuple[int, Optional[str]] = (-1, None)  # (DATA_VERSION, source hash)
+
+# Byte offset of each cached monster's line, keyed by unique_id. Built on the first
+# lookup and extended as the cache file grows, so long-running processes (e.g.
+# `mongen serve`) don't rescan the whole file for every load_monster().
+_INDEX: Dict[str, int] = {}
+_index_file: Optional[Tuple[Path, int, int]] = None  # (path, st_dev, st_ino) indexed
+_index_end = 0  # offset just past the last complete line indexed
+
+# Reroll lineage, kept up to date with _INDEX from each record's meta['lineage']
+# ({"parent_id", "root_id", "generation"}, set by reroll.reroll()). A family is a
+# root monster and every reroll descended from it.
+_CHILDREN: Dict[str, List[str]] = {}  # parent PIN -> child PINs, in save order
+_GENERATION: Dict[str, int] = {}  # PIN -> generation (0 for a root); family members only
+_ROOT: Dict[str, str] = {}  # PIN -> root PIN; family members only
+_LATEST: Dict[str, str] = {}  # root PIN -> most recently saved member of its family
+
 
 def generate_id(length: int = 10) -> str:
     """
@@ -43,7 +77,292 @@ def _iter_cache():
                     print(f"Warning: Skipping malformed line in cache: {line.strip()}")
 
 
-def save_monster(seed: MonsterSeed) -> str:
+def _refresh_index() -> None:
+    """
+    Summary:
+        Brings the unique_id index up to date with the cache file, reading only the
+        lines appended since the last refresh. The index is rebuilt from scratch if
+        the file was replaced or truncated.
+    """
+    global _index_file, _index_end
+    if not CACHE_FILE.exists():
+        _INDEX.clear()
+        _index_file, _index_end = None, 0
+        return
+
+    st = CACHE_FILE.stat()
+    identity = (CACHE_FILE, st.st_dev, st.st_ino)
+    if identity != _index_file or st.st_size < _index_end:
+        for index in (_INDEX, _CHILDREN, _GENERATION, _ROOT, _LATEST):
+            index.clear()
+        _index_file, _index_end = identity, 0
+    if st.st_size == _index_end:
+        return
+
+    with CACHE_FILE.open("rb") as f:
+        f.seek(_index_end)
+        offset = _index_end
+        for line in f:
+            if not line.endswith(b"\n"):
+                break  # a write in progress; pick it up next time
+            if line.strip():
+                try:
+                    record = json.loads(line)
+                    unique_id = record.get("meta", {}).get("unique_id")
+                except (json.JSONDecodeError, UnicodeDecodeError, AttributeError):
+                    print(f"Warning: Skipping malformed line in cache: {line.strip()[:80]!r}")
+                    unique_id = None
+                # First occurrence wins, as with a front-to-back scan.
+                if unique_id and unique_id not in _INDEX:
+                    _INDEX[unique_id] = offset
+                    _index_lineage(unique_id, _record_lineage(record))
+            offset += len(line)
+    _index_end = offset
+
+
+def _record_lineage(record: Mapping[str, Any]) -> Optional[Mapping[str, Any]]:
+    # Compact records keep a rerolled monster's meta (lineage included) in overrides.
+    meta = record.get("meta", {})
+    if "compact" in record:
+        meta = record["compact"].get("overrides", {}).get("meta", meta)
+    lineage = meta.get("lineage")
+    return lineage if isinstance(lineage, Mapping) and lineage.get("parent_id") else None
+
+
+def _index_lineage(unique_id: str, lineage: Optional[Mapping[str, Any]]) -> None:
+    if lineage is None:
+        return
+    parent = lineage["parent_id"]
+    root = _ROOT.get(parent) or lineage.get("root_id") or parent
+    if parent not in _ROOT:
+        # The parent starts a family, or its own record was pruned; a pruned
+        # parent hangs off the root so the family stays one tree.
+        _ROOT[parent] = root
+        _GENERATION[parent] = max(int(lineage.get("generation", 1)) - 1, 0)
+        if parent != root:
+            _ROOT.setdefault(root, root)
+            _GENERATION.setdefault(root, 0)
+            _CHILDREN.setdefault(root, []).append(parent)
+    _CHILDREN.setdefault(parent, []).append(unique_id)
+    _ROOT[unique_id] = root
+    _GENERATION[unique_id] = int(lineage.get("generation", _GENERATION[parent] + 1))
+    _LATEST[root] = unique_id
+
+
+def lineage(unique_id: str) -> Dict[str, Any]:
+    """
+    Summary:
+        The reroll family a cached monster belongs to, read from the lineage
+        index in time proportional to the family's size (no cache scan).
+
+    Args:
+        unique_id: The PIN of any member of the family.
+
+    Returns:
+        A dict with the family's "root" PIN, its "latest" (most recently saved)
+        member, and "members": (PIN, parent PIN or None, generation, cached)
+        tuples in depth-first order from the root, children in save order;
+        `cached` is False for members whose record was pruned. A monster that
+        was never rerolled is a family of one.
+
+    Raises:
+        KeyError: If no monster with the given ID is found in the cache.
+    """
+    _refresh_index()
+    if unique_id not in _INDEX and unique_id not in _ROOT:
+        raise KeyError(f"Monster with ID '{unique_id}' not found in cache.")
+    root = _ROOT.get(unique_id, unique_id)
+    members: List[Tuple[str, Optional[str], int, bool]] = []
+    stack: List[Tuple[str, Optional[str]]] = [(root, None)]
+    while stack:
+        pin, parent = stack.pop()
+        members.append((pin, parent, _GENERATION.get(pin, 0), pin in _INDEX))
+        stack.extend((child, pin) for child in reversed(_CHILDREN.get(pin, [])))
+    return {"root": root, "latest": _LATEST.get(root, root), "members": members}
+
+
+def prune_lineages() -> int:
+    """
+    Summary:
+        Compacts the cache to the latest variant of each reroll family: every
+        family member other than its most recently saved one is dropped.
+        Monsters that were never rerolled, and lines that cannot be parsed, are
+        kept as they are. The file is rewritten atomically.
+
+    Returns:
+        The number of records removed.
+    """
+    _refresh_index()
+    # Records are dropped by their indexed offset, so only the lines the index
+    # resolved (first occurrence of a PIN) are touched and no line is re-parsed.
+    drop = {_INDEX[pin] for pin, root in _ROOT.items() if _LATEST[root] != pin and pin in _INDEX}
+    if not drop:
+        return 0
+
+    tmp = CACHE_FILE.with_name(CACHE_FILE.name + ".tmp")
+    with CACHE_FILE.open("rb") as src, tmp.open("wb") as dst:
+        offset = 0
+        for line in src:
+            if offset not in drop:
+                dst.write(line)
+            offset += len(line)
+        dst.flush()
+        os.fsync(dst.fileno())
+    os.replace(tmp, CACHE_FILE)
+    _refresh_index()
+    return len(drop)
+
+
+def _record_origin(line: bytes) -> Optional[Mapping[str, Any]]:
+    try:
+        record = json.loads(line)
+    except ValueError:
+        return None
+    if not isinstance(record, Mapping):
+        return None
+    origin = record["compact"].get("origin") if "compact" in record else record.get("meta", {}).get("origin")
+    return origin if isinstance(origin, Mapping) else None
+
+
+def discard_run_records(offset: int, run_seeds: Iterable[int], path: Optional[Path] = None) -> int:
+    """
+    Summary:
+        Removes the records a generation run saved after `offset` (e.g. its last
+        checkpoint), so resuming it does not save them twice. Only records whose
+        meta['origin'] run seed is one of `run_seeds` are removed; records other
+        commands appended in the meantime are kept, as is everything before
+        `offset`. An unterminated last line (a write cut short) is removed too.
+        The file is rewritten atomically, and only if something is removed.
+
+    Args:
+        offset: Byte offset up to which the cache is left untouched.
+        run_seeds: The run seeds of the run's jobs.
+        path: The cache file (default: CACHE_FILE).
+
+    Returns:
+        The number of lines removed.
+
+    Raises:
+        ValueError: If the file is shorter than `offset`.
+    """
+    path = Path(path) if path is not None else CACHE_FILE
+    actual = path.stat().st_size if path.exists() else 0
+    if actual < offset:
+        raise ValueError(f"{path} is shorter ({actual:,} bytes) than at the checkpoint ({offset:,} bytes)")
+    if actual == offset:
+        return 0
+    seeds = set(run_seeds)
+    with path.open("rb") as f:
+        f.seek(offset)
+        tail = f.read().splitlines(keepends=True)
+    kept = []
+    for line in tail:
+        origin = _record_origin(line) if line.endswith(b"\n") else None
+        if not line.endswith(b"\n") or (origin is not None and origin.get("run_seed") in seeds):
+            continue
+        kept.append(line)
+    removed = len(tail) - len(kept)
+    if not removed:
+        return 0
+
+    tmp = path.with_name(path.name + ".tmp")
+    with path.open("rb") as src, tmp.open("wb") as dst:
+        remaining = offset
+        while remaining:
+            chunk = src.read(min(remaining, 1 << 20))
+            dst.write(chunk)
+            remaining -= len(chunk)
+        dst.writelines(kept)
+        dst.flush()
+        os.fsync(dst.fileno())
+    os.replace(tmp, path)
+    _refresh_index()
+    return removed
+
+
+def data_hash() -> Optional[str]:
+    """
+    Summary:
+        The source hash of the loaded data (see data.source_hash()), computed once
+        per data reload. None when the data files are not present to hash.
+    """
+    global _data_hash
+    if _data_hash[0] != data.DATA_VERSION:
+        _data_hash = (data.DATA_VERSION, data.source_hash())
+    return _data_hash[1]
+
+
+@functools.lru_cache(maxsize=REBUILD_CACHE_SIZE)
+def _rebuilt(origin_key: str, digest: str) -> MonsterSeed:
+    # Keyed on the data hash too, so a data reload never serves a stale monster.
+    # Callers get a copy; the cached seed is never handed out.
+    return rebuild(json.loads(origin_key))
+
+
+def _rebuild_cached(origin: Mapping[str, Any], digest: str) -> MonsterSeed:
+    return copy.deepcopy(_rebuilt(json.dumps(origin, sort_keys=True), digest))
+
+
+def _compact_record(seed: MonsterSeed, unique_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Summary:
+        Builds the compact record for a seed, or returns None if the seed has no
+        origin to rebuild it from or the loaded data cannot be hashed.
+    """
+    origin = seed.meta.get("origin")
+    digest = data_hash()
+    if not isinstance(origin, Mapping) or digest is None:
+        return None
+    try:
+        base = asdict(_rebuild_cached(origin, digest))
+    except (ValueError, KeyError, TypeError):
+        return None
+
+    full = asdict(seed)
+    overrides = {key: value for key, value in full.items() if key != "meta" and value != base[key]}
+    meta = {key: value for key, value in full["meta"].items() if key != "unique_id"}
+    if meta != base["meta"]:
+        overrides["meta"] = meta
+    compact: Dict[str, Any] = {
+        "generator": GENERATOR_VERSION,
+        "data": digest[:DATA_HASH_DIGITS],
+        "origin": origin,
+    }
+    if overrides:
+        compact["overrides"] = overrides
+    return {"meta": {"unique_id": unique_id}, "compact": compact}
+
+
+def _expand(record: Mapping[str, Any], unique_id: str) -> MonsterSeed:
+    """
+    Summary:
+        Rebuilds the MonsterSeed a compact record stands for.
+
+    Raises:
+        ValueError: If the record was written by another generator version or
+            against other data, where rebuilding it would give another monster.
+    """
+    compact = record["compact"]
+    if compact.get("generator") != GENERATOR_VERSION:
+        raise ValueError(
+            f"Monster '{unique_id}' was stored compactly by generator version "
+            f"{compact.get('generator')}; this is version {GENERATOR_VERSION} and cannot rebuild it."
+        )
+    digest = data_hash()
+    if not digest or compact.get("data") != digest[:DATA_HASH_DIGITS]:
+        raise ValueError(
+            f"Monster '{unique_id}' was stored compactly against data {str(compact.get('data'))[:12]}, "
+            f"but the loaded data is {(digest or 'unhashed')[:12]}. Load it with the data it was "
+            "generated from, or keep such monsters as full records (save_monster(compact=False))."
+        )
+    seed = _rebuild_cached(compact["origin"], digest)
+    for key, value in compact.get("overrides", {}).items():
+        setattr(seed, key, value)
+    seed.meta["unique_id"] = unique_id
+    return seed
+
+
+def save_monster(seed: MonsterSeed, compact: Optional[bool] = None) -> str:
     """
     Summary:
         Appends a monster seed to the JSONL cache file and returns its unique ID.
@@ -51,10 +370,38 @@ def save_monster(seed: MonsterSeed) -> str:
 
     Args:
         seed: The MonsterSeed object to save.
+        compact: Store a compact record (how to rebuild the seed, plus any fields
+            that differ from the rebuilt one) instead of the full seed. Seeds
+            without meta['origin'], or with data that cannot be hashed, are
+            stored in full. Defaults to COMPACT.
 
     Returns:
         The unique ID of the saved monster.
     """
+    CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with CACHE_FILE.open("a", encoding="utf-8") as f:
+        return _write_record(f, seed, compact)
+
+
+def save_monsters(seeds: Iterable[MonsterSeed], compact: Optional[bool] = None) -> List[str]:
+    """
+    Summary:
+        Appends many monster seeds to the cache through one buffered write and
+        returns their unique IDs in order. Same records as save_monster().
+
+    Args:
+        seeds: The MonsterSeed objects to save.
+        compact: As for save_monster().
+
+    Returns:
+        The unique IDs of the saved monsters.
+    """
+    CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with CACHE_FILE.open("a", encoding="utf-8") as f:
+        return [_write_record(f, seed, compact) for seed in seeds]
+
+
+def _write_record(f: IO[str], seed: MonsterSeed, compact: Optional[bool]) -> str:
     if not is_dataclass(seed):
         raise TypeError("Can only save dataclass objects like MonsterSeed.")
 
@@ -67,18 +414,23 @@ def save_monster(seed: MonsterSeed) -> str:
         unique_id = generate_id()
         seed.meta["unique_id"] = unique_id
 
-    CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with CACHE_FILE.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(asdict(seed), ensure_ascii=False))
-        f.write("\n")
+    record = None
+    if COMPACT if compact is None else compact:
+        record = _compact_record(seed, unique_id)
 
+    if record is not None:
+        f.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+    else:
+        f.write(json.dumps(asdict(seed), ensure_ascii=False))
+    f.write("\n")
     return unique_id
 
 
 def load_monster(unique_id: str) -> MonsterSeed:
     """
     Summary:
-        Loads a monster seed from the cache by its unique ID.
+        Loads a monster seed from the cache by its unique ID, rebuilding it if
+        it was stored as a compact record.
 
     Args:
         unique_id: The unique ID of the monster to load.
@@ -88,17 +440,64 @@ def load_monster(unique_id: str) -> MonsterSeed:
 
     Raises:
         KeyError: If no monster with the given ID is found in the cache.
-        ValueError: If the cached data cannot be reconstructed into a MonsterSeed object.
+        ValueError: If the cached data cannot be reconstructed into a MonsterSeed object,
+            or a compact record was stored against other data or generator version.
     """
     monster_data = None
-    for data in _iter_cache():
-        if data.get("meta", {}).get("unique_id") == unique_id:
-            monster_data = data
-            break
+    _refresh_index()
+    offset = _INDEX.get(unique_id)
+    if offset is not None:
+        with CACHE_FILE.open("rb") as f:
+            f.seek(offset)
+            monster_data = json.loads(f.readline())
 
     if not monster_data:
         raise KeyError(f"Monster with ID '{unique_id}' not found in cache.")
 
+    return _from_record(monster_data, unique_id)
+
+
+def load_monsters(unique_ids: Iterable[str]) -> Tuple[Dict[str, MonsterSeed], Dict[str, str]]:
+    """
+    Summary:
+        Loads many monster seeds in one pass over the cache: the IDs are looked up
+        in the index and their lines read in file order through a single handle.
+
+    Args:
+        unique_ids: The unique IDs of the monsters to load; repeats are loaded once.
+
+    Returns:
+        A tuple of (unique ID -> MonsterSeed, in first-seen order) for the monsters
+        loaded and (unique ID -> reason) for those that were not, with the KeyError
+        or ValueError message load_monster() would have raised.
+    """
+    _refresh_index()
+    wanted = list(dict.fromkeys(unique_ids))
+    records: Dict[str, Any] = {}
+    failed: Dict[str, str] = {}
+    located = sorted((_INDEX[uid], uid) for uid in wanted if uid in _INDEX)
+    if located:
+        with CACHE_FILE.open("rb") as f:
+            for offset, uid in located:
+                f.seek(offset)
+                records[uid] = json.loads(f.readline())
+
+    seeds: Dict[str, MonsterSeed] = {}
+    for uid in wanted:
+        if uid not in records:
+            failed[uid] = f"Monster with ID '{uid}' not found in cache."
+            continue
+        try:
+            seeds[uid] = _from_record(records[uid], uid)
+        except ValueError as e:
+            failed[uid] = str(e)
+    return seeds, failed
+
+
+def _from_record(monster_data: Dict[str, Any], unique_id: str) -> MonsterSeed:
+    if "compact" in monster_data:
+        return _expand(monster_data, unique_id)
+
     # Reconstruct the MonsterSeed object from the dictionary
     try:
         return MonsterSeed(**monster_data)
@@ -6,34 +6,50 @@ that defines the fixed identity and constrained possibility space for all of its
 future MonsterInstances.
 """
 
+import hashlib
+import json
 import random
+from bisect import bisect_right
 from dataclasses import dataclass
 from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 
-from .data.data import (
-    BASE_STATS,
-    FORMS_BY_TYPE,
-    HELD_ITEMS,
-    INCOMPATIBLE_TYPE_PAIRS,
-    MAJOR_MODS,
-    PHYSICAL_TRAITS,
-    SEED_TYPES,
-    SEED_TYPES_WEIGHTED,
-    SEED_TYPE_DATA,
-    TEMPERS_COUPLED,
-    TYPE_SYNERGY_BOOSTS,
-    UTILITY_MODS,
-)
+from .data import data
 
 ChoiceList = Union[Mapping[Any, float], Iterable[Tuple[Any, float]]]
 
+# Meta keys that record where a seed came from rather than what it is.
+BOOKKEEPING_META = ("unique_id", "origin", "lineage")
+
+SINGLE_TRAIT_CHANCE = 0.75  # Chance a seed gets one physical trait rather than two
+HELD_ITEM_CHANCE = 0.4  # Chance a seed is holding an item
+
+
+def spawn_rng(run_seed: int, index: Union[int, str]) -> random.Random:
+    """Derives the independent RNG for item `index` of a seeded run.
 
-def weighted_choice(choices_with_weights: ChoiceList):
+    The (run seed, index) pair is hashed, so each item's draws depend only on
+    its own position and not on how many items were generated before it or in
+    which process.
+
+    Args:
+        run_seed: Seed of the whole run.
+        index: Position of the item within the run, or another key such as a
+            re-roll of one ("<index>#<attempt>").
+
+    Returns:
+        A new random.Random instance.
+    """
+    digest = hashlib.sha256(f"{run_seed}|{index}".encode("utf-8")).digest()
+    return random.Random(int.from_bytes(digest[:8], "big"))
+
+
+def weighted_choice(choices_with_weights: ChoiceList, rng: Optional[random.Random] = None):
     """Selects an item from a weighted list of choices.
 
     Args:
         choices_with_weights: A dictionary mapping choices to weights or an iterable
                               of (choice, weight) tuples.
+        rng: Random source to draw from (defaults to the global `random` module).
 
     Returns:
         The selected item.
@@ -43,7 +59,7 @@ def weighted_choice(choices_with_weights: ChoiceList):
                     or the total weight is not positive.
         RuntimeError: If an item fails to be selected due to a floating point edge case.
     """
-    if isinstance(choices_with_weights, dict):
+    if isinstance(choices_with_weights, Mapping):
         items_weights = list(choices_with_weights.items())
     else:
         items_weights = list(choices_with_weights)
@@ -55,7 +71,7 @@ def weighted_choice(choices_with_weights: ChoiceList):
     normalized = []
     for item, w in items_weights:
         # Support weights provided directly as numbers or as dicts containing a 'weight' key.
-        if isinstance(w, dict):
+        if isinstance(w, Mapping):
             if "weight" in w:
                 w = w["weight"]
             else:
@@ -76,7 +92,7 @@ def weighted_choice(choices_with_weights: ChoiceList):
     if total <= 0:
         raise ValueError("weighted_choice: total weight must be > 0")
 
-    r = random.random() * total
+    r = (rng or random).random() * total
     upto = 0.0
     for item, weight in normalized:
         upto += weight
@@ -99,47 +115,149 @@ def rarity_to_weight(rarity_val: Any, alpha: float = 1.0) -> float:
     return 1.0 / (r ** float(alpha))
 
 
-def choose_type_pair(
-    primary_type_override: Optional[str] = None,
+def _type_pair_space() -> Dict[str, Any]:
+    """Precomputes the legal (primary, secondary) pair space and its draw tables.
+
+    Each draw table is an (items, cumulative weights) pair in data order, so a
+    draw is one random() call and a bisect, and picks exactly what
+    weighted_choice() would pick from the same weights.
+
+    Returns:
+        A dict with:
+            primaries: Draw table of primary types.
+            secondaries: Primary type -> draw table of the secondaries it may
+                pair with (synergy-weighted), or None if there are none.
+            primaries_for: Secondary type -> draw table of the primaries it may
+                pair with (base weights), or None if there are none.
+            pairs: Frozenset of legal (primary, secondary) tuples.
+    """
+
+    def table(items_weights: Iterable[Tuple[str, Any]]) -> Optional[Tuple[Tuple[str, ...], Tuple[float, ...]]]:
+        items, cumulative, total = [], [], 0.0
+        for item, w in items_weights:
+            if isinstance(w, Mapping):
+                w = w["weight"]
+            total += float(w)
+            items.append(item)
+            cumulative.append(total)
+        return (tuple(items), tuple(cumulative)) if total > 0 else None
+
+    def legal(p: str, s: str) -> bool:
+        return p != s and frozenset([p, s]) not in data.INCOMPATIBLE_TYPE_PAIRS
+
+    base = data.SEED_TYPES_WEIGHTED
+    return {
+        "primaries": table(base.items()),
+        "secondaries": {
+            p: table(
+                (s, base.get(s, 1.0) * data.TYPE_SYNERGY_BOOSTS.get(frozenset([p, s]), 1.0))
+                for s in data.SEED_TYPES
+                if legal(p, s)
+            )
+            for p in data.SEED_TYPES
+        },
+        "primaries_for": {
+            s: table((p, w) for p, w in base.items() if legal(p, s)) for s in data.SEED_TYPES
+        },
+        "pairs": frozenset((p, s) for p in data.SEED_TYPES for s in data.SEED_TYPES if legal(p, s)),
+    }
+
+
+data.register_derived(
+    "type_pair_space", _type_pair_space, depends_on=("SEED_TYPES", "SEED_TYPES_WEIGHTED")
+)
+
+
+def _draw(table: Tuple[Tuple[str, ...], Tuple[float, ...]], rng: Optional[random.Random]) -> str:
+    items, cumulative = table
+    return items[bisect_right(cumulative, (rng or random).random() * cumulative[-1])]
+
+
+def check_type_pair(primary_type: str = "random", secondary_type: str = "random") -> None:
+    """Checks that a type constraint can be satisfied by at least one legal pair.
+
+    Args:
+        primary_type: A seed type, or "random".
+        secondary_type: A seed type, "random", or "none".
+
+    Raises:
+        ValueError: If a type is unknown, or no legal pair meets the constraint
+                    (the same type twice, an incompatible pairing, or a secondary
+                    that no primary may pair with).
+    """
+    space = data.derived("type_pair_space")
+    if primary_type != "random" and primary_type not in space["secondaries"]:
+        raise ValueError(f"Unknown primary_type: {primary_type!r}")
+    if secondary_type in ("random", "none"):
+        return
+    if secondary_type not in space["primaries_for"]:
+        raise ValueError(f"Unknown secondary_type: {secondary_type!r}")
+    if primary_type == "random":
+        if space["primaries_for"][secondary_type] is None:
+            raise ValueError(f"No primary type can be paired with secondary type {secondary_type!r}")
+    elif (primary_type, secondary_type) not in space["pairs"]:
+        if primary_type == secondary_type:
+            raise ValueError("Secondary type cannot be the same as the primary type.")
+        raise ValueError(f"Incompatible type pairing: {primary_type} and {secondary_type}")
+
+
+def sample_type_pair(
+    primary_type: str = "random",
+    secondary_type: str = "random",
     secondary_chance: float = 0.65,
+    rng: Optional[random.Random] = None,
 ) -> Tuple[str, Optional[str]]:
-    """Selects a primary and optional secondary type, respecting weights and rules.
+    """Draws a legal type pair under the given constraints, without retries.
+
+    Draws come straight from the precomputed pair space, so a pinned secondary
+    only ever meets primaries it may pair with.
 
     Args:
-        primary_type_override: If provided, this primary type is used instead of a random one.
-        secondary_chance: The probability of attempting to add a secondary type.
+        primary_type: A seed type, or "random" for a weighted draw.
+        secondary_type: A seed type, "random" for a synergy-weighted draw, or
+                        "none" for no secondary type.
+        secondary_chance: The probability of drawing a secondary type when it is "random".
+        rng: Random source to draw from (defaults to the global `random` module).
 
     Returns:
         A tuple containing the primary type and an optional secondary type.
-    """
-    # Primary type selection (use override or pick by weighted chance)
-    primary_type = (
-        primary_type_override
-        if primary_type_override
-        else weighted_choice(SEED_TYPES_WEIGHTED)
-    )
 
-    # Quickly decide not to include secondary
-    if random.random() > secondary_chance:
+    Raises:
+        ValueError: If no legal pair meets the constraints (see check_type_pair()).
+    """
+    space = data.derived("type_pair_space")
+    if secondary_type not in ("random", "none"):
+        check_type_pair(primary_type, secondary_type)
+        if primary_type == "random":
+            primary_type = _draw(space["primaries_for"][secondary_type], rng)
+        return primary_type, secondary_type
+
+    if primary_type == "random":
+        primary_type = _draw(space["primaries"], rng)
+    elif primary_type not in space["secondaries"]:
+        raise ValueError(f"Unknown primary_type: {primary_type!r}")
+    if secondary_type == "none" or (rng or random).random() > secondary_chance:
         return primary_type, None
+    candidates = space["secondaries"][primary_type]
+    return primary_type, _draw(candidates, rng) if candidates else None
 
-    # Build candidate pool respecting incompatibilities and synergy modifiers
-    candidates: Dict[str, float] = {}
-    for t in SEED_TYPES:
-        if t == primary_type:
-            continue
-        if frozenset([primary_type, t]) in INCOMPATIBLE_TYPE_PAIRS:
-            continue
 
-        base_weight = SEED_TYPES_WEIGHTED.get(t, 1.0)
-        synergy_mult = TYPE_SYNERGY_BOOSTS.get(frozenset([primary_type, t]), 1.0)
-        candidates[t] = base_weight * synergy_mult
+def choose_type_pair(
+    primary_type_override: Optional[str] = None,
+    secondary_chance: float = 0.65,
+    rng: Optional[random.Random] = None,
+) -> Tuple[str, Optional[str]]:
+    """Selects a primary and optional secondary type, respecting weights and rules.
 
-    if not candidates:
-        return primary_type, None
+    Args:
+        primary_type_override: If provided, this primary type is used instead of a random one.
+        secondary_chance: The probability of attempting to add a secondary type.
+        rng: Random source to draw from (defaults to the global `random` module).
 
-    secondary_type = weighted_choice(candidates)
-    return primary_type, secondary_type
+    Returns:
+        A tuple containing the primary type and an optional secondary type.
+    """
+    return sample_type_pair(primary_type_override or "random", "random", secondary_chance, rng)
 
 
 @dataclass
@@ -182,6 +300,7 @@ class MonsterSeed:
         primary_type: Optional[str] = None,
         secondary_type: Optional[str] = None,
         secondary_chance: float = 0.65,
+        rng: Optional[random.Random] = None,
     ) -> "MonsterSeed":
         """Factory method to create a new, properly biased MonsterSeed.
             This method orchestrates the initial creation of a monster, including
@@ -193,14 +312,18 @@ class MonsterSeed:
             primary_type: The primary type of the monster. If None, a random one is chosen.
             secondary_type: The secondary type of the monster. If None, one might be chosen based on `secondary_chance`.
             secondary_chance: The probability of adding a secondary type if one is not provided.
+            rng: Random source to draw from (defaults to the global `random` module).
 
         Returns:
             A new, fully-formed MonsterSeed object.
         """
+        rng = rng or random
+
         # Choose valid primary/secondary pair if not fully specified
-        if primary_type is None or (primary_type and secondary_type is None):
+        # (a secondary_chance of 0 means a missing secondary type stays missing).
+        if primary_type is None or (primary_type and secondary_type is None and secondary_chance > 0):
             chosen_primary, chosen_secondary = choose_type_pair(
-                primary_type, secondary_chance
+                primary_type, secondary_chance, rng
             )
             # If caller specified a primary explicitly, keep it (choose_type_pair already respects override).
             primary_type = chosen_primary if primary_type is None else primary_type
@@ -209,16 +332,16 @@ class MonsterSeed:
             )
 
         # Validate provided types
-        if primary_type not in SEED_TYPES:
+        if primary_type not in data.SEED_TYPES:
             raise ValueError(f"Unknown primary_type: {primary_type!r}")
         if secondary_type:
-            if secondary_type not in SEED_TYPES:
+            if secondary_type not in data.SEED_TYPES:
                 raise ValueError(f"Unknown secondary_type: {secondary_type!r}")
             if secondary_type == primary_type:
                 raise ValueError(
                     "Secondary type cannot be the same as the primary type."
                 )
-            if frozenset([primary_type, secondary_type]) in INCOMPATIBLE_TYPE_PAIRS:
+            if frozenset([primary_type, secondary_type]) in data.INCOMPATIBLE_TYPE_PAIRS:
                 raise ValueError(
                     f"Incompatible type pairing: {primary_type} and {secondary_type}"
                 )
@@ -227,74 +350,75 @@ class MonsterSeed:
         # Forms can be defined either inside SEED_TYPE_DATA per-type under 'forms',
         # or in the legacy FORMS_BY_TYPE mapping (type_forms.yaml). Support both.
 
-        forms_raw = SEED_TYPE_DATA.get(primary_type, {}).get(
-            "forms"
-        ) or FORMS_BY_TYPE.get(primary_type, [])
-        if isinstance(forms_raw, dict):
-            form = weighted_choice(forms_raw)
+        forms_raw = form_choices(primary_type)
+        if isinstance(forms_raw, Mapping):
+            form = weighted_choice(forms_raw, rng)
         else:
             # assume a simple list of names
-            form = random.choice(forms_raw) if forms_raw else "Unknown"
+            form = rng.choice(forms_raw) if forms_raw else "Unknown"
 
         # Habitats are now provided by SEED_TYPE_DATA per-type under the 'habitats' key.
-        habitats_raw = SEED_TYPE_DATA.get(primary_type, {}).get("habitats", {})
-        if isinstance(habitats_raw, dict):
-            habitat = weighted_choice(habitats_raw)
+        habitats_raw = habitat_choices(primary_type)
+        if isinstance(habitats_raw, Mapping):
+            habitat = weighted_choice(habitats_raw, rng)
         else:
-            if isinstance(habitats_raw, list):
-                habitat = random.choice(habitats_raw) if habitats_raw else "Generic"
+            if isinstance(habitats_raw, (list, tuple)):
+                habitat = rng.choice(habitats_raw) if habitats_raw else "Generic"
             else:
                 habitat = habitats_raw or "Generic"
 
         # Select mutagens using their configured rarity weights (prefer rarer mods less)
-        # Both MAJOR_MODS and UTILITY_MODS are dicts mapping mod-name -> metadata dict,
-        # where the 'rarity' key is used as the selection weight (default 1.0).
-        # Filter mods by incompatible_types only (allowed_types removed)
-        def _mod_allowed(mod: dict, primary: str, secondary: Optional[str]) -> bool:
-            incompatible = mod.get("incompatible_types", []) or []
-            if primary in incompatible:
-                return False
-            if secondary and secondary in incompatible:
-                return False
-
-            return True
-
-        major_weights = {
-            name: rarity_to_weight(mod.get("rarity", 1.0))
-            for name, mod in MAJOR_MODS.items()
-            if _mod_allowed(mod, primary_type, secondary_type)
-        }
-        utility_weights = {
-            name: rarity_to_weight(mod.get("rarity", 1.0))
-            for name, mod in UTILITY_MODS.items()
-            if _mod_allowed(mod, primary_type, secondary_type)
-        }
+        major_choice = weighted_choice(mutagen_choices(data.MAJOR_MODS, primary_type, secondary_type), rng)
+        utility_choice = weighted_choice(mutagen_choices(data.UTILITY_MODS, primary_type, secondary_type), rng)
+
+        return cls.from_choices(
+            idnum, primary_type, secondary_type, form, habitat, major_choice, utility_choice, rng
+        )
+
+    @classmethod
+    def from_choices(
+        cls,
+        idnum: int,
+        primary_type: str,
+        secondary_type: Optional[str],
+        form: str,
+        habitat: str,
+        major: str,
+        utility: str,
+        rng: Optional[random.Random] = None,
+    ) -> "MonsterSeed":
+        """Builds a seed from already-chosen species attributes, rolling the rest.
+
+        forge() ends here after its draws; the species-space enumerator uses it to
+        materialize a given combination. Tempers, physical traits and the held item
+        are drawn from `rng`, and stats and meta follow from the types.
+
+        Args:
+            idnum: The ID number for the new monster.
+            primary_type: The primary type of the monster.
+            secondary_type: The optional secondary type of the monster.
+            form: Canonical form/species.
+            habitat: Habitat selection.
+            major: The forge-time major mutagen.
+            utility: The forge-time utility mutagen.
+            rng: Random source to draw from (defaults to the global `random` module).
 
-        if not major_weights:
-            major_weights = {
-                name: rarity_to_weight(mod.get("rarity", 1.0))
-                for name, mod in MAJOR_MODS.items()
-            }
-        if not utility_weights:
-            utility_weights = {
-                name: rarity_to_weight(mod.get("rarity", 1.0))
-                for name, mod in UTILITY_MODS.items()
-            }
-
-        major_choice = weighted_choice(major_weights)
-        utility_choice = weighted_choice(utility_weights)
-        mutagens = {"major": [major_choice], "utility": [utility_choice]}
-
-        mood = weighted_choice(TEMPERS_COUPLED["mood"])
-        affinity = weighted_choice(TEMPERS_COUPLED["affinity"])
+        Returns:
+            A new, fully-formed MonsterSeed object.
+        """
+        rng = rng or random
+        mutagens = {"major": [major], "utility": [utility]}
+
+        mood = weighted_choice(data.TEMPERS_COUPLED["mood"], rng)
+        affinity = weighted_choice(data.TEMPERS_COUPLED["affinity"], rng)
         tempers = {"mood": mood, "affinity": affinity}
 
-        num_physical = 1 if random.random() < 0.75 else 2
+        num_physical = 1 if rng.random() < SINGLE_TRAIT_CHANCE else 2
         physical_traits = [
-            weighted_choice(PHYSICAL_TRAITS) for _ in range(num_physical)
+            weighted_choice(data.PHYSICAL_TRAITS, rng) for _ in range(num_physical)
         ]
 
-        held_item = weighted_choice(HELD_ITEMS) if random.random() < 0.4 else None
+        held_item = weighted_choice(data.HELD_ITEMS, rng) if rng.random() < HELD_ITEM_CHANCE else None
 
         stats = calculate_base_stats(primary_type, secondary_type)
         meta = get_base_meta(primary_type, secondary_type)
@@ -320,6 +444,108 @@ class MonsterSeed:
 
         return seed
 
+    def content_hash(self) -> str:
+        """Canonical hash of what the monster is, used to spot duplicate species.
+
+        Covers every field except idnum, name and the bookkeeping meta keys
+        (BOOKKEEPING_META). The order of list entries (mutagens, traits, tags)
+        does not count, so two seeds that differ only in draw order match.
+
+        Returns:
+            A 32-character hex digest.
+        """
+        def canonical(value: Any) -> Any:
+            if isinstance(value, dict):
+                return {k: canonical(v) for k, v in value.items()}
+            if isinstance(value, (list, tuple)):
+                items = [canonical(v) for v in value]
+                try:
+                    return sorted(items)
+                except TypeError:  # mixed or unorderable entries
+                    return sorted(items, key=repr)
+            return value
+
+        content = {
+            "form": self.form,
+            "primary_type": self.primary_type,
+            "secondary_type": self.secondary_type,
+            "stats": self.stats,
+            "mutagens": self.mutagens,
+            "habitat": self.habitat,
+            "physical_traits": self.physical_traits,
+            "held_item": self.held_item,
+            "tempers": self.tempers,
+            "meta": {k: v for k, v in self.meta.items() if k not in BOOKKEEPING_META},
+        }
+        text = json.dumps(canonical(content), sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+    @property
+    def species(self) -> str:
+        """A backward-compatible alias for the `form` attribute.
+
+        Returns:
+            The canonical form name of the monster.
+        """
+        return self.form
+
+
+def form_choices(primary_type: str) -> Any:
+    """Returns what forge() draws a form from for a primary type.
+
+    Returns:
+        A weight mapping, a list of equally likely names, or an empty value
+        (forge() then uses "Unknown").
+    """
+    return data.SEED_TYPE_DATA.get(primary_type, {}).get("forms") or data.FORMS_BY_TYPE.get(
+        primary_type, []
+    )
+
+
+def habitat_choices(primary_type: str) -> Any:
+    """Returns what forge() draws a habitat from for a primary type.
+
+    Returns:
+        A weight mapping, a list of equally likely names, a single name, or an
+        empty value (forge() then uses "Generic").
+    """
+    return data.SEED_TYPE_DATA.get(primary_type, {}).get("habitats", {})
+
+
+def mutagen_choices(
+    mods: Mapping[str, Any], primary_type: str, secondary_type: Optional[str]
+) -> Dict[str, float]:
+    """Rarity weights of the mutagens forge() may pick for a type pair.
+
+    Mods listing either type under 'incompatible_types' are left out; if that
+    leaves nothing, every mod is allowed.
+
+    Args:
+        mods: data.MAJOR_MODS or data.UTILITY_MODS.
+        primary_type: The primary type of the monster.
+        secondary_type: The optional secondary type of the monster.
+
+    Returns:
+        A dict of mutagen key -> sampling weight, in data order.
+    """
+
+    def _mod_allowed(mod: Mapping[str, Any]) -> bool:
+        incompatible = mod.get("incompatible_types", []) or []
+        if primary_type in incompatible:
+            return False
+        if secondary_type and secondary_type in incompatible:
+            return False
+        return True
+
+    weights = {
+        name: rarity_to_weight(mod.get("rarity", 1.0))
+        for name, mod in mods.items()
+        if _mod_allowed(mod)
+    }
+    if not weights:
+        weights = {name: rarity_to_weight(mod.get("rarity", 1.0)) for name, mod in mods.items()}
+    return weights
+
 
 def calculate_base_stats(
     primary_type: str, secondary_type: Optional[str]
@@ -333,8 +559,8 @@ def calculate_base_stats(
     Returns:
         A dictionary of the monster's base stats.
     """
-    stats = BASE_STATS.copy()
-    primary_entry = SEED_TYPE_DATA.get(primary_type, {})
+    stats = data.BASE_STATS.copy()
+    primary_entry = data.SEED_TYPE_DATA.get(primary_type, {})
     primary_bias = primary_entry.get("attributes", {})
     for stat, mult in primary_bias.get("mul", {}).items():
         if stat in stats:
@@ -344,7 +570,7 @@ def calculate_base_stats(
             stats[stat] += int(round(addition))
 
     if secondary_type:
-        secondary_entry = SEED_TYPE_DATA.get(secondary_type, {})
+        secondary_entry = data.SEED_TYPE_DATA.get(secondary_type, {})
         secondary_bias = secondary_entry.get("attributes", {})
         for stat, mult in secondary_bias.get("mul", {}).items():
             effective_mult = 1 + ((mult - 1) * 0.5)
@@ -376,7 +602,7 @@ def get_base_meta(
     }
 
     def apply_type_meta(type_name: str, meta_dict: Dict[str, List[str]]):
-        type_entry = SEED_TYPE_DATA.get(type_name, {})
+        type_entry = data.SEED_TYPE_DATA.get(type_name, {})
         # tags may live directly under the type, under 'meta', or under 'attributes'
         tags = (
             type_entry.get("tags")
@@ -401,12 +627,3 @@ def get_base_meta(
         apply_type_meta(secondary_type, meta)
 
     return meta
-
-    @property
-    def species(self) -> str:
-        """A backward-compatible alias for the `form` attribute.
-
-        Returns:
-            The canonical form name of the monster.
-        """
-        return self.form
@@ -0,0 +1,712 @@
+"""
+Composable, lazy generation pipeline.
+
+A run is a source of monster items followed by stages, joined with `|`:
+
+    run = (
+        source(Spec("Axiom", "random"), 100, run_seed=7)
+        | mutate(1, 1)
+        | name()
+        | dex_text()
+        | sink(txt="dex.txt", jsonl="seeds.jsonl")
+    )
+    run.run()                # or run.run(workers=4), or iterate over `run`
+
+Items flow through one at a time, so memory does not grow with the run size,
+and stages that are not listed (e.g. naming when only stats are needed) are
+never run. Every item carries its own RNG derived from (run seed, index), so a
+run gives the same monsters whether it is iterated serially or with workers,
+and any single monster can be rebuilt on its own (Pipeline.at(),
+generate_monster_at()).
+
+Stages built with MapStage work on one item at a time and can be moved into a
+thread or process pool by run(workers=...)/iterate(workers=...); other stages
+(sinks) always run in the calling process, in index order.
+"""
+
+from __future__ import annotations
+
+import random
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, Callable, Iterable, Iterator, Mapping, Optional, Tuple, Union
+
+from .data import data
+from .monsterseed import MonsterSeed, check_type_pair, sample_type_pair, spawn_rng
+
+if TYPE_CHECKING:
+    from .render_cache import RenderCache
+    from .renderers import Renderer
+    from .writers import JsonArrayWriter
+
+DEX_SEPARATOR = "\n\n" + "-" * 60 + "\n\n"
+
+# Bump when the same origin (see forge_item()) would build a different monster
+# from the same data, so compactly cached monsters are not silently rebuilt wrong.
+GENERATOR_VERSION = 1
+
+
+@dataclass(frozen=True)
+class Spec:
+    """What to generate.
+
+    Attributes:
+        primary_type: A seed type, or "random".
+        secondary_type: A seed type, "random", or "none".
+        secondary_chance: Chance of rolling a secondary type when both types are random.
+    """
+
+    primary_type: str = "random"
+    secondary_type: str = "random"
+    secondary_chance: float = 0.65
+
+    @classmethod
+    def coerce(cls, spec: Union["Spec", Mapping[str, Any], None]) -> "Spec":
+        if spec is None:
+            return cls()
+        if isinstance(spec, cls):
+            return spec
+        return cls(**spec)
+
+
+@dataclass
+class Item:
+    """One monster moving through a pipeline.
+
+    Attributes:
+        index: Position within the run (the dex number is index + 1).
+        rng: The item's own random source, derived from (run seed, index).
+        seed: The monster; None if the spec could not be forged.
+        text: Formatted text, once a formatting stage has run.
+        skipped: Why the item was not forged; later stages pass it through untouched.
+        duplicate: The item was dropped by dedup() as a repeat of an earlier monster.
+    """
+
+    index: int
+    rng: random.Random
+    seed: Optional[MonsterSeed] = None
+    text: Optional[str] = None
+    skipped: Optional[str] = None
+    duplicate: bool = False
+
+
+def resolve_types(spec: Spec, rng: Optional[random.Random] = None) -> Tuple[str, Optional[str]]:
+    """
+    Summary:
+        Turns a spec's type choices ("random", "none" or a type name) into a
+        concrete primary and optional secondary type, drawn directly from the
+        legal pair space (see monsterseed.sample_type_pair()).
+
+    Args:
+        spec: The spec to resolve.
+        rng: Random source to draw from (defaults to the global `random` module).
+
+    Returns:
+        A (primary, secondary or None) tuple.
+
+    Raises:
+        ValueError: If no legal type pair meets the spec.
+    """
+    return sample_type_pair(spec.primary_type, spec.secondary_type, spec.secondary_chance, rng)
+
+
+def _forge(idnum: int, spec: Spec, rng: Optional[random.Random]) -> MonsterSeed:
+    p_type, s_type = resolve_types(spec, rng)
+    # The pair is final: a secondary_chance of 0 stops forge() from rolling one again.
+    return MonsterSeed.forge(idnum, p_type, s_type, secondary_chance=0.0, rng=rng)
+
+
+def forge_item(index: int, spec: Spec, run_seed: int, attempt: int = 0) -> Item:
+    """
+    Summary:
+        Forges the base MonsterSeed for entry `index` of a run. The seed records
+        how it was made in meta['origin'] (run seed, index, spec, plus the
+        mutate/name stages applied later), enough for rebuild() to make it again.
+
+    Args:
+        index: Position within the run.
+        spec: What to forge.
+        run_seed: Seed of the whole run.
+        attempt: Re-roll number; attempts past 0 (see dedup()) draw from their own
+            RNG, so a re-rolled entry is still fixed by (run seed, index, attempt).
+    """
+    rng = spawn_rng(run_seed, index) if not attempt else spawn_rng(run_seed, f"{index}#{attempt}")
+    try:
+        seed = _forge(index + 1, spec, rng)
+    except ValueError as e:
+        return Item(index, rng, skipped=f"Skipping {spec.primary_type}/{spec.secondary_type}: {e}")
+    seed.meta["origin"] = {"run_seed": run_seed, "index": index, **asdict(spec)}
+    if attempt:
+        seed.meta["origin"]["attempt"] = attempt
+    return Item(index, rng, seed)
+
+
+# -- Stages
+
+class Stage:
+    """A generator transformer: takes an iterator of items and yields items."""
+
+    def __call__(self, items: Iterator[Item]) -> Iterator[Item]:
+        raise NotImplementedError
+
+    def bind(self, chain: "_Chain") -> "Stage":
+        """Called with the run's forge chain before the run starts; stages that
+        need to forge again (dedup re-rolls) keep it."""
+        return self
+
+
+class MapStage(Stage):
+    """A stage that transforms each item on its own.
+
+    `fn(item, *args)` updates and returns the item. Skipped items are passed
+    through. Use module-level functions so the stage can be sent to worker
+    processes.
+    """
+
+    def __init__(self, fn: Callable[..., Item], *args: Any):
+        self.fn = fn
+        self.args = args
+
+    def apply(self, item: Item) -> Item:
+        return item if item.skipped else self.fn(item, *self.args)
+
+    def __call__(self, items: Iterator[Item]) -> Iterator[Item]:
+        for item in items:
+            yield self.apply(item)
+
+
+def _mutate(item: Item, major_count: int, util_count: int) -> Item:
+    from .mon_forge import apply_mutagens
+
+    apply_mutagens(item.seed, major_count=major_count, util_count=util_count, rng=item.rng)
+    origin = item.seed.meta.get("origin")
+    if origin is not None:
+        origin.setdefault("majors", major_count)
+        origin.setdefault("utils", util_count)
+    return item
+
+
+def _name(item: Item) -> Item:
+    from .forge_name import forge_monster_name
+
+    item.seed.name = forge_monster_name(item.seed)
+    if "origin" in item.seed.meta:
+        item.seed.meta["origin"]["named"] = True
+    return item
+
+
+def _dex_text(item: Item) -> Item:
+    from .dex_entries import dex_formatter
+
+    item.text = dex_formatter(item.seed)
+    return item
+
+
+def mutate(major_count: int = 1, util_count: int = 1) -> MapStage:
+    """Applies major and utility mutagens."""
+    return MapStage(_mutate, major_count, util_count)
+
+
+def name() -> MapStage:
+    """Names the monster with forge_monster_name()."""
+    return MapStage(_name)
+
+
+class CachedText(Stage):
+    """Sets item.text through a RenderCache; see dex_text()."""
+
+    def __init__(self, cache: "RenderCache", renderer: str = "dex"):
+        self.cache = cache
+        self.renderer = renderer
+
+    def __call__(self, items: Iterator[Item]) -> Iterator[Item]:
+        from .render_cache import origin_key
+
+        render = self.cache.render
+        for item in items:
+            if not item.skipped:
+                # Fresh from the forge, so its origin fixes it: a cheap key.
+                item.text = render(self.renderer, item.seed, origin_key(item.seed))
+            yield item
+
+
+def dex_text(cache: Optional["RenderCache"] = None) -> Stage:
+    """Formats the monster as a dex entry into item.text.
+
+    With a RenderCache, entries rendered before (same monster, same templates)
+    are taken from it; the stage then runs in the calling process.
+    """
+    if cache is not None:
+        return CachedText(cache)
+    return MapStage(_dex_text)
+
+
+class Sink(Stage):
+    """Writes each item as it passes and yields it on; see sink()."""
+
+    def __init__(
+        self,
+        txt: Union[str, Path, IO[str], None] = None,
+        jsonl: Union[str, Path, IO[str], None] = None,
+        json: Union[str, Path, "JsonArrayWriter", None] = None,
+        cache: Union[bool, str] = False,
+        separator: str = DEX_SEPARATOR,
+        render: Optional[Mapping[str, Union[str, Path, IO[str], "Renderer"]]] = None,
+    ):
+        self.txt = txt
+        self.jsonl = jsonl
+        self.json = json
+        self.cache = cache
+        self.separator = separator
+        self.render = dict(render or {})
+        self.written = 0
+
+    def __call__(self, items: Iterator[Item]) -> Iterator[Item]:
+        import contextlib
+        import json as _json
+
+        from .monster_cache import save_monster
+        from .writers import JsonArrayWriter
+
+        with contextlib.ExitStack() as stack:
+            txt_out = None
+            if isinstance(self.txt, (str, Path)):
+                Path(self.txt).parent.mkdir(parents=True, exist_ok=True)
+                txt_out = stack.enter_context(Path(self.txt).open("a", encoding="utf-8"))
+            elif self.txt is not None:
+                txt_out = self.txt
+            jsonl_out = None
+            if isinstance(self.jsonl, (str, Path)):
+                Path(self.jsonl).parent.mkdir(parents=True, exist_ok=True)
+                jsonl_out = stack.enter_context(Path(self.jsonl).open("a", encoding="utf-8"))
+            elif self.jsonl is not None:
+                jsonl_out = self.jsonl
+            json_out = None
+            if isinstance(self.json, (str, Path)):
+                json_out = stack.enter_context(JsonArrayWriter(self.json))
+            elif self.json is not None:
+                json_out = self.json
+            renderers = []
+            if self.render:
+                from .renderers import Renderer, open_renderer
+
+                for fmt, target in self.render.items():
+                    if isinstance(target, Renderer):
+                        renderers.append(target)
+                    else:
+                        renderers.append(stack.enter_context(open_renderer(fmt, target)))
+
+            for item in items:
+                if not item.skipped:
+                    if self.cache:
+                        save_monster(item.seed, compact=True if self.cache == "compact" else None)
+                    if txt_out is not None and item.text is not None:
+                        txt_out.write((self.separator if self.written else "") + item.text)
+                    if jsonl_out is not None or json_out is not None:
+                        record = asdict(item.seed)
+                        if jsonl_out is not None:
+                            jsonl_out.write(_json.dumps(record, ensure_ascii=False) + "\n")
+                        if json_out is not None:
+                            json_out.write(record)
+                    for renderer in renderers:
+                        renderer.write(item.seed)
+                    self.written += 1
+                yield item
+            if txt_out is not None and self.written:
+                txt_out.write("\n")
+
+
+def sink(
+    txt: Union[str, Path, IO[str], None] = None,
+    jsonl: Union[str, Path, IO[str], None] = None,
+    json: Union[str, Path, "JsonArrayWriter", None] = None,
+    cache: Union[bool, str] = False,
+    separator: str = DEX_SEPARATOR,
+    render: Optional[Mapping[str, Union[str, Path, IO[str], "Renderer"]]] = None,
+) -> Sink:
+    """
+    Summary:
+        Writes each item as it passes, then yields it on.
+
+    Args:
+        txt: Path (appended to) or open text stream for item.text; entries are
+            joined with `separator` and the output ends with a newline.
+        jsonl: Path (appended to) or open text stream for one seed JSON object per line.
+        json: Path written with a JSON array of the seeds, or an open JsonArrayWriter
+            to add them to (left open, so several sinks can share one array).
+        cache: Save each seed to the monster cache (sets meta['unique_id']) first;
+            "compact" stores only how to rebuild it (see monster_cache.save_monster()).
+        separator: Text written between two entries in `txt`.
+        render: Map of renderer format (see renderers.RENDERERS) to a path or
+            open text stream, or to an open Renderer (left open, so several sinks
+            can share one output). Every format is written in this one pass.
+    """
+    return Sink(txt, jsonl, json, cache, separator, render)
+
+
+class ContentIndex:
+    """Content hashes (MonsterSeed.content_hash()) of the monsters kept so far.
+
+    Held in memory; with a path, the hashes of earlier runs are loaded from it
+    and new ones appended, one per line, so duplicates are caught across runs.
+    Several dedup() stages can share one index (e.g. every job of a batch).
+    """
+
+    def __init__(self, path: Union[str, Path, None] = None, truncate_at: Optional[int] = None):
+        self.path = Path(path) if path is not None else None
+        self._seen: set = set()
+        self._file: Optional[IO[str]] = None
+        if self.path is not None:
+            if truncate_at is not None and self.path.exists():
+                with self.path.open("r+b") as f:
+                    f.truncate(truncate_at)
+            if self.path.exists():
+                with self.path.open("r", encoding="utf-8") as f:
+                    self._seen.update(line.strip() for line in f if line.strip())
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = self.path.open("a", encoding="utf-8")
+
+    def __contains__(self, digest: str) -> bool:
+        return digest in self._seen
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def add(self, digest: str) -> None:
+        if digest not in self._seen:
+            self._seen.add(digest)
+            if self._file is not None:
+                self._file.write(digest + "\n")
+
+    def sync(self) -> int:
+        """Forces the appended hashes to disk and returns the index file's size."""
+        import os
+
+        if self._file is None:
+            return 0
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return os.fstat(self._file.fileno()).st_size
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class Dedup(Stage):
+    """Drops or re-rolls monsters whose content hash was already seen; see dedup()."""
+
+    def __init__(self, index: Optional[ContentIndex] = None, reroll: int = 0):
+        self.index = index if index is not None else ContentIndex()
+        self.reroll = reroll
+        self.checked = 0
+        self.duplicates = 0
+        self.rerolled = 0
+        self._chain: Optional[_Chain] = None
+
+    @property
+    def dropped(self) -> int:
+        return self.duplicates - self.rerolled
+
+    def bind(self, chain: "_Chain") -> "Dedup":
+        self._chain = chain
+        return self
+
+    def _replacement(self, item: Item) -> Optional[Item]:
+        if self._chain is None:
+            return None
+        for attempt in range(1, self.reroll + 1):
+            candidate = self._chain(item.index, attempt)
+            if not candidate.skipped and candidate.seed.content_hash() not in self.index:
+                return candidate
+        return None
+
+    def __call__(self, items: Iterator[Item]) -> Iterator[Item]:
+        for item in items:
+            if not item.skipped:
+                self.checked += 1
+                digest = item.seed.content_hash()
+                if digest in self.index:
+                    self.duplicates += 1
+                    replacement = self._replacement(item)
+                    if replacement is None:
+                        item.skipped = f"Dropped #{item.index + 1:03d}: duplicate of an earlier monster"
+                        item.duplicate = True
+                        yield item
+                        continue
+                    self.rerolled += 1
+                    item = replacement
+                    digest = item.seed.content_hash()
+                self.index.add(digest)
+            yield item
+
+    def report(self) -> str:
+        """One-line summary of the dedup rate, for run summaries."""
+        rate = self.duplicates / self.checked if self.checked else 0.0
+        line = f"dedup: {self.duplicates:,} of {self.checked:,} duplicate ({rate:.2%})"
+        if self.duplicates:
+            line += f", {self.rerolled:,} re-rolled, {self.dropped:,} dropped"
+        return line
+
+
+def dedup(
+    index: Union[ContentIndex, str, Path, None] = None, reroll: int = 0
+) -> Dedup:
+    """
+    Summary:
+        Checks each monster's content hash (every field but idnum, name and
+        bookkeeping meta) against the monsters kept so far. A repeat is re-rolled
+        up to `reroll` times from the entry's own attempt RNGs (see forge_item()),
+        then dropped (skipped, with item.duplicate set). Place it before
+        dex_text() and sink() so repeats are never formatted or written; map
+        stages after it run in the calling process. The stage's counters
+        (checked, duplicates, rerolled, dropped) and report() give the dedup rate.
+
+    Args:
+        index: A ContentIndex to share, or a path for a persistent one (default:
+            a fresh in-memory index).
+        reroll: Re-roll attempts per duplicate before it is dropped.
+    """
+    if not isinstance(index, ContentIndex):
+        index = ContentIndex(index)
+    return Dedup(index, reroll)
+
+
+# -- Runs
+
+class _Chain:
+    """Forge plus a run of MapStages as one picklable per-index callable."""
+
+    def __init__(self, spec: Spec, run_seed: int, stages: Tuple[MapStage, ...]):
+        self.spec = spec
+        self.run_seed = run_seed
+        self.stages = stages
+
+    def __call__(self, index: int, attempt: int = 0) -> Item:
+        item = forge_item(index, self.spec, self.run_seed, attempt)
+        for stage in self.stages:
+            item = stage.apply(item)
+        return item
+
+
+def _ordered_map(pool: Executor, fn: Callable[[Any], Any], args: Iterable[Any], window: int) -> Iterator[Any]:
+    # Like Executor.map, but keeps at most `window` tasks in flight instead of
+    # submitting the whole input up front.
+    pending: deque = deque()
+    for arg in args:
+        pending.append(pool.submit(fn, arg))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def make_pool(workers: int, executor: str = "process") -> Executor:
+    """
+    Summary:
+        Starts a pool that pipelines can share through iterate(pool=...), so a
+        series of runs pays the worker start-up once.
+
+    Args:
+        workers: Pool size.
+        executor: "process" or "thread".
+
+    Raises:
+        ValueError: If `executor` is not "process" or "thread".
+    """
+    if executor == "process":
+        # Keep the loaded tables out of the children's GC passes (shared pages).
+        data.freeze_for_fork()
+        return ProcessPoolExecutor(max_workers=workers)
+    if executor == "thread":
+        return ThreadPoolExecutor(max_workers=workers)
+    raise ValueError(f"Unknown executor {executor!r}; use 'process' or 'thread'")
+
+
+class Pipeline:
+    """A source followed by stages. Nothing runs until it is iterated or run()."""
+
+    def __init__(self, spec: Spec, indexes: range, run_seed: int, stages: Tuple[Stage, ...] = ()):
+        self.spec = spec
+        self.indexes = indexes
+        self.run_seed = run_seed
+        self.stages = stages
+
+    def __or__(self, stage: Stage) -> "Pipeline":
+        if not isinstance(stage, Stage):
+            return NotImplemented
+        return Pipeline(self.spec, self.indexes, self.run_seed, self.stages + (stage,))
+
+    def __iter__(self) -> Iterator[Item]:
+        return self.iterate()
+
+    def iterate(
+        self, workers: int = 1, executor: str = "process", pool: Optional[Executor] = None
+    ) -> Iterator[Item]:
+        """
+        Summary:
+            Yields the finished items in index order.
+
+        Args:
+            workers: With more than one, forging and the leading MapStages run in a
+                pool of this size; the remaining stages run here, in order.
+            executor: "process" or "thread".
+            pool: An existing executor (see make_pool()) to use instead of starting
+                one; it is left running. `workers` then only sizes the window of
+                tasks kept in flight.
+        """
+        split = 0
+        while split < len(self.stages) and isinstance(self.stages[split], MapStage):
+            split += 1
+        chain = _Chain(self.spec, self.run_seed, self.stages[:split])
+        for stage in self.stages[split:]:
+            stage.bind(chain)
+
+        items: Iterator[Item]
+        if pool is not None:
+            items = _ordered_map(pool, chain, self.indexes, window=max(workers, 1) * 8)
+        elif workers > 1 and len(self.indexes) > 1:
+            yield from self._iterate_pooled(chain, workers, executor, self.stages[split:])
+            return
+        else:
+            items = map(chain, self.indexes)
+        for stage in self.stages[split:]:
+            items = stage(items)
+        yield from items
+
+    def _iterate_pooled(
+        self, chain: _Chain, workers: int, executor: str, rest: Tuple[Stage, ...]
+    ) -> Iterator[Item]:
+        with make_pool(workers, executor) as pool:
+            items: Iterator[Item] = _ordered_map(pool, chain, self.indexes, window=workers * 8)
+            for stage in rest:
+                items = stage(items)
+            yield from items
+
+    def at(self, index: int, attempt: int = 0) -> Item:
+        """
+        Summary:
+            Builds the item at `index` on its own, through the leading MapStages
+            (sinks are not run). An item depends only on the run seed and its
+            index, so this is the item iteration would yield there, in O(1):
+            nothing before it is forged or replayed. `attempt` selects a dedup()
+            re-roll of the entry.
+        """
+        split = 0
+        while split < len(self.stages) and isinstance(self.stages[split], MapStage):
+            split += 1
+        return _Chain(self.spec, self.run_seed, self.stages[:split])(index, attempt)
+
+    def run(
+        self, workers: int = 1, executor: str = "process", pool: Optional[Executor] = None
+    ) -> int:
+        """Runs the pipeline to completion and returns the number of items that were not skipped."""
+        return sum(1 for item in self.iterate(workers, executor, pool) if not item.skipped)
+
+
+def source(
+    spec: Union[Spec, Mapping[str, Any], None] = None,
+    n: int = 1,
+    run_seed: Optional[int] = None,
+    start: int = 0,
+) -> Pipeline:
+    """
+    Summary:
+        Starts a pipeline that forges `n` base monsters from `spec`.
+
+    Args:
+        spec: A Spec, or a mapping of its fields (defaults to fully random types).
+        n: Number of monsters.
+        run_seed: Seed for the whole run (default: drawn from the global `random`).
+        start: Index of the first monster; its dex number is start + 1.
+
+    Returns:
+        A Pipeline to extend with `|`.
+
+    Raises:
+        ValueError: If no legal type pair meets the spec, so nothing would be forged.
+    """
+    spec = Spec.coerce(spec)
+    check_type_pair(spec.primary_type, spec.secondary_type)
+    if run_seed is None:
+        run_seed = random.getrandbits(63)
+    return Pipeline(spec, range(start, start + n), run_seed)
+
+
+def forge_monster(
+    spec: Union[Spec, Mapping[str, Any], None] = None,
+    major_count: int = 1,
+    util_count: int = 1,
+    idnum: int = 1,
+    rng: Optional[random.Random] = None,
+) -> MonsterSeed:
+    """
+    Summary:
+        Forges, mutates and names a single monster without saving it; the
+        one-off counterpart of source() | mutate() | name(). Without `rng` it is
+        entry `idnum` of a fresh random run, so it carries meta['origin'].
+
+    Raises:
+        ValueError: If the spec names an invalid type combination.
+    """
+    from .forge_name import forge_monster_name
+    from .mon_forge import apply_mutagens
+
+    if rng is None and idnum >= 1:
+        return generate_monster_at(random.getrandbits(63), idnum, spec, major_count, util_count)
+    seed = _forge(idnum, Spec.coerce(spec), rng)
+    apply_mutagens(seed, major_count=major_count, util_count=util_count, rng=rng)
+    seed.name = forge_monster_name(seed)
+    return seed
+
+
+def generate_monster_at(
+    run_seed: int,
+    k: int,
+    spec: Union[Spec, Mapping[str, Any], None] = None,
+    major_count: int = 1,
+    util_count: int = 1,
+) -> MonsterSeed:
+    """
+    Summary:
+        Returns monster number `k` (its dex number) of the run
+        source(spec, n, run_seed) | mutate(major_count, util_count) | name()
+        without forging monsters 1..k-1. Its RNG is spawn_rng(run_seed, k - 1)
+        and its name is derived from its own fields, so shards, resumed jobs and
+        lookups of a single entry need only the run seed and the number.
+
+    Raises:
+        ValueError: If `k` is less than 1 or the spec names an invalid type combination.
+    """
+    if k < 1:
+        raise ValueError(f"k is a dex number and must be >= 1, got {k}")
+    item = (source(spec, 1, run_seed, start=k - 1) | mutate(major_count, util_count) | name()).at(k - 1)
+    if item.skipped:
+        raise ValueError(item.skipped)
+    return item.seed
+
+
+def rebuild(origin: Mapping[str, Any]) -> MonsterSeed:
+    """
+    Summary:
+        Makes a monster again from the meta['origin'] that forge_item() and the
+        mutate/name stages recorded on it, with the same data loaded.
+
+    Raises:
+        ValueError: If the origin's spec can no longer be forged.
+        KeyError: If the origin is missing a field.
+    """
+    spec = Spec(origin["primary_type"], origin["secondary_type"], origin["secondary_chance"])
+    index = origin["index"]
+    run = source(spec, 1, origin["run_seed"], start=index)
+    if "majors" in origin:
+        run = run | mutate(origin["majors"], origin["utils"])
+    if origin.get("named"):
+        run = run | name()
+    item = run.at(index, origin.get("attempt", 0))
+    if item.skipped:
+        raise ValueError(item.skipped)
+    return item.seed
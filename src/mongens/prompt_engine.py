@@ -1,6 +1,25 @@
+import functools
+import hashlib
+import json
+import re
+from pathlib import Path
+from typing import IO, Dict, Iterable, Optional, Set, Union
+
 from .data.art_data import *
 from .forge_name import format_dual_type
 
+# Every VISUAL_TRANSLATION bucket flattened into one term -> description index.
+# Built in reverse bucket order so a term in both keeps its "mutagens" entry,
+# the bucket translate_term() has always checked first.
+TRANSLATIONS: Dict[str, str] = {}
+for _bucket in ("traits", "mutagens"):
+    TRANSLATIONS.update(VISUAL_TRANSLATION.get(_bucket, {}))
+
+# Mutagen name fragments that give the monster a glow in its prompt.
+GLOW_MARKERS = ("Luminescent", "Solar", "Inferno")
+_GLOW = "emitting a subtle bioluminescent glow, "
+_glows = re.compile("|".join(map(re.escape, GLOW_MARKERS))).search
+
 
 def translate_term(term: str) -> str:
     '''
@@ -14,11 +33,24 @@ def translate_term(term: str) -> str:
     Returns:
         The translated term, or the original term if no translation is available.
     '''
-    for bucket in ("mutagens", "traits"):
-        bucket_map = VISUAL_TRANSLATION.get(bucket, {})
-        if term in bucket_map:
-            return bucket_map[term]
-    return term
+    return TRANSLATIONS.get(term, term)
+
+
+@functools.lru_cache(maxsize=4096)
+def _subject_line(form: str, primary_type: str, secondary_type: Optional[str]) -> str:
+    # Body plan: a species override, else the primary type's description.
+    body_desc = SPECIES_VISUAL_OVERRIDES.get(form) or TYPE_VISUALS.get(
+        primary_type, "distinct creature silhouette"
+    )
+    # Use formatted dual-type label for the subject when possible
+    formatted_type = format_dual_type(primary_type, secondary_type) if secondary_type else primary_type
+    return f"A {form} monster, {formatted_type} type, {body_desc}."
+
+
+@functools.lru_cache(maxsize=256)
+def _pose_line(mood: str) -> str:
+    # Incorporating mood into the pose
+    return POSE_INSTRUCTIONS.format(mood=mood)
 
 
 def construct_mon_prompt(seed) -> str:
@@ -33,82 +65,150 @@ def construct_mon_prompt(seed) -> str:
     Returns:
         A formatted string containing the full image prompt.
     '''
-    # --- 1. DECONSTRUCT SEED DATA (Corrected Access) ---
-    # Use direct attribute access for the object's fields
-    species = seed.species
-    primary_type = seed.primary_type
-    secondary_type = seed.secondary_type
-    habitat = seed.habitat
-    traits = seed.physical_traits
-
-    # Use .get() for the dictionaries *within* the object
+    # The subject and pose lines depend on few inputs and are built once each
+    # (cached above); the per-monster lines are index lookups and one join each.
+    translate = TRANSLATIONS.get
     mutagens = seed.mutagens
     majors = mutagens.get("major", [])
     utilities = mutagens.get("utility", [])
+    traits = seed.physical_traits
 
-    tempers = seed.tempers
-    mood = tempers.get("mood", "neutral")
-
-    body_desc = SPECIES_VISUAL_OVERRIDES.get(species)
-
-    # If there's no specific override, fall back to the type-based description
-    if not body_desc:
-        body_desc = TYPE_VISUALS.get(primary_type, "distinct creature silhouette")
-
-    # Use formatted dual-type label for the subject when possible
-    formatted_type = (
-        format_dual_type(primary_type, secondary_type)
-        if secondary_type
-        else primary_type
-    )
-    subject_line = f"A {species} monster, {formatted_type} type, {body_desc}."
-
-    # --- 4. MUTAGENS (25% Weight) ---
-    visual_modifiers = []
-
-    if majors:
-        translated_majors = [translate_term(m) for m in majors]
-        visual_modifiers.append(f"infused with {', '.join(translated_majors)}")
-
-    prompt_glow = ""
-    combined_mods = majors + utilities
-    if any("Luminescent" in m or "Solar" in m or "Inferno" in m for m in combined_mods):
-        prompt_glow = "emitting a subtle bioluminescent glow, "
-
-    mods_line = (
-        f"Visual features: {', '.join(visual_modifiers)}." if visual_modifiers else ""
-    )
+    # --- MUTAGENS (25% Weight) ---
+    mods_line = f"Visual features: infused with {', '.join([translate(m, m) for m in majors])}." if majors else ""
+    prompt_glow = _GLOW if _glows("\0".join([*majors, *utilities])) else ""
 
-    # --- 5. UTILITY & TRAITS (10% & 5% Weight) ---
+    # --- UTILITY & TRAITS (10% & 5% Weight) ---
     details_list = []
-
     if utilities:
-        translated_utils = [translate_term(u) for u in utilities]
-        details_list.append(f"carrying or wearing {', '.join(translated_utils)}")
-
+        details_list.append(f"carrying or wearing {', '.join([translate(u, u) for u in utilities])}")
     if traits:
-        translated_traits = [translate_term(t) for t in traits]
-        trait_str = ", ".join(translated_traits)
-        details_list.append(f"distinctive features include: {trait_str}")
-
+        details_list.append(f"distinctive features include: {', '.join([translate(t, t) for t in traits])}")
     details_line = f"Details: {', '.join(details_list)}." if details_list else ""
 
-    # --- 6. POSE (The Action) ---
-    # Incorporating mood into the pose
-    pose_instruction = (
-        f"Pose: 3/4 perspective facing diagonally forward with a {mood} expression. "
-        "Slight idle lean forward ready to engage. "
-        "Limbs and tail angled outward to show clear silhouette."
-    )
-
     # --- ASSEMBLE PROMPT ---
-    full_prompt = (
+    return (
         f"{STYLE_HEADER}\n"
-        f"Subject: {subject_line}\n"
+        f"Subject: {_subject_line(seed.form, seed.primary_type, seed.secondary_type)}\n"
         f"{mods_line} {prompt_glow}\n"
         f"{details_line}\n"
-        f"{pose_instruction}\n"
+        f"{_pose_line(seed.tempers.get('mood', 'neutral'))}\n"
         f"{TECHNICAL_SPECS}"
     )
 
-    return full_prompt
+
+def prompt_hash(prompt: str) -> str:
+    '''
+    Summary:
+        Hash identifying a prompt's text, used to spot identical prompts.
+
+    Returns:
+        A 32-character hex digest.
+    '''
+    return hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class PromptIndex:
+    '''
+    Summary:
+        What construct_mon_prompts() has queued so far: the PIN whose line carries
+        each prompt's text (by prompt hash) and every PIN already written. Pass
+        one index to several calls to dedup across them.
+    '''
+
+    def __init__(self):
+        self.carriers: Dict[str, str] = {}
+        self.pins: Set[str] = set()
+
+    def update_from(self, path: Union[str, Path]) -> None:
+        '''
+        Summary:
+            Adds the PINs and carried prompts of a queue file written by
+            construct_mon_prompts(). A missing file adds nothing; unreadable
+            lines (a torn last write) are skipped.
+        '''
+        try:
+            f = Path(path).open("r", encoding="utf-8")
+        except FileNotFoundError:
+            return
+        with f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    pin = record.get("pin")
+                except (ValueError, AttributeError):
+                    continue
+                if pin is None:
+                    continue
+                self.pins.add(pin)
+                if "prompt" in record and "hash" in record:
+                    self.carriers.setdefault(record["hash"], pin)
+
+    def __len__(self) -> int:
+        return len(self.pins)
+
+
+def construct_mon_prompts(
+    seeds: Iterable,
+    out: Union[str, Path, IO[str]],
+    index: Optional[PromptIndex] = None,
+    cache=None,
+) -> Dict[str, int]:
+    '''
+    Summary:
+        Streams the art prompts of many monsters to a JSON Lines file for the
+        image queue, one line per PIN: {"pin", "name", "hash", "prompt"}. A
+        prompt identical to one already queued is not repeated; its line has
+        "same_as" (the PIN whose line carries the text) instead of "prompt". A
+        PIN already queued is skipped, so each PIN appears once.
+
+    Args:
+        seeds: The monsters, normally cached ones with meta["unique_id"]. A seed
+            without a PIN gets a line with "pin": null; it can point at an
+            earlier prompt but never carries one for later lines.
+        out: A path (appended to) or an open text stream. A path's existing
+            lines are read into the index first, so rerunning with the same
+            PINs against the same queue file adds nothing.
+        index: A PromptIndex to share between calls (default: a fresh one).
+            Updated in place.
+        cache: Optional RenderCache (render_cache.RenderCache) to take prompts
+            from. Prompts are looked up by PIN (render_cache.pin_key()), so pass
+            seeds as loaded from the monster cache, not edited copies.
+
+    Returns:
+        Counts: "written" (lines), "unique" (prompts written in full),
+        "duplicates" (lines pointing at an earlier prompt) and "skipped" (repeated PINs).
+    '''
+    index = PromptIndex() if index is None else index
+    if cache is not None:
+        from .render_cache import pin_key
+    if isinstance(out, (str, Path)):
+        index.update_from(out)
+        Path(out).parent.mkdir(parents=True, exist_ok=True)
+        with Path(out).open("a", encoding="utf-8") as f:
+            return construct_mon_prompts(seeds, f, index, cache)
+    counts = {"written": 0, "unique": 0, "duplicates": 0, "skipped": 0}
+    for seed in seeds:
+        pin = seed.meta.get("unique_id")
+        if pin is not None:
+            if pin in index.pins:
+                counts["skipped"] += 1
+                continue
+            index.pins.add(pin)
+        if cache is None:
+            prompt = construct_mon_prompt(seed)
+        else:
+            prompt = cache.render("artprompt", seed, pin_key(seed) if pin is not None else None)
+        digest = prompt_hash(prompt)
+        record = {"pin": pin, "name": seed.name, "hash": digest}
+        carrier = index.carriers.get(digest)
+        if carrier is not None:
+            record["same_as"] = carrier
+            counts["duplicates"] += 1
+        else:
+            if pin is not None:
+                index.carriers[digest] = pin
+            record["prompt"] = prompt
+            counts["unique"] += 1
+        out.write(json.dumps(record, ensure_ascii=False) + "\n")
+        counts["written"] += 1
+    return counts
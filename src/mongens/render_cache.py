@@ -0,0 +1,240 @@
+"""
+Memoized rendering of monsters to text (dex entries, art prompts).
+
+A RenderCache maps (monster key, renderer, template version) to the text that
+renderer produced, so an incremental content build only renders monsters that
+changed:
+
+    with RenderCache("build/render.cache") as cache:
+        for seed in seeds:
+            text = cache.render("dex", seed, origin_key(seed))
+
+A lookup has to cost less than the render it saves (a dex entry or prompt takes
+a few microseconds), so the key is one the caller already has:
+
+    origin_key(): a monster fresh from a pipeline run is fixed by its
+        meta['origin'] (run seed, index, spec, stages) and the generator, as
+        compact cache records rely on. The key carries generator_version(), a hash
+        of the forging modules' source, so an edit to them without a
+        GENERATOR_VERSION bump still misses. Used by pipeline.dex_text(cache).
+    pin_key(): a monster loaded from the monster cache is fixed by its PIN
+        (a PIN's record is never replaced).
+    fingerprint(): otherwise, a hash of every field a renderer prints, in order.
+        It reads the whole seed and costs about as much as rendering it.
+
+The template version hashes the renderer's source modules together with the
+loaded data, so editing either invalidates its entries (and origin and PIN keys
+with them, since both resolve through the data).
+
+The cache is a bounded LRU: past max_entries the least recently used entry is
+dropped. With a path it is loaded from and saved to a JSON Lines file, one entry
+per line, rewritten whole by save(); entries for stale template versions are
+dropped on load.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import importlib
+import json
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple, Union
+
+from .monsterseed import BOOKKEEPING_META, MonsterSeed
+from .pipeline import GENERATOR_VERSION
+
+DEFAULT_MAX_ENTRIES = 100_000
+
+# Renderer name -> (module, function, modules whose source the text depends on).
+RENDER_TEMPLATES: Dict[str, Tuple[str, str, Tuple[str, ...]]] = {
+    "dex": ("dex_entries", "dex_formatter", ("dex_entries", "forge_name")),
+    "artprompt": ("prompt_engine", "construct_mon_prompt", ("prompt_engine", "data/art_data", "forge_name")),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _render_function(renderer: str) -> Callable[[MonsterSeed], str]:
+    module, function, _ = RENDER_TEMPLATES[renderer]
+    return getattr(importlib.import_module(f".{module}", __package__), function)
+
+
+# Modules whose code decides what a pipeline run forges from an origin.
+GENERATOR_MODULES = ("monsterseed", "mon_forge", "pipeline", "forge_name")
+
+
+@functools.lru_cache(maxsize=None)
+def generator_version() -> str:
+    """
+    Summary:
+        Hash of GENERATOR_VERSION and the source of GENERATOR_MODULES.
+
+    Returns:
+        A 16-character hex digest.
+    """
+    digest = hashlib.blake2b(str(GENERATOR_VERSION).encode("utf-8"), digest_size=8)
+    for module in GENERATOR_MODULES:
+        digest.update(b"\0" + (Path(__file__).parent / f"{module}.py").read_bytes())
+    return digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=64)
+def template_version(renderer: str, data_digest: Optional[str]) -> str:
+    """
+    Summary:
+        Hash of the source of a renderer's template modules and the data hash.
+
+    Args:
+        renderer: A name in RENDER_TEMPLATES.
+        data_digest: The loaded data's hash (monster_cache.data_hash()).
+
+    Returns:
+        A 16-character hex digest.
+    """
+    digest = hashlib.blake2b(renderer.encode("utf-8"), digest_size=8)
+    for module in RENDER_TEMPLATES[renderer][2]:
+        digest.update(b"\0" + (Path(__file__).parent / f"{module}.py").read_bytes())
+    digest.update(b"\0" + (data_digest or "").encode("utf-8"))
+    return digest.hexdigest()
+
+
+def origin_key(seed: MonsterSeed) -> str:
+    """Key of a monster as forged by a pipeline run, from meta['origin']; see the module docstring."""
+    # The origin is small: its repr is the key as is, which saves hashing it.
+    return f"origin:{generator_version()}:{seed.meta['origin']!r}"
+
+
+def pin_key(seed: MonsterSeed) -> str:
+    """Key of a monster as loaded from the monster cache, by its PIN; see the module docstring."""
+    return "pin:" + seed.meta["unique_id"]
+
+
+def fingerprint(seed: MonsterSeed) -> str:
+    """Order-preserving hash of every field a renderer shows (see the module docstring)."""
+    meta = seed.meta
+    if any(key in meta for key in BOOKKEEPING_META):
+        meta = {k: v for k, v in meta.items() if k not in BOOKKEEPING_META}
+    # repr() of plain containers is deterministic and cheaper than json.dumps().
+    fields = (
+        seed.idnum, seed.name, seed.form, seed.primary_type, seed.secondary_type, seed.stats,
+        seed.mutagens, seed.habitat, seed.physical_traits, seed.held_item, seed.tempers, meta,
+    )
+    return hashlib.blake2b(repr(fields).encode("utf-8"), digest_size=16).hexdigest()
+
+
+class RenderCache:
+    """
+    Summary:
+        Bounded LRU of rendered text, optionally persisted (see the module docstring).
+
+    Args:
+        path: JSON Lines file to load from and save() to; None keeps it in memory.
+        max_entries: Entries kept; the least recently used are dropped past it.
+    """
+
+    def __init__(self, path: Union[str, Path, None] = None, max_entries: int = DEFAULT_MAX_ENTRIES):
+        from .monster_cache import data_hash
+
+        self.path = Path(path) if path is not None else None
+        self.max_entries = max(int(max_entries), 1)
+        self.hits = 0
+        self.misses = 0
+        self._data_hash = data_hash
+        self._entries: "OrderedDict[Tuple[str, str, str], str]" = OrderedDict()
+        self._dirty = False
+        if self.path is not None and self.path.exists():
+            self._load()
+
+    def _load(self) -> None:
+        versions: Dict[str, str] = {}
+        with self.path.open("r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    renderer = record["renderer"]
+                    if renderer not in versions:
+                        versions[renderer] = self._version(renderer)
+                    if record["version"] != versions[renderer]:
+                        self._dirty = True
+                        continue
+                    key = (renderer, record["version"], record["key"])
+                    self._entries[key] = record["text"]
+                    self._entries.move_to_end(key)
+                except (ValueError, KeyError, TypeError):
+                    # A torn or foreign line only costs a re-render.
+                    self._dirty = True
+        self._trim()
+
+    def _version(self, renderer: str) -> str:
+        if renderer not in RENDER_TEMPLATES:
+            raise KeyError(renderer)
+        return template_version(renderer, self._data_hash())
+
+    def _trim(self) -> None:
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._dirty = True
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def render(self, renderer: str, seed: MonsterSeed, key: Optional[str] = None) -> str:
+        """
+        Summary:
+            The text `renderer` gives for `seed`, from the cache when the same
+            monster was rendered with the same templates before.
+
+        Args:
+            renderer: A name in RENDER_TEMPLATES.
+            seed: The monster.
+            key: The monster's key (origin_key() or pin_key()); default fingerprint().
+
+        Raises:
+            ValueError: If `renderer` is not in RENDER_TEMPLATES.
+        """
+        if renderer not in RENDER_TEMPLATES:
+            raise ValueError(f"Unknown renderer {renderer!r}; use one of {', '.join(RENDER_TEMPLATES)}")
+        entry = (renderer, self._version(renderer), key if key is not None else fingerprint(seed))
+        text = self._entries.get(entry)
+        if text is not None:
+            self._entries.move_to_end(entry)
+            self.hits += 1
+            return text
+        self.misses += 1
+        text = _render_function(renderer)(seed)
+        self._entries[entry] = text
+        self._dirty = True
+        self._trim()
+        return text
+
+    def save(self) -> None:
+        """Rewrites the cache file (least recently used first) if anything changed."""
+        if self.path is None or not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            for (renderer, version, key), text in self._entries.items():
+                record = {"renderer": renderer, "version": version, "key": key, "text": text}
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+        self._dirty = False
+
+    def report(self) -> str:
+        """One-line summary of the hit rate, for run summaries."""
+        looked_up = self.hits + self.misses
+        rate = self.hits / looked_up if looked_up else 0.0
+        return f"render cache: {self.hits:,} of {looked_up:,} hit ({rate:.2%}), {len(self):,} kept"
+
+    def close(self) -> None:
+        self.save()
+
+    def __enter__(self) -> "RenderCache":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
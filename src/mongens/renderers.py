@@ -0,0 +1,310 @@
+"""
+Streaming output renderers, selected by format name.
+
+Each renderer writes monsters to one text output as they arrive, so a catalog
+of any size is rendered in the same pass that generates it, and several formats
+can be fed from that one pass (sink(render={...}), batch `outputs`, `--format`):
+
+    with open_renderer("csv", "out/catalog.csv") as out:
+        for seed in seeds:
+            out.write(seed)
+
+Built in:
+    dex: The plain dex text, exactly as sink(txt=...) writes it.
+    markdown: One section per monster with a details table and a stats table.
+    csv: One row per monster with the stats flattened into columns (STAT_ORDER).
+    html: A standalone static page, one <article> per monster.
+    ndjson: One seed JSON object per line.
+
+New formats are added with @register_renderer("name") on a Renderer subclass.
+Renderers appending to a file that already has entries skip their header (the
+CSV column row); "html" is a whole document, so its file is rewritten each run.
+Like writers.JsonArrayWriter, a renderer can be continued from a point recorded
+with sync(), which is how checkpointed batch runs resume them.
+"""
+
+from __future__ import annotations
+
+import csv
+import html
+import io
+import json
+import os
+from dataclasses import asdict
+from pathlib import Path
+from typing import IO, Callable, Dict, List, Optional, Tuple, Type, TypeVar, Union
+
+from .dex_entries import STAT_ORDER, dex_formatter
+from .monsterseed import MonsterSeed
+from .pipeline import DEX_SEPARATOR
+
+RENDERERS: Dict[str, Type["Renderer"]] = {}
+
+R = TypeVar("R", bound=Type["Renderer"])
+
+
+def register_renderer(name: str) -> Callable[[R], R]:
+    """Class decorator adding a Renderer subclass to RENDERERS under `name`."""
+
+    def _register(cls: R) -> R:
+        cls.name = name
+        RENDERERS[name] = cls
+        return cls
+
+    return _register
+
+
+class Renderer:
+    """
+    Summary:
+        Streams monsters into one text output. Subclasses provide render() and,
+        for formats that need them, header() and footer().
+
+    Args:
+        target: A path, or an open text stream (written to but left open).
+        resume_at: (byte offset, entries) from sync(); the file is cut back to
+            the offset and continued without repeating the header.
+    """
+
+    name = ""
+    extension = ".txt"
+    # True for formats that are one document (header ... footer): a path is
+    # rewritten rather than appended to.
+    overwrite = False
+
+    def __init__(self, target: Union[str, Path, IO[str]], resume_at: Optional[Tuple[int, int]] = None):
+        self.count = 0
+        self._closed = False
+        fresh = True
+        if isinstance(target, (str, Path)):
+            path = Path(target)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if resume_at is not None:
+                offset, self.count = resume_at
+                with path.open("r+b") as f:
+                    f.truncate(offset)
+                fresh = offset == 0
+                self._file = path.open("a", encoding="utf-8")
+            elif self.overwrite:
+                self._file = path.open("w", encoding="utf-8")
+            else:
+                fresh = not path.exists() or path.stat().st_size == 0
+                self._file = path.open("a", encoding="utf-8")
+            self._owned = True
+        else:
+            self._file = target
+            self._owned = False
+        if fresh:
+            self._file.write(self.header())
+
+    def header(self) -> str:
+        """Text written once at the start of a new output."""
+        return ""
+
+    def footer(self) -> str:
+        """Text written by close()."""
+        return ""
+
+    def render(self, seed: MonsterSeed) -> str:
+        """The text of one monster."""
+        raise NotImplementedError
+
+    def write(self, seed: MonsterSeed) -> None:
+        """Renders one monster to the output."""
+        self._file.write(self.render(seed))
+        self.count += 1
+
+    def sync(self) -> Tuple[int, int]:
+        """Forces what was written to disk; returns (byte offset, entries) for resume_at."""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return os.fstat(self._file.fileno()).st_size, self.count
+
+    def close(self) -> None:
+        """Writes the footer and closes the file (a stream is only flushed). Safe to call twice."""
+        if self._closed:
+            return
+        self._closed = True
+        self._file.write(self.footer())
+        if self._owned:
+            self._file.close()
+        else:
+            self._file.flush()
+
+    def __enter__(self) -> "Renderer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def open_renderer(
+    fmt: str, target: Union[str, Path, IO[str]], resume_at: Optional[Tuple[int, int]] = None
+) -> Renderer:
+    """
+    Summary:
+        Opens the renderer registered as `fmt` on a path or text stream.
+
+    Raises:
+        ValueError: If no renderer is registered under `fmt`.
+    """
+    if fmt not in RENDERERS:
+        raise ValueError(f"Unknown output format {fmt!r}; use one of {', '.join(RENDERERS)}")
+    return RENDERERS[fmt](target, resume_at)
+
+
+def render_path(output: Union[str, Path], fmt: str) -> Path:
+    """The file a format is written to next to `output` (its extension swapped in)."""
+    return Path(output).with_suffix(RENDERERS[fmt].extension)
+
+
+def _joined(values) -> str:
+    return ", ".join(str(v) for v in values or [])
+
+
+def _details(seed: MonsterSeed) -> List[Tuple[str, str]]:
+    # Label/value rows shared by the markdown and HTML renderers.
+    types = seed.primary_type + (f" / {seed.secondary_type}" if seed.secondary_type else "")
+    tempers = seed.tempers or {}
+    rows = [
+        ("Types", types),
+        ("Form", seed.form),
+        ("Habitat", seed.habitat),
+        ("Major mutagens", _joined(seed.mutagens.get("major"))),
+        ("Utility mutagens", _joined(seed.mutagens.get("utility"))),
+        ("Physical traits", _joined(seed.physical_traits)),
+        ("Held item", seed.held_item or ""),
+        ("Tempers", " / ".join(str(tempers[k]) for k in ("mood", "affinity") if k in tempers)),
+        ("Tags", _joined(seed.meta.get("tags"))),
+        ("Resists", _joined(seed.meta.get("resist"))),
+        ("Weak to", _joined(seed.meta.get("weak"))),
+    ]
+    if seed.meta.get("unique_id"):
+        rows.append(("PIN", seed.meta["unique_id"]))
+    return rows
+
+
+def _stats(seed: MonsterSeed) -> List[Tuple[str, str]]:
+    return [(key, str(seed.stats[key])) for key in STAT_ORDER if key in seed.stats]
+
+
+@register_renderer("dex")
+class DexRenderer(Renderer):
+    """The plain dex text: entries joined with DEX_SEPARATOR, ending with a newline."""
+
+    def write(self, seed: MonsterSeed) -> None:
+        if self.count:
+            self._file.write(DEX_SEPARATOR)
+        super().write(seed)
+
+    def render(self, seed: MonsterSeed) -> str:
+        return dex_formatter(seed)
+
+    def footer(self) -> str:
+        return "\n" if self.count else ""
+
+
+@register_renderer("markdown")
+class MarkdownRenderer(Renderer):
+    """One `##` section per monster: a details table, then a one-row stats table."""
+
+    extension = ".md"
+
+    def render(self, seed: MonsterSeed) -> str:
+        def cell(text: str) -> str:
+            return text.replace("|", "\\|").replace("\n", " ")
+
+        lines = [f"## #{seed.idnum:03d} {cell(seed.name)}", "", "| | |", "|---|---|"]
+        lines.extend(f"| {label} | {cell(value)} |" for label, value in _details(seed) if value)
+        stats = _stats(seed)
+        if stats:
+            lines.append("")
+            lines.append("| " + " | ".join(key for key, _ in stats) + " |")
+            lines.append("|" + "---:|" * len(stats))
+            lines.append("| " + " | ".join(cell(value) for _, value in stats) + " |")
+        return "\n".join(lines) + "\n\n"
+
+
+@register_renderer("csv")
+class CsvRenderer(Renderer):
+    """One row per monster; list fields are joined with '; ', stats get a column each."""
+
+    extension = ".csv"
+    COLUMNS = (
+        "idnum", "name", "form", "primary_type", "secondary_type", "habitat",
+        *STAT_ORDER,
+        "major_mutagens", "utility_mutagens", "physical_traits", "held_item",
+        "mood", "affinity", "tags", "resist", "weak", "unique_id",
+    )
+
+    def _row(self, values) -> str:
+        buffer = io.StringIO()
+        csv.writer(buffer, lineterminator="\n").writerow(values)
+        return buffer.getvalue()
+
+    def header(self) -> str:
+        return self._row(self.COLUMNS)
+
+    def render(self, seed: MonsterSeed) -> str:
+        def listed(values) -> str:
+            return "; ".join(str(v) for v in values or [])
+
+        tempers = seed.tempers or {}
+        return self._row(
+            [
+                seed.idnum, seed.name, seed.form, seed.primary_type, seed.secondary_type or "", seed.habitat,
+                *(seed.stats.get(key, "") for key in STAT_ORDER),
+                listed(seed.mutagens.get("major")), listed(seed.mutagens.get("utility")),
+                listed(seed.physical_traits), seed.held_item or "",
+                tempers.get("mood", ""), tempers.get("affinity", ""),
+                listed(seed.meta.get("tags")), listed(seed.meta.get("resist")), listed(seed.meta.get("weak")),
+                seed.meta.get("unique_id", ""),
+            ]
+        )
+
+
+@register_renderer("html")
+class HtmlRenderer(Renderer):
+    """A standalone page with one <article> per monster; no scripts or external assets."""
+
+    extension = ".html"
+    overwrite = True
+    TITLE = "Monster Catalog"
+    STYLE = (
+        "body{font-family:sans-serif;max-width:60em;margin:auto;padding:1em}"
+        "article{border-top:1px solid #ccc;padding:.5em 0}"
+        "dl{display:grid;grid-template-columns:max-content auto;gap:.2em 1em}dt{font-weight:bold}"
+        "table{border-collapse:collapse}th,td{border:1px solid #ccc;padding:.2em .5em;text-align:right}"
+    )
+
+    def header(self) -> str:
+        return (
+            '<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="utf-8">\n'
+            f"<title>{self.TITLE}</title>\n<style>{self.STYLE}</style>\n</head>\n<body>\n"
+            f"<h1>{self.TITLE}</h1>\n"
+        )
+
+    def footer(self) -> str:
+        return "</body>\n</html>\n"
+
+    def render(self, seed: MonsterSeed) -> str:
+        esc = html.escape
+        parts = [f'<article id="mon-{seed.idnum:03d}">\n<h2>#{seed.idnum:03d} {esc(seed.name)}</h2>\n<dl>\n']
+        parts.extend(f"<dt>{label}</dt><dd>{esc(value)}</dd>\n" for label, value in _details(seed) if value)
+        parts.append("</dl>\n")
+        stats = _stats(seed)
+        if stats:
+            parts.append("<table>\n<tr>" + "".join(f"<th>{key}</th>" for key, _ in stats) + "</tr>\n")
+            parts.append("<tr>" + "".join(f"<td>{esc(value)}</td>" for _, value in stats) + "</tr>\n</table>\n")
+        parts.append("</article>\n")
+        return "".join(parts)
+
+
+@register_renderer("ndjson")
+class NdjsonRenderer(Renderer):
+    """One seed JSON object per line (the same records as sink(jsonl=...))."""
+
+    extension = ".ndjson"
+
+    def render(self, seed: MonsterSeed) -> str:
+        return json.dumps(asdict(seed), ensure_ascii=False) + "\n"
@@ -1,24 +1,48 @@
-import copy
+"""
+This module contains the logic for re-rolling attributes of existing monsters. A
+cached monster is loaded, the chosen attributes are drawn again, and only the
+fields that depend on them are recomputed. The new monster is saved to the cache
+with a new PIN and a link back to its parent (meta['lineage'], indexed by
+monster_cache.lineage()).
+
+A seed's fields are either rolled (drawn by the generator) or derived from other
+fields. The derived fields form a small dependency graph:
+
+    stats <- primary_type, secondary_type, mutagens.major, mutagens.utility
+    meta  <- primary_type, secondary_type, mutagens.major, mutagens.utility
+    name  <- idnum, primary_type, secondary_type, form, mutagens.major
+    text  <- every field (dex entries and prompts, rendered by the caller)
+
+Re-rolling traits therefore only dirties `text`, while re-rolling the major
+mutagens also recomputes stats, meta and the name. A new reroll option only
+needs an entry in REROLLS naming the fields it draws.
+"""
+
 import random
-from typing import Any
+from dataclasses import replace
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Tuple
 
 from . import mon_forge, monster_cache
-from .data.data import HELD_ITEMS, MAJOR_MODS, PHYSICAL_TRAITS, UTILITY_MODS
+from .data import data
+from .forge_name import forge_monster_name
+from .pipeline import make_pool
 from .monsterseed import (
+    HELD_ITEM_CHANCE,
+    SINGLE_TRAIT_CHANCE,
     MonsterSeed,
     calculate_base_stats,
     get_base_meta,
+    habitat_choices,
+    mutagen_choices,
+    spawn_rng,
     weighted_choice,
 )
 
-"""
-This module contains the logic for re-rolling attributes of existing monsters. This is achieved by loading a cached monster, surgically modifying its attributes, and then re-running the necessary parts of the generation pipeline to ensure consistency. The new monster is saved to the cache with a new PIN.
-"""
-
-mutation_context = "species" | "instance" | "encounter"
+# Times an option is drawn again when it comes out the same as before.
+MAX_TRIES = 10
 
 
-def _choose_physical_traits() -> list[str]:
+def _choose_physical_traits(rng: Optional[random.Random] = None) -> List[str]:
     '''
     Summary:
         Selects one or two random physical traits based on weighted choices.
@@ -26,11 +50,12 @@ def _choose_physical_traits() -> list[str]:
     Returns:
         A list containing one or two randomly selected physical traits.
     '''
-    num_physical = 1 if random.random() < 0.75 else 2
-    return [weighted_choice(PHYSICAL_TRAITS) for _ in range(num_physical)]
+    rng = rng or random
+    num_physical = 1 if rng.random() < SINGLE_TRAIT_CHANCE else 2
+    return [weighted_choice(data.PHYSICAL_TRAITS, rng) for _ in range(num_physical)]
 
 
-def _choose_held_item() -> str | None:
+def _choose_held_item(rng: Optional[random.Random] = None) -> Optional[str]:
     '''
     Summary:
         Selects a random held item with a 40% probability.
@@ -38,56 +63,203 @@ def _choose_held_item() -> str | None:
     Returns:
         A string representing the chosen held item, or None if no item is chosen.
     '''
-    return weighted_choice(HELD_ITEMS) if random.random() < 0.4 else None
+    rng = rng or random
+    return weighted_choice(data.HELD_ITEMS, rng) if rng.random() < HELD_ITEM_CHANCE else None
+
+
+def _types(seed: MonsterSeed) -> set:
+    return {seed.primary_type} | ({seed.secondary_type} if seed.secondary_type else set())
+
+
+def _choose_bucket(seed: MonsterSeed, bucket: str, rng: Optional[random.Random]) -> List[str]:
+    # Draws a mutagen bucket the way the generator fills it: the forge-time pick,
+    # then as many apply_mutagens() picks as the seed had.
+    mods = data.MAJOR_MODS if bucket == "major" else data.UTILITY_MODS
+    other = "utility" if bucket == "major" else "major"
+    forge_pick = weighted_choice(mutagen_choices(mods, seed.primary_type, seed.secondary_type), rng)
+    applied = max(len(seed.mutagens.get(bucket, [])) - 1, 0)
+    existing = {forge_pick} | {str(m) for m in seed.mutagens.get(other, [])}
+    pool = mon_forge._eligible_mutagens(bucket, _types(seed), existing)
+    return [forge_pick] + mon_forge.weighted_sample_without_replacement(pool, applied, rng)
+
+
+def _choose_habitat(seed: MonsterSeed, rng: Optional[random.Random]) -> str:
+    raw = habitat_choices(seed.primary_type)
+    if isinstance(raw, Mapping):
+        return weighted_choice(raw, rng)
+    if isinstance(raw, (list, tuple)):
+        return (rng or random).choice(raw) if raw else "Generic"
+    return raw or "Generic"
+
+
+# Reroll option -> draws new values for the rolled fields it covers.
+REROLLS: Dict[str, Callable[[MonsterSeed, Optional[random.Random]], Dict[str, Any]]] = {
+    "traits": lambda seed, rng: {"physical_traits": _choose_physical_traits(rng)},
+    "held_item": lambda seed, rng: {"held_item": _choose_held_item(rng)},
+    "tempers": lambda seed, rng: {
+        "tempers": {
+            "mood": weighted_choice(data.TEMPERS_COUPLED["mood"], rng),
+            "affinity": weighted_choice(data.TEMPERS_COUPLED["affinity"], rng),
+        }
+    },
+    "habitat": lambda seed, rng: {"habitat": _choose_habitat(seed, rng)},
+    "majors": lambda seed, rng: {"mutagens.major": _choose_bucket(seed, "major", rng)},
+    "utilities": lambda seed, rng: {"mutagens.utility": _choose_bucket(seed, "utility", rng)},
+}
+
+# Meta keys computed from types and mutagens; any other meta key is carried over.
+DERIVED_META_KEYS = frozenset({"tags", "resist", "weak", "abilities", "triggers"})
+
+
+def _applied_mutagens(seed: MonsterSeed) -> Iterable[Dict[str, Any]]:
+    # The forge-time pick of each bucket shapes the species but carries no
+    # effects; only apply_mutagens() picks (the rest) change stats and meta,
+    # majors before utilities.
+    for bucket, mods in (("major", data.MAJOR_MODS), ("utility", data.UTILITY_MODS)):
+        for key in seed.mutagens.get(bucket, [])[1:]:
+            mod_def = mods.get(key)
+            if mod_def:
+                yield mod_def
+
+
+def _derive_stats(seed: MonsterSeed) -> Dict[str, int]:
+    stats = calculate_base_stats(seed.primary_type, seed.secondary_type)
+    for mod_def in _applied_mutagens(seed):
+        mon_forge.apply_mutagen_effects(stats, {}, mod_def)
+    return stats
+
+
+def _derive_meta(seed: MonsterSeed) -> Dict[str, Any]:
+    meta = get_base_meta(seed.primary_type, seed.secondary_type)
+    for mod_def in _applied_mutagens(seed):
+        mon_forge.apply_mutagen_effects({}, meta, mod_def)
+    return {**{k: v for k, v in seed.meta.items() if k not in DERIVED_META_KEYS}, **meta}
+
+
+# Derived field -> (fields it is computed from, how to compute it), in
+# dependency order. "text" has no deriver: renderers run on the finished seed.
+DERIVED: Dict[str, Tuple[FrozenSet[str], Optional[Callable[[MonsterSeed], Any]]]] = {
+    "stats": (frozenset({"primary_type", "secondary_type", "mutagens.major", "mutagens.utility"}), _derive_stats),
+    "meta": (frozenset({"primary_type", "secondary_type", "mutagens.major", "mutagens.utility"}), _derive_meta),
+    "name": (frozenset({"idnum", "primary_type", "secondary_type", "form", "mutagens.major"}), forge_monster_name),
+    "text": (frozenset({"*"}), None),
+}
+
+
+def dirty_fields(changed: Iterable[str]) -> FrozenSet[str]:
+    """
+    Summary:
+        The derived fields that must be recomputed after `changed` fields change,
+        following the dependency graph (every change dirties "text").
+    """
+    dirty = set(changed)
+    for field, (depends_on, _) in DERIVED.items():
+        if dirty and ("*" in depends_on or dirty & depends_on):
+            dirty.add(field)
+    return frozenset(dirty & set(DERIVED))
 
 
-def apply_mutagens_to_stats(
-    base_stats: dict[str, int], base_meta: dict[str, list], mutagens: list[str]
-) -> tuple[dict[str, int], dict[str, Any]]:
+def _set(seed: MonsterSeed, field: str, value: Any) -> None:
+    if field.startswith("mutagens."):
+        seed.mutagens = {**seed.mutagens, field.split(".", 1)[1]: value}
+    else:
+        setattr(seed, field, value)
+
+
+def _get(seed: MonsterSeed, field: str) -> Any:
+    if field.startswith("mutagens."):
+        return seed.mutagens.get(field.split(".", 1)[1])
+    return getattr(seed, field)
+
+
+def reroll(
+    seed: MonsterSeed, options: Iterable[str], rng: Optional[random.Random] = None
+) -> Tuple[MonsterSeed, FrozenSet[str]]:
     """
-    Applies a list of mutagens to a set of base stats and returns the new stats and meta.
-    This function takes a clean set of stats and meta dictionaries and applies the
-    effects of the provided mutagens (both major and utility) to them.
-    base_stats: A dictionary of the monster's stats before any mutagens are applied.
-    base_meta: A dictionary of the monster's meta attributes (tags, resistances, etc.) before any mutagens are applied.
-    mutagens: A list of strings representing the keys of the mutagens to apply.
-        Returns: A tuple containing the modified stats dictionary and the modified meta dictionary.
+    Summary:
+        Returns a copy of `seed` with the given attributes drawn again and only
+        the derived fields that depend on them recomputed. Each option is drawn
+        again (up to MAX_TRIES times) if it comes out unchanged. The copy is
+        shallow: fields that did not change are shared with `seed`, and the
+        copy's meta has no unique_id, so saving it gives it a new PIN. If `seed`
+        has a PIN, the copy's meta['lineage'] records it as the parent_id, with
+        the family's root_id and a generation one past the parent's.
+
+    Args:
+        seed: The monster to start from; it is not modified.
+        options: Keys of REROLLS, e.g. ("traits", "majors").
+        rng: Random source to draw from (defaults to the global `random` module).
+
+    Returns:
+        The new seed and the set of fields that changed, rolled and derived
+        ("text" included whenever anything changed).
+
+    Raises:
+        ValueError: If an option is not a key of REROLLS.
     """
+    options = tuple(options)
+    unknown = sorted(set(options) - set(REROLLS))
+    if unknown:
+        raise ValueError(f"Unknown reroll option(s): {', '.join(unknown)}; use {', '.join(REROLLS)}")
+
+    meta = {k: v for k, v in seed.meta.items() if k != "unique_id"}
+    parent_id = seed.meta.get("unique_id")
+    if parent_id:
+        parent = seed.meta.get("lineage") or {}
+        meta["lineage"] = {
+            "parent_id": parent_id,
+            "root_id": parent.get("root_id", parent_id),
+            "generation": parent.get("generation", 0) + 1,
+        }
+    new = replace(seed, meta=meta)
+    changed = set()
+    for option in options:
+        for _ in range(MAX_TRIES):
+            values = REROLLS[option](new, rng)
+            if any(_get(new, field) != value for field, value in values.items()):
+                break
+        for field, value in values.items():
+            if _get(new, field) != value:
+                _set(new, field, value)
+                changed.add(field)
+
+    dirty = dirty_fields(changed)
+    for field, (_, derive) in DERIVED.items():
+        if field in dirty and derive is not None:
+            setattr(new, field, derive(new))
+    return new, frozenset(changed | dirty)
 
-    stats = copy.deepcopy(base_stats)
-    meta = copy.deepcopy(base_meta)
 
-    all_mods = {**MAJOR_MODS, **UTILITY_MODS}
+def apply_mutagens_to_stats(
+    base_stats: Dict[str, int], base_meta: Dict[str, List[str]], mutagens: List[str]
+) -> Tuple[Dict[str, int], Dict[str, Any]]:
+    """
+    Summary:
+        Applies a list of mutagens (major or utility keys) to copies of a set of
+        base stats and meta and returns the new stats and meta.
 
+    Args:
+        base_stats: The monster's stats before any mutagens are applied.
+        base_meta: The monster's meta attributes (tags, resistances, etc.) before any mutagens are applied.
+        mutagens: The keys of the mutagens to apply, in order.
+
+    Returns:
+        A tuple of the modified stats dictionary and the modified meta dictionary.
+    """
+    stats = dict(base_stats)
+    meta = {k: list(v) if isinstance(v, list) else v for k, v in base_meta.items()}
+    all_mods = {**data.MAJOR_MODS, **data.UTILITY_MODS}
     for mutagen_key in mutagens:
         mod_def = all_mods.get(mutagen_key)
         if mod_def:
-            # multiplicative adjustments
-            for stat, mult in mod_def.get("mul", {}).items():
-                if stat in stats:
-                    stats[stat] = int(round(stats[stat] * mult))
-            # additive adjustments
-            for stat, add in mod_def.get("add", {}).items():
-                if stat in stats and isinstance(add, (int, float)):
-                    stats[stat] += int(round(add))
-            # tags/resists/weaknesses
-            for tag in mod_def.get("tags", []):
-                if isinstance(tag, str) and tag.startswith("Resist:"):
-                    meta.setdefault("resist", []).append(tag.split(":", 1)[1])
-                elif isinstance(tag, str) and tag.startswith("Weak:"):
-                    meta.setdefault("weak", []).append(tag.split(":", 1)[1])
-                else:
-                    meta.setdefault("tags", []).append(tag)
+            mon_forge.apply_mutagen_effects(stats, meta, mod_def)
     return stats, meta
 
 
-def reroll_monster_attributes(pin: str, reroll_options: dict) -> MonsterSeed | None:
+def reroll_monster_attributes(pin: str, reroll_options: dict) -> Optional[MonsterSeed]:
     """
-    Loads a monster, re-rolls attributes, saves it as new, and returns the seed.
-
-    This is the main function for the re-roll feature. It orchestrates the process of
-    loading a monster, recalculating its attributes based on user choices,
-    re-forging its name, and saving it as a new entry in the monster cache.
+    Summary:
+        Loads a monster, re-rolls attributes, saves it as new, and returns the seed.
 
     Args:
         pin: The 10-character unique ID of the monster to be re-rolled.
@@ -96,77 +268,79 @@ def reroll_monster_attributes(pin: str, reroll_options: dict) -> MonsterSeed | N
 
     Returns:
         The MonsterSeed of the newly created monster, or None if the original
-        monster was not found or the re-roll could not be completed.
+        monster was not found.
     """
-    original_monster = monster_cache.load_monster(pin)
-    if not original_monster:
+    try:
+        original_monster = monster_cache.load_monster(pin)
+    except KeyError:
         print(f"Error: Monster with PIN {pin} not found in cache.")
         return None
 
-    new_monster = copy.deepcopy(original_monster)
-
-    rerolled = False
-    if reroll_options.get("traits"):
-        new_monster.physical_traits = _choose_physical_traits()
-        rerolled = True
-        print("Re-rolled physical traits.")
-
-    if reroll_options.get("majors"):
-        # 1. Calculate base stats and meta from types to get a clean slate
-        base_stats = calculate_base_stats(
-            new_monster.primary_type, new_monster.secondary_type
-        )
-        base_meta = get_base_meta(new_monster.primary_type, new_monster.secondary_type)
-
-        # 2. Select a new major mutagen that is compatible and not the same as the old one
-        old_majors = new_monster.mutagens.get("major", [])
-        monster_types = {new_monster.primary_type}
-        if new_monster.secondary_type:
-            monster_types.add(new_monster.secondary_type)
-
-        available_majors = {}
-        for key, mod_def in MAJOR_MODS.items():
-            if key in old_majors:
-                continue
-
-            required = mod_def.get("required_types", []) or []
-            incompatible = mod_def.get("incompatible_types", []) or []
-
-            if not all(t in monster_types for t in required):
-                continue
-            if any(t in monster_types for t in incompatible):
-                continue
-
-            available_majors[key] = mon_forge.rarity_to_weight(
-                mod_def.get("rarity", 1.0)
-            )
-
-        if not available_majors:
-            print("No other compatible major mutagens available to re-roll to.")
-            return None
-
-        new_major = weighted_choice(available_majors)
-        new_monster.mutagens["major"] = [new_major]
-        print(f"Re-rolled major mutagen to: {new_major}")
-
-        # 3. Re-apply all mutagens (new major + old utilities) to the clean stats and meta
-        utility_mutagens = new_monster.mutagens.get("utility", [])
-        all_mutagens = new_monster.mutagens["major"] + utility_mutagens
-
-        new_stats, new_meta = apply_mutagens_to_stats(
-            base_stats, base_meta, all_mutagens
-        )
-        new_monster.stats = new_stats
-        new_monster.meta = new_meta
-
-        rerolled = True
-
-    if rerolled:
-        # 4. Re-forge the name and save the new monster
-        new_monster = mon_forge.forge_monster_name(new_monster)
-        monster_cache.save_monster(new_monster)
-        print(f"Successfully re-rolled monster. New PIN: {new_monster.meta.get('pin')}")
-        return new_monster
-
-    print("No attributes were re-rolled.")
-    return original_monster
+    options = [option for option, wanted in reroll_options.items() if wanted]
+    if not options:
+        print("No attributes were re-rolled.")
+        return original_monster
+
+    new_monster, changed = reroll(original_monster, options)
+    for option in options:
+        print(f"Re-rolled {option.replace('_', ' ')}.")
+    recomputed = sorted(changed & (set(DERIVED) - {"text"}))
+    if recomputed:
+        print(f"Recomputed: {', '.join(recomputed)}.")
+    new_pin = monster_cache.save_monster(new_monster)
+    print(f"Successfully re-rolled monster. New PIN: {new_pin}")
+    return new_monster
+
+
+def _reroll_one(task: Tuple[str, MonsterSeed, Tuple[str, ...], int]) -> MonsterSeed:
+    pin, seed, options, run_seed = task
+    return reroll(seed, options, spawn_rng(run_seed, pin))[0]
+
+
+def reroll_many(
+    pins: Iterable[str],
+    options: Sequence[str],
+    run_seed: Optional[int] = None,
+    workers: int = 1,
+    compact: Optional[bool] = None,
+) -> Dict[str, Any]:
+    """
+    Summary:
+        Re-rolls many cached monsters in one pass: the PINs are resolved with a
+        single cache read (monster_cache.load_monsters), re-rolled across a worker
+        pool, and the new monsters appended through one buffered write
+        (monster_cache.save_monsters). Each PIN draws from spawn_rng(run_seed, pin),
+        so the same run seed re-rolls a PIN the same way for any worker count or
+        list order.
+
+    Args:
+        pins: PINs of the monsters to re-roll; repeats are re-rolled once.
+        options: Keys of REROLLS, e.g. ("majors",).
+        run_seed: Seed of the pass (default: random; returned in the result).
+        workers: Worker processes to re-roll in.
+        compact: Store compact records, as for monster_cache.save_monster().
+
+    Returns:
+        A dict with the "run_seed", "rerolled" (old PIN -> new PIN, in input
+        order) and "failed" (PIN -> reason it was not found or not loadable).
+
+    Raises:
+        ValueError: If an option is not a key of REROLLS.
+    """
+    options = tuple(options)
+    unknown = sorted(set(options) - set(REROLLS))
+    if unknown:
+        raise ValueError(f"Unknown reroll option(s): {', '.join(unknown)}; use {', '.join(REROLLS)}")
+    if run_seed is None:
+        run_seed = random.getrandbits(63)
+
+    seeds, failed = monster_cache.load_monsters(pins)
+    tasks = [(pin, seed, options, run_seed) for pin, seed in seeds.items()]
+    if workers > 1 and len(tasks) > 1:
+        with make_pool(workers) as pool:
+            rerolled = list(pool.map(_reroll_one, tasks, chunksize=max(1, len(tasks) // (workers * 4))))
+    else:
+        rerolled = [_reroll_one(task) for task in tasks]
+
+    new_pins = monster_cache.save_monsters(rerolled, compact)
+    return {"run_seed": run_seed, "rerolled": dict(zip(seeds, new_pins)), "failed": failed}
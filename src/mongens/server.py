@@ -0,0 +1,252 @@
+"""
+Long-running `mongen serve` daemon and the client used by `mongen --remote`.
+
+The daemon keeps the data tables, derived samplers and the monster cache index
+loaded and runs CLI invocations sent to it over a Unix domain socket, so build
+scripts calling mongen thousands of times skip the per-process import and load.
+
+Protocol: one JSON object per line in each direction, any number of requests per
+connection.
+    request:  {"argv": ["dexentry", "-c", "3"], "cwd": "/path/the/client/ran/in",
+               "stdin": "..."}
+    response: {"exit": 0, "stdout": "...", "stderr": "..."}
+
+"stdin" is optional: the client sends its standard input only for commands that
+read it ('-' arguments), and a command run by the daemon never sees the daemon's
+own stdin, only the request's (empty when absent).
+
+The socket is created owner-only (umask 077 around the bind): whoever can connect
+can run any command as the daemon's owner.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+
+def default_socket_path() -> Path:
+    """
+    Summary:
+        Socket path used when none is given: $MONGENS_SOCKET, else a per-user
+        socket in $XDG_RUNTIME_DIR (or the temp directory).
+    """
+    env = os.environ.get("MONGENS_SOCKET")
+    if env:
+        return Path(env)
+    base = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    uid = getattr(os, "getuid", lambda: 0)()
+    return Path(base) / f"mongen-{uid}.sock"
+
+
+def run_command(argv: Sequence[str], cwd: Optional[str] = None, stdin: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Summary:
+        Runs one CLI invocation in this process and captures what it prints.
+
+    Args:
+        argv: Arguments as they would follow `mongen` on the command line.
+        cwd: Directory to resolve relative paths against (the client's cwd).
+        stdin: Text the command reads as standard input (default: none).
+
+    Returns:
+        A dict with the "exit" code and the captured "stdout" and "stderr".
+    """
+    from .cli import main
+
+    out, err = io.StringIO(), io.StringIO()
+    code = 0
+    previous, previous_stdin = os.getcwd(), sys.stdin
+    try:
+        if cwd:
+            os.chdir(cwd)
+        sys.stdin = io.StringIO(stdin or "")
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            try:
+                main(list(argv))
+            except SystemExit as e:
+                if isinstance(e.code, str):
+                    err.write(e.code + "\n")
+                code = e.code if isinstance(e.code, int) else int(e.code is not None)
+            except Exception as e:
+                err.write(f"Error: {type(e).__name__}: {e}\n")
+                code = 1
+    finally:
+        sys.stdin = previous_stdin
+        os.chdir(previous)
+    return {"exit": code, "stdout": out.getvalue(), "stderr": err.getvalue()}
+
+
+def reads_stdin(argv: Sequence[str]) -> bool:
+    """
+    Summary:
+        Whether a command line reads standard input: a '-' argument
+        (`batch -`, `--pins-file -` or `--pins-file=-`).
+    """
+    return any(arg == "-" or arg.endswith("=-") for arg in argv)
+
+
+def _warm() -> None:
+    # Load everything a command may need once, up front.
+    from . import dex_entries, forge_name, mon_forge, monster_cache, prompt_engine  # noqa: F401
+    from .data import data
+
+    data.derived("mutagen_pools")
+    monster_cache._refresh_index()
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        from .data import data
+
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+                argv = [str(a) for a in request["argv"]]
+                stdin = request.get("stdin")
+                if stdin is not None and not isinstance(stdin, str):
+                    raise TypeError("stdin")
+            except (ValueError, KeyError, TypeError):
+                response = {"exit": 2, "stdout": "", "stderr": "mongen serve: malformed request\n"}
+            else:
+                # Pick up edited data files; keep serving the old tables if they don't load.
+                warning = ""
+                try:
+                    data.reload()
+                except Exception as e:
+                    warning = f"Warning: data reload failed, using previous tables: {e}\n"
+                response = run_command(argv, request.get("cwd"), stdin)
+                response["stderr"] = warning + response["stderr"]
+            self.wfile.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+
+def make_server(socket_path: Optional[Union[str, Path]] = None) -> socketserver.UnixStreamServer:
+    """
+    Summary:
+        Loads the data and binds the daemon's socket without serving yet.
+        Requests are handled one at a time: commands share the global RNG and
+        the process-wide stdout redirection.
+
+    Raises:
+        RuntimeError: If another daemon is already listening on the socket, or
+            the socket path belongs to another user.
+    """
+    path = Path(socket_path) if socket_path else default_socket_path()
+    if path.exists():
+        try:
+            if ping(path):
+                raise RuntimeError(f"A mongen daemon is already listening on {path}")
+            path.unlink()  # left behind by a daemon that did not shut down cleanly
+        except PermissionError as e:
+            raise RuntimeError(f"{e}; pass --socket or set MONGENS_SOCKET to use another path") from None
+    _warm()
+    # Owner-only from the moment it exists; a chmod after bind() leaves a window.
+    umask = os.umask(0o077)
+    try:
+        server = socketserver.UnixStreamServer(str(path), _Handler)
+    finally:
+        os.umask(umask)
+    return server
+
+
+def serve(socket_path: Optional[Union[str, Path]] = None) -> None:
+    """
+    Summary:
+        Runs the daemon until interrupted (Ctrl+C or SIGTERM), then removes the socket.
+    """
+    server = make_server(socket_path)
+    path = Path(server.server_address)
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    print(f"mongen daemon listening on {path} (pid {os.getpid()}); Ctrl+C to stop", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if path.exists():
+            path.unlink()
+
+
+def _connect(path: Path, timeout: Optional[float]) -> Optional[socket.socket]:
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(str(path))
+    except (FileNotFoundError, ConnectionRefusedError, socket.timeout):
+        sock.close()
+        return None
+    except PermissionError:
+        sock.close()
+        raise PermissionError(f"Not allowed to use the socket {path} (owned by another user?)") from None
+    return sock
+
+
+def ping(socket_path: Optional[Union[str, Path]] = None) -> bool:
+    """
+    Summary:
+        Whether a daemon is accepting connections on the socket.
+
+    Raises:
+        PermissionError: If the socket path is not ours to connect to.
+    """
+    sock = _connect(Path(socket_path) if socket_path else default_socket_path(), 1.0)
+    if sock is None:
+        return False
+    sock.close()
+    return True
+
+
+def request(
+    argv: List[str],
+    socket_path: Optional[Union[str, Path]] = None,
+    timeout: Optional[float] = None,
+    stdin: Optional[str] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Summary:
+        Sends one CLI invocation to a running daemon.
+
+    Args:
+        argv: Arguments as they would follow `mongen` on the command line.
+        socket_path: The daemon's socket (default: default_socket_path()).
+        timeout: Seconds to wait for the connection and the response.
+        stdin: Standard input for the command (see reads_stdin()).
+
+    Returns:
+        The daemon's response dict, or None if no daemon is listening.
+
+    Raises:
+        ConnectionError: If the daemon accepted the request but closed the
+            connection without answering.
+        PermissionError: If the socket path is not ours to connect to.
+    """
+    sock = _connect(Path(socket_path) if socket_path else default_socket_path(), timeout)
+    if sock is None:
+        return None
+    with sock, sock.makefile("rwb") as f:
+        payload = {"argv": list(argv), "cwd": os.getcwd()}
+        if stdin is not None:
+            payload["stdin"] = stdin
+        f.write(json.dumps(payload).encode("utf-8") + b"\n")
+        f.flush()
+        line = f.readline()
+    if not line:
+        raise ConnectionError("mongen daemon closed the connection without a response")
+    return json.loads(line)
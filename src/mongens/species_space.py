@@ -0,0 +1,215 @@
+"""
+Exhaustive enumeration of the species space.
+
+Every (primary, secondary, form, habitat, major mutagen, utility mutagen)
+combination that MonsterSeed.forge() can produce under a spec, each with its
+exact sampling probability, generated lazily:
+
+    for combo in iter_species(Spec("Axiom", "random")):
+        ...                                   # combo.probability, combo.form, ...
+
+    count_species()                           # size of the space, without iterating it
+    validate_species(check, workers=4)        # stream every combo through check()
+
+The probabilities multiply the draws forge() makes (type pair, then form,
+habitat, major and utility mutagen, each independent given the pair), so they
+sum to 1 over the space. Combinations with zero probability are left out.
+Balance checks run over this space cover corners random sampling rarely hits.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Mapping, NamedTuple, Optional, Tuple, Union
+
+from .analysis import Distribution, choice_distribution, pair_distribution
+from .data import data
+from .monsterseed import MonsterSeed, form_choices, habitat_choices, mutagen_choices, spawn_rng
+from .pipeline import Spec
+
+
+class Combo(NamedTuple):
+    """One point of the species space and the probability forge() produces it."""
+
+    primary_type: str
+    secondary_type: Optional[str]
+    form: str
+    habitat: str
+    major: str
+    utility: str
+    probability: float
+
+
+def _pair_factors(p: str, s: Optional[str]) -> Tuple[Distribution, Distribution, Distribution, Distribution]:
+    return (
+        choice_distribution(form_choices(p), "Unknown"),
+        choice_distribution(habitat_choices(p), "Generic"),
+        choice_distribution(mutagen_choices(data.MAJOR_MODS, p, s)),
+        choice_distribution(mutagen_choices(data.UTILITY_MODS, p, s)),
+    )
+
+
+def _pairs(spec: Spec, primaries: Optional[Tuple[str, ...]]) -> Distribution:
+    pairs = pair_distribution(spec)
+    if primaries is not None:
+        pairs = tuple(entry for entry in pairs if entry[0][0] in primaries)
+    return pairs
+
+
+def count_species(
+    spec: Union[Spec, Mapping[str, Any], None] = None, by_primary: bool = False
+) -> Union[int, Dict[str, int]]:
+    """
+    Summary:
+        Size of the species space, computed from the per-pair choice counts
+        without enumerating the combinations.
+
+    Args:
+        spec: Type constraints (defaults to fully random types).
+        by_primary: Return a dict of primary type -> count instead of the total.
+    """
+    counts: Dict[str, int] = {}
+    for (p, s), _ in pair_distribution(spec):
+        forms, habitats, majors, utilities = _pair_factors(p, s)
+        counts[p] = counts.get(p, 0) + len(forms) * len(habitats) * len(majors) * len(utilities)
+    return counts if by_primary else sum(counts.values())
+
+
+def iter_species(
+    spec: Union[Spec, Mapping[str, Any], None] = None,
+    primaries: Optional[Tuple[str, ...]] = None,
+) -> Iterator[Combo]:
+    """
+    Summary:
+        Lazily yields every combination in the species space with its exact
+        sampling probability. Memory use does not grow with the space.
+
+    Args:
+        spec: Type constraints (defaults to fully random types).
+        primaries: Only yield combinations with one of these primary types.
+
+    Raises:
+        ValueError: If no legal pair meets the spec.
+    """
+    for (p, s), pair_prob in _pairs(Spec.coerce(spec), primaries):
+        forms, habitats, majors, utilities = _pair_factors(p, s)
+        for form, form_prob in forms:
+            for habitat, habitat_prob in habitats:
+                base = pair_prob * form_prob * habitat_prob
+                for major, major_prob in majors:
+                    for utility, utility_prob in utilities:
+                        yield Combo(p, s, form, habitat, major, utility, base * major_prob * utility_prob)
+
+
+def materialize(combo: Combo, idnum: int = 1, rng: Any = None) -> MonsterSeed:
+    """
+    Summary:
+        Builds the full MonsterSeed for a combination. Attributes outside the
+        species space (tempers, physical traits, held item) are drawn from `rng`.
+    """
+    return MonsterSeed.from_choices(
+        idnum,
+        combo.primary_type,
+        combo.secondary_type,
+        combo.form,
+        combo.habitat,
+        combo.major,
+        combo.utility,
+        rng,
+    )
+
+
+def iter_seeds(
+    spec: Union[Spec, Mapping[str, Any], None] = None,
+    run_seed: int = 0,
+    primaries: Optional[Tuple[str, ...]] = None,
+    start: int = 0,
+) -> Iterator[Tuple[Combo, MonsterSeed]]:
+    """
+    Summary:
+        Like iter_species(), but also materializes each combination. Combination
+        `i` gets dex number start + i + 1 and the RNG spawn_rng(run_seed, start + i).
+    """
+    for i, combo in enumerate(iter_species(spec, primaries), start=start):
+        yield combo, materialize(combo, i + 1, spawn_rng(run_seed, i))
+
+
+Check = Callable[..., Optional[str]]
+
+
+def _validate_primary(
+    args: Tuple[Spec, str, Check, bool, int, int, int]
+) -> Dict[str, Any]:
+    spec, primary, check, with_seeds, run_seed, start, max_failures = args
+    combos = 0
+    probability = 0.0
+    failed = 0
+    failures: List[Tuple[Combo, str]] = []
+    if with_seeds:
+        stream: Iterator[Tuple[Combo, Any]] = iter_seeds(spec, run_seed, (primary,), start)
+    else:
+        stream = ((combo, None) for combo in iter_species(spec, (primary,)))
+    for combo, seed in stream:
+        combos += 1
+        probability += combo.probability
+        problem = check(combo, seed) if with_seeds else check(combo)
+        if problem:
+            failed += 1
+            if len(failures) < max_failures:
+                failures.append((combo, problem))
+    return {"combos": combos, "probability": probability, "failed": failed, "failures": failures}
+
+
+def validate_species(
+    check: Check,
+    spec: Union[Spec, Mapping[str, Any], None] = None,
+    workers: int = 1,
+    materialize_seeds: bool = False,
+    run_seed: int = 0,
+    max_failures: int = 100,
+) -> Dict[str, Any]:
+    """
+    Summary:
+        Streams every combination in the species space through `check` without
+        holding the space in memory, optionally splitting the work by primary
+        type across worker processes.
+
+    Args:
+        check: Called as check(combo), or check(combo, seed) with
+            materialize_seeds; returns a problem description or None. Use a
+            module-level function when workers > 1.
+        spec: Type constraints (defaults to fully random types).
+        workers: Worker processes, one primary type per task.
+        materialize_seeds: Build each combination's MonsterSeed (see iter_seeds())
+            for the check. Seeds match a serial iter_seeds(spec, run_seed) run.
+        run_seed: Run seed for materialized seeds.
+        max_failures: Failures kept in the result; all are counted.
+
+    Returns:
+        A dict with "expected" (count_species()), "combos" checked, their total
+        "probability" (1.0 up to rounding for a full space), the number "failed",
+        and up to max_failures (combo, problem) pairs in "failures".
+    """
+    spec = Spec.coerce(spec)
+    counts = count_species(spec, by_primary=True)
+    tasks = []
+    start = 0
+    for primary, count in counts.items():
+        tasks.append((spec, primary, check, materialize_seeds, run_seed, start, max_failures))
+        start += count
+
+    if workers > 1 and len(tasks) > 1:
+        data.freeze_for_fork()
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_validate_primary, tasks))
+    else:
+        parts = [_validate_primary(task) for task in tasks]
+
+    failures = [f for part in parts for f in part["failures"]][:max_failures]
+    return {
+        "expected": sum(counts.values()),
+        "combos": sum(part["combos"] for part in parts),
+        "probability": sum(part["probability"] for part in parts),
+        "failed": sum(part["failed"] for part in parts),
+        "failures": failures,
+    }
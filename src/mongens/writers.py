@@ -0,0 +1,75 @@
+import json
+import os
+from pathlib import Path
+from typing import Any, Optional, Tuple, Union
+
+
+class JsonArrayWriter:
+    """
+    Summary:
+        Writes a JSON array to a file one element at a time, so a run never holds
+        every element in memory and what was written survives an interruption.
+        The finished file is byte-identical to json.dump() of the full list with
+        the same indent and ensure_ascii settings.
+
+    Usage:
+        with JsonArrayWriter(path) as out:
+            for seed in seeds:
+                out.write(asdict(seed))
+
+    An interrupted array can be continued from a point recorded with sync():
+    JsonArrayWriter(path, resume_at=out.sync()) drops everything written after it.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        indent: Optional[int] = 2,
+        ensure_ascii: bool = False,
+        resume_at: Optional[Tuple[int, int]] = None,
+    ):
+        self.path = Path(path)
+        self.indent = indent
+        self.ensure_ascii = ensure_ascii
+        self.count = 0
+        if resume_at is None:
+            self._file = self.path.open("w", encoding="utf-8")
+            self._file.write("[")
+        else:
+            offset, self.count = resume_at
+            with self.path.open("r+b") as f:
+                f.truncate(offset)
+            self._file = self.path.open("a", encoding="utf-8")
+
+    def write(self, item: Any) -> None:
+        """Appends one element and flushes it to the file."""
+        text = json.dumps(item, indent=self.indent, ensure_ascii=self.ensure_ascii)
+        if self.indent is None:
+            self._file.write((", " if self.count else "") + text)
+        else:
+            pad = " " * self.indent
+            self._file.write(("," if self.count else "") + "\n" + pad + text.replace("\n", "\n" + pad))
+        self.count += 1
+        self._file.flush()
+
+    def sync(self) -> Tuple[int, int]:
+        """Forces the elements written so far to disk; returns (byte offset, element count)."""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return os.fstat(self._file.fileno()).st_size, self.count
+
+    def close(self) -> None:
+        """Closes the array and the file. Safe to call more than once."""
+        if self._file.closed:
+            return
+        if self.count and self.indent is not None:
+            self._file.write("\n")
+        self._file.write("]")
+        self._file.close()
+
+    def __enter__(self) -> "JsonArrayWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        # Close the array even when interrupted, so the partial file still parses.
+        self.close()
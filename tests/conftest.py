@@ -0,0 +1,9 @@
+import pytest
+
+from mongens import monster_cache
+
+
+@pytest.fixture(autouse=True)
+def _tmp_monster_cache(tmp_path, monkeypatch):
+    # Keep generated monsters out of the tracked cache under src/mongens/assets.
+    monkeypatch.setattr(monster_cache, "CACHE_FILE", tmp_path / "generated_monsters.jsonl")
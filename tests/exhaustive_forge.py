@@ -1,15 +1,17 @@
-import random
+import os
+from functools import lru_cache
 from pathlib import Path
 import sys
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
 
-from mongens.monsterseed import MonsterSeed
-from mongens.data.data import SEED_TYPES, MAJOR_MODS, UTILITY_MODS
+from mongens.monsterseed import calculate_base_stats
+from mongens.data.data import MAJOR_MODS, UTILITY_MODS
+from mongens.species_space import count_species, validate_species
 
-random.seed(42)
+# Every (primary, secondary, form, habitat, major, utility) combination the data
+# allows, rather than a sample of random forges.
+WORKERS = int(os.environ.get('WORKERS', os.cpu_count() or 1))
 
-trials = 200
-issues = []
 
 def apply_mods_to_stats(base_stats, mod):
     stats = base_stats.copy()
@@ -23,22 +25,20 @@ def apply_mods_to_stats(base_stats, mod):
             stats[s] = int(round(stats[s] + a))
     return stats
 
-print('Running exhaustive forge test')
-for i in range(1, trials+1):
-    try:
-        seed = MonsterSeed.forge(i, secondary_chance=0.7)
-    except Exception as e:
-        print(f'Forge error on trial {i}: {e}')
-        issues.append(('forge_error', i, str(e)))
-        continue
 
-    primary = seed.primary_type
-    secondary = seed.secondary_type
-    major = seed.mutagens['major'][0]
-    util = seed.mutagens['utility'][0]
+@lru_cache(maxsize=None)
+def hp_delta(primary, secondary, major):
+    base_stats = calculate_base_stats(primary, secondary)
+    post_stats = apply_mods_to_stats(base_stats, MAJOR_MODS.get(major, {}))
+    return base_stats.get('HP'), post_stats.get('HP', base_stats.get('HP'))
 
-    major_mod = MAJOR_MODS.get(major, {})
-    util_mod = UTILITY_MODS.get(util, {})
+
+def check_combo(combo):
+    primary = combo.primary_type
+    secondary = combo.secondary_type
+
+    major_mod = MAJOR_MODS.get(combo.major, {})
+    util_mod = UTILITY_MODS.get(combo.utility, {})
 
     allowed_major = major_mod.get('allowed_types')
     allowed_util = util_mod.get('allowed_types')
@@ -46,34 +46,28 @@ for i in range(1, trials+1):
     compatible_major = (allowed_major is None) or (primary in allowed_major) or (secondary in allowed_major if secondary else False)
     compatible_util = (allowed_util is None) or (primary in allowed_util) or (secondary in allowed_util if secondary else False)
 
-    base_stats = seed.stats
-    post_stats = apply_mods_to_stats(base_stats, major_mod)
+    if not compatible_major:
+        return f'incompatible_major {combo.major} (allowed: {allowed_major})'
+    if not compatible_util:
+        return f'incompatible_util {combo.utility} (allowed: {allowed_util})'
 
     # detect large unexpected changes
-    hp_delta = post_stats.get('HP', base_stats.get('HP')) - base_stats.get('HP')
+    base_hp, post_hp = hp_delta(primary, secondary, combo.major)
+    if abs(post_hp - base_hp) > 50:
+        return f'large_hp_delta {combo.major}: {base_hp} -> {post_hp}'
+    return None
 
-    if not compatible_major:
-        issues.append(('incompatible_major', i, primary, secondary, major, allowed_major))
 
-    if not compatible_util:
-        issues.append(('incompatible_util', i, primary, secondary, util, allowed_util))
-
-    if abs(hp_delta) > 50:
-        issues.append(('large_hp_delta', i, primary, major, base_stats.get('HP'), post_stats.get('HP')))
-
-# Report
-print('\nSummary:')
-print(f'Ran {trials} forges; found {len(issues)} issues')
-for it in issues[:60]:
-    print(it)
-
-if issues:
-    print('\nSample problematic seeds (first 10):')
-    count = 0
-    for t in issues:
-        if count >= 10:
-            break
-        print(t)
-        count += 1
-else:
-    print('No immediate issues found')
+if __name__ == '__main__':
+    print(f'Running exhaustive forge test over {count_species():,} combinations ({WORKERS} workers)')
+    result = validate_species(check_combo, workers=WORKERS, max_failures=60)
+
+    # Report
+    print('\nSummary:')
+    print(f"Checked {result['combos']:,} combinations (total probability {result['probability']:.12f}); "
+          f"found {result['failed']:,} issues")
+    for combo, problem in result['failures']:
+        print(f'{problem}  p={combo.probability:.3e}  {combo[:6]}')
+
+    if not result['failed']:
+        print('No immediate issues found')
@@ -0,0 +1,166 @@
+import io
+import json
+
+import pytest
+
+from mongens import cli
+from mongens.batch import Job, load_jobs, run_batch
+
+
+def _specs(tmp_path, *jobs):
+    path = tmp_path / "specs.jsonl"
+    path.write_text("\n".join(json.dumps(job) for job in jobs) + "\n\n", encoding="utf-8")
+    return path
+
+
+def test_jobs_stream_to_per_job_and_shared_outputs(tmp_path):
+    shared = str(tmp_path / "all.json")
+    specs = _specs(
+        tmp_path,
+        {"id": "axioms", "primary_type": "Axiom", "majors": 4, "utils": 3, "count": 4,
+         "outputs": {"dex": str(tmp_path / "axioms.txt"), "json": shared}},
+        {"count": 3, "name": False, "outputs": {"json": shared}},
+    )
+    progress = io.StringIO()
+    result = run_batch(load_jobs(specs), run_seed=1, progress=progress)
+
+    assert [job["written"] for job in result["jobs"]] == [4, 3]
+    assert result["jobs"][1]["id"] == "job2"
+    seeds = json.loads((tmp_path / "all.json").read_text(encoding="utf-8"))
+    assert len(seeds) == 7
+    assert all(s["primary_type"] == "Axiom" and len(s["mutagens"]["major"]) > 2 for s in seeds[:4])
+    assert [s["name"] for s in seeds[4:]] == ["", "", ""]
+    assert (tmp_path / "axioms.txt").read_text(encoding="utf-8").count("' --- a(n) ") == 4
+    assert "[batch] done: 7 monsters" in progress.getvalue()
+
+
+def test_batch_output_does_not_depend_on_workers(tmp_path):
+    specs = _specs(tmp_path, {"count": 5}, {"primary_type": "Echo", "count": 5})
+    outputs = []
+    for workers in (1, 2):
+        out = tmp_path / f"dex{workers}.txt"
+        cli.main(["batch", str(specs), "--seed", "9", "-w", str(workers), "-o", str(out), "-q"])
+        outputs.append(out.read_bytes())
+    assert outputs[0] == outputs[1]
+    assert outputs[0].count(b"' --- a(n) ") == 10
+
+
+@pytest.mark.parametrize(
+    "line, message",
+    [
+        ('{"primary_type": "Nope"}', "Unknown primary_type"),
+        ('{"primary_type": "Axiom", "secondary_type": "Axiom"}', "cannot be the same"),
+        ('{"count": -1}', "count must be a non-negative integer"),
+        ('{"colour": "red"}', "unknown field(s): colour"),
+        ('{"outputs": {"json": "-"}}', "needs a file path"),
+        ("{not json", "specs.jsonl:2:"),
+    ],
+)
+def test_invalid_specs_are_rejected_before_running(tmp_path, line, message):
+    path = tmp_path / "specs.jsonl"
+    path.write_text('{"count": 1}\n' + line + "\n", encoding="utf-8")
+    with pytest.raises(ValueError, match=message.replace("(", r"\(").replace(")", r"\)")):
+        load_jobs(path)
+
+
+def test_mutagen_counts_are_no_longer_capped(tmp_path):
+    out = tmp_path / "dex.txt"
+    cli.main(["dexentry", "-c", "1", "--seed", "1", "-maj", "5", "-ut", "4", "-o", str(out)])
+    assert out.read_text(encoding="utf-8").count("' --- a(n) ") == 1
+    with pytest.raises(SystemExit):
+        cli.main(["dexentry", "--majors", "-1"])
+    assert Job.from_dict({"majors": 12}, "job1").majors == 12
+
+
+def _checkpointed_jobs(out_dir):
+    return [
+        Job.from_dict(
+            {"id": "a", "count": 7, "seed": 3, "cache": True, "dedup": True, "outputs": {"dex": str(out_dir / "dex.txt")}},
+            "job1",
+        ),
+        Job.from_dict(
+            {"id": "b", "primary_type": "Echo", "count": 6, "start": 41, "seed": 4,
+             "outputs": {"dex": str(out_dir / "dex.txt"), "jsonl": str(out_dir / "b.jsonl"),
+                         "json": str(out_dir / "b.json"), "html": str(out_dir / "b.html"),
+                         "csv": str(out_dir / "b.csv")}},
+            "job2",
+        ),
+        # Same seed as job a: every monster is a repeat and gets re-rolled.
+        Job.from_dict(
+            {"id": "c", "count": 7, "seed": 3, "reroll_duplicates": 2, "outputs": {"dex": str(out_dir / "c.txt")}},
+            "job3",
+        ),
+    ]
+
+
+def test_interrupted_run_resumes_to_identical_outputs(tmp_path, monkeypatch):
+    from mongens import batch, monster_cache
+
+    (tmp_path / "ref").mkdir()
+    (tmp_path / "run").mkdir()
+    reference = run_batch(_checkpointed_jobs(tmp_path / "ref"), progress=None)
+    assert [job["rerolled"] for job in reference["jobs"]] == [0, 0, 7]
+    cached = len(monster_cache.CACHE_FILE.read_text(encoding="utf-8").splitlines())
+    assert cached == 7
+
+    ticks = []
+
+    def _crash(self, label):
+        ticks.append(label)
+        if len(ticks) == 17:
+            raise KeyboardInterrupt
+
+    manifest = tmp_path / "run" / "job.manifest"
+    with monkeypatch.context() as patched, pytest.raises(KeyboardInterrupt):
+        patched.setattr(batch._Progress, "tick", _crash)
+        run_batch(_checkpointed_jobs(tmp_path / "run"), progress=None, checkpoint=manifest, checkpoint_every=3)
+    state = json.loads(manifest.read_text(encoding="utf-8"))
+    assert state["position"] == {
+        "job": 2, "done": 3, "written": 3, "skipped": 0, "checked": 3, "duplicates": 3, "rerolled": 3
+    }
+    # Torn writes past the checkpoint are cut off on resume.
+    with (tmp_path / "run" / "b.jsonl").open("a", encoding="utf-8") as f:
+        f.write('{"partial": ')
+
+    result = cli.main(["resume", str(manifest), "-q"])
+    assert result is None
+    for name in ("dex.txt", "b.jsonl", "b.json", "b.html", "b.csv", "c.txt"):
+        assert (tmp_path / "run" / name).read_bytes() == (tmp_path / "ref" / name).read_bytes()
+    assert len(json.loads((tmp_path / "run" / "b.json").read_text(encoding="utf-8"))) == 6
+    assert len(monster_cache.CACHE_FILE.read_text(encoding="utf-8").splitlines()) == cached + 7
+    assert json.loads(manifest.read_text(encoding="utf-8"))["complete"]
+    summary = batch.resume_batch(manifest, progress=None)
+    assert summary["written"] == 20 and summary["jobs"][2]["rerolled"] == 7
+
+
+def test_resume_keeps_monsters_other_commands_cached(tmp_path, monkeypatch):
+    from mongens import batch, monster_cache
+    from mongens.pipeline import generate_monster_at
+
+    jobs = [Job.from_dict({"count": 8, "seed": 5, "cache": True, "outputs": {"dex": str(tmp_path / "a.txt")}}, "job1")]
+    ticks = []
+
+    def _crash(self, label):
+        ticks.append(label)
+        if len(ticks) == 5:
+            raise KeyboardInterrupt
+
+    manifest = tmp_path / "job.manifest"
+    with monkeypatch.context() as patched, pytest.raises(KeyboardInterrupt):
+        patched.setattr(batch._Progress, "tick", _crash)
+        run_batch(jobs, progress=None, checkpoint=manifest, checkpoint_every=3)
+    foreign = monster_cache.save_monster(generate_monster_at(99, 1))
+
+    batch.resume_batch(manifest, progress=None)
+    assert monster_cache.load_monster(foreign).meta["unique_id"] == foreign
+    origins = [
+        json.loads(line)["meta"]["origin"]
+        for line in monster_cache.CACHE_FILE.read_text(encoding="utf-8").splitlines()
+    ]
+    assert sorted(o["index"] for o in origins if o["run_seed"] == 5) == list(range(8))
+    assert len(origins) == 9
+
+
+def test_checkpointed_run_rejects_stdout(tmp_path):
+    with pytest.raises(ValueError, match="cannot write to stdout"):
+        run_batch([Job.from_dict({}, "job1")], progress=None, checkpoint=tmp_path / "m")
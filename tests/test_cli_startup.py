@@ -0,0 +1,49 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import mongens
+from mongens.data import data, seed_type_names
+
+# Modules `import mongens.cli` must not load: command handlers import them lazily.
+# (The import time itself is measured by tools/bench_startup.py --cli.)
+HEAVY_MODULES = {
+    "yaml",
+    "mongens.data.data",
+    "mongens.data.art_data",
+    "mongens.forge_name",
+    "mongens.mon_forge",
+    "mongens.monsterseed",
+    "mongens.dex_entries",
+    "mongens.prompt_engine",
+    "mongens.monster_cache",
+}
+
+
+def _python(*args):
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([str(Path(mongens.__file__).parents[1]), env.get("PYTHONPATH", "")])
+    return subprocess.run([sys.executable, *args], env=env, capture_output=True, text=True, check=True)
+
+
+def test_cli_import_defers_heavy_modules():
+    stderr = _python("-X", "importtime", "-c", "import mongens.cli").stderr
+    timings = {}
+    for line in stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit():
+                timings[name.strip()] = int(cumulative)
+
+    assert "mongens.cli" in timings
+    assert HEAVY_MODULES.isdisjoint(timings), sorted(HEAVY_MODULES & set(timings))
+
+
+def test_type_name_manifest_matches_tables():
+    assert seed_type_names() == list(data.SEED_TYPES)
+
+
+def test_list_types_uses_manifest():
+    out = _python("-m", "mongens.cli", "list", "--types").stdout
+    assert [line[2:] for line in out.splitlines()[1:]] == list(data.SEED_TYPES)
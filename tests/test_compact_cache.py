@@ -0,0 +1,61 @@
+import json
+import random
+from dataclasses import asdict
+
+import pytest
+
+from mongens import monster_cache, pipeline
+from mongens.pipeline import Spec, forge_monster, generate_monster_at, mutate, name, sink, source
+
+
+def _lines():
+    return [json.loads(line) for line in monster_cache.CACHE_FILE.read_text(encoding="utf-8").splitlines()]
+
+
+def test_compact_record_rebuilds_the_same_monster():
+    seed = generate_monster_at(5, 12, Spec("Axiom", "random"), major_count=2, util_count=1)
+    full_pin = monster_cache.save_monster(seed, compact=False)
+    seed.meta.pop("unique_id")
+    pin = monster_cache.save_monster(seed, compact=True)
+
+    full, compact = monster_cache.CACHE_FILE.read_text(encoding="utf-8").splitlines()
+    assert "compact" in json.loads(compact) and "overrides" not in json.loads(compact)["compact"]
+    assert len(compact) * 3 < len(full)
+
+    loaded = monster_cache.load_monster(pin)
+    assert asdict(loaded) == {**asdict(seed), "meta": {**seed.meta, "unique_id": pin}}
+    assert asdict(loaded)["stats"] == asdict(monster_cache.load_monster(full_pin))["stats"]
+
+
+def test_overrides_are_kept_and_loads_are_independent_copies(monkeypatch):
+    seed = forge_monster(Spec("Bloom", "none"))
+    seed.name = "Custom Name"
+    seed.meta["note"] = "hand edited"
+    pin = monster_cache.save_monster(seed, compact=True)
+    assert set(_lines()[0]["compact"]["overrides"]) == {"name", "meta"}
+
+    calls = []
+    monkeypatch.setattr(monster_cache, "rebuild", lambda origin: calls.append(origin) or pipeline.rebuild(origin))
+    monster_cache._rebuilt.cache_clear()
+    first = monster_cache.load_monster(pin)
+    first.stats["HP"] = -1
+    second = monster_cache.load_monster(pin)
+    assert len(calls) == 1
+    assert second.name == "Custom Name" and second.meta["note"] == "hand edited"
+    assert second.stats == seed.stats
+
+
+def test_seed_without_origin_is_stored_in_full():
+    seed = forge_monster(Spec("Axiom", "none"), rng=random.Random(1))
+    assert "origin" not in seed.meta
+    pin = monster_cache.save_monster(seed, compact=True)
+    assert "compact" not in _lines()[0]
+    assert monster_cache.load_monster(pin).stats == seed.stats
+
+
+def test_compact_record_fails_loudly_on_other_data(monkeypatch):
+    (source(None, 2, run_seed=3) | mutate(1, 1) | name() | sink(cache="compact")).run()
+    pin = _lines()[0]["meta"]["unique_id"]
+    monkeypatch.setattr(monster_cache, "data_hash", lambda: "0" * 64)
+    with pytest.raises(ValueError, match="stored compactly against data"):
+        monster_cache.load_monster(pin)
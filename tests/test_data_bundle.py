@@ -0,0 +1,97 @@
+import hashlib
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import mongens
+from mongens.data import data
+
+
+def _run_with_bundle(bundle, code):
+    env = dict(os.environ, MONGENS_DATA_BUNDLE=str(bundle))
+    env["PYTHONPATH"] = os.pathsep.join([str(Path(mongens.__file__).parents[1]), env.get("PYTHONPATH", "")])
+    return subprocess.run(
+        [sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+def test_compile_bundle_round_trips_tables(tmp_path):
+    bundle = tmp_path / "data.bundle"
+    result = data.compile_bundle(bundle)
+    assert result["source_hash"] == data.source_hash()
+    assert "MAJOR_MODS" in result["tables"]
+
+    loaded = data._read_bundle(bundle)
+    assert loaded["tables"]["SEED_TYPES"] == tuple(data.SEED_TYPES)
+    assert loaded["tables"]["ALL_MODS"][0] is loaded["tables"]["MAJOR_MODS"]
+
+
+def test_stale_bundle_is_ignored(tmp_path, monkeypatch):
+    bundle = tmp_path / "data.bundle"
+    data.compile_bundle(bundle)
+    monkeypatch.setattr(data, "source_hash", lambda: "0" * 64)
+    with pytest.warns(RuntimeWarning, match="stale"):
+        assert data._read_bundle(bundle) is None
+
+
+def test_import_prefers_bundle_without_yaml(tmp_path):
+    bundle = tmp_path / "data.bundle"
+    data.compile_bundle(bundle)
+    out = _run_with_bundle(
+        bundle,
+        "import sys; from mongens.data import data; "
+        "print(data.DATA_SOURCE, 'yaml' in sys.modules, "
+        "data.ALL_MODS[0] is data.MAJOR_MODS)",
+    )
+    source, yaml_imported, shared = out.split()
+    assert source == str(bundle)
+    assert yaml_imported == "False"
+    assert shared == "True"
+
+
+def test_corrupt_bundle_falls_back_to_yaml(tmp_path):
+    bundle = tmp_path / "data.bundle"
+    data.compile_bundle(bundle)
+    raw = bundle.read_bytes()
+    bundle.write_bytes(raw[: len(raw) // 2])
+    with pytest.warns(RuntimeWarning, match="corrupt"):
+        assert data._read_bundle(bundle) is None
+    assert _run_with_bundle(bundle, "from mongens.data import data; print(data.DATA_SOURCE)") == "yaml"
+
+    # A payload that matches its checksum but is not a bundle is rejected too.
+    payload = b"not a marshal stream"
+    header = data._BUNDLE_HEADER.pack(
+        data._BUNDLE_MAGIC, data.BUNDLE_FORMAT, bytes.fromhex(data.source_hash()),
+        hashlib.sha256(payload).digest(),
+    )
+    bundle.write_bytes(header + payload)
+    with pytest.warns(RuntimeWarning, match="corrupt"):
+        assert data._read_bundle(bundle) is None
+
+
+def test_bundled_derived_rebuilt_when_builder_changes(tmp_path, monkeypatch):
+    calls = []
+
+    def _builder():
+        calls.append(1)
+        return tuple(sorted(data.HELD_ITEMS))
+
+    monkeypatch.setitem(data._DERIVED, "test_bundled_items", (_builder, frozenset({"HELD_ITEMS"})))
+    bundle = tmp_path / "data.bundle"
+    data.compile_bundle(bundle)
+    deps, builder_hash, value = data._read_bundle(bundle)["derived"]["test_bundled_items"]
+    assert builder_hash == data._builder_hash(_builder)
+
+    def load():
+        data._DERIVED_VALUES.pop("test_bundled_items", None)
+        data._BUNDLED_DERIVED["test_bundled_items"] = (deps, builder_hash, value)
+        calls.clear()
+        return data.derived("test_bundled_items")
+
+    assert load() == value and calls == []
+    monkeypatch.setattr(data, "_builder_hash", lambda builder: "edited")
+    assert load() == value and calls == [1]
+    data._DERIVED_VALUES.pop("test_bundled_items", None)
@@ -0,0 +1,86 @@
+import pytest
+
+from mongens.data import data
+
+
+def test_reload_without_changes_is_a_noop():
+    version = data.DATA_VERSION
+    assert data.reload() == {"files": [], "tables": [], "derived": []}
+    assert data.DATA_VERSION == version
+
+
+def test_reload_rebuilds_only_dependent_tables():
+    major_mods = data.MAJOR_MODS
+    result = data.reload(["type_forms.yaml"])
+    assert result["tables"] == ["FORMS_BY_TYPE"]
+    assert data.MAJOR_MODS is major_mods
+
+    result = data.reload([data.DATA_DIR / "types" / "seed_types.yaml"])
+    # Forms and mutagens are validated against the seed types, so they follow.
+    assert {"SEED_TYPES", "FORMS_BY_TYPE", "MAJOR_MODS", "UTILITY_MODS", "ALL_MODS"} <= set(
+        result["tables"]
+    )
+    assert "HELD_ITEMS" not in result["tables"]
+    assert data.ALL_MODS[0] is data.MAJOR_MODS
+
+
+def test_reload_refreshes_dependent_derived_structures():
+    builds = []
+
+    def _builder():
+        builds.append(1)
+        return sorted(data.HELD_ITEMS)
+
+    data.register_derived("test_held_item_names", _builder, depends_on=("HELD_ITEMS",))
+    try:
+        assert data.derived("test_held_item_names") == tuple(sorted(data.HELD_ITEMS))
+        data.reload(["physical_traits.yaml"])
+        assert len(builds) == 1
+
+        result = data.reload(["held_items.yaml"])
+        assert "test_held_item_names" in result["derived"]
+        assert len(builds) == 2
+    finally:
+        data._DERIVED.pop("test_held_item_names", None)
+        data._DERIVED_VALUES.pop("test_held_item_names", None)
+
+
+def test_failed_reload_keeps_published_tables(monkeypatch):
+    held_items = data.HELD_ITEMS
+    version = data.DATA_VERSION
+
+    def _broken(filename):
+        raise ValueError(f"broken {filename}")
+
+    monkeypatch.setattr(data, "_load_weighted_yaml", _broken)
+    with pytest.raises(ValueError):
+        data.reload(["held_items.yaml"])
+    assert data.HELD_ITEMS is held_items
+    assert data.DATA_VERSION == version
+
+
+def test_validate_reports_failures_per_file_and_skips_dependents(monkeypatch):
+    seed_type_data = data.SEED_TYPE_DATA
+    parse_yaml = data._parse_yaml
+
+    def _parse(filepath, loader=None):
+        if filepath.name == "seed_types.yaml":
+            raise data.yaml.YAMLError("bad indentation")
+        return parse_yaml(filepath, loader)
+
+    monkeypatch.setattr(data, "_parse_yaml", _parse)
+    result = data.validate(["types/seed_types.yaml"], publish=True)
+
+    assert result["ok"] is False
+    assert [f["file"] for f in result["files"]] == ["types/seed_types.yaml"]
+    assert "bad indentation" in result["files"][0]["error"]
+    by_table = {tuple(r["tables"]): r for r in result["tables"]}
+    assert by_table[("FORMS_BY_TYPE",)]["error"].startswith("skipped")
+    assert all("build_ms" in r for r in result["tables"])
+    assert data.SEED_TYPE_DATA is seed_type_data
+
+
+def test_validate_only_touches_changed_file_and_dependents():
+    result = data.validate(["held_items.yaml"])
+    assert result["ok"] is True
+    assert [r["tables"] for r in result["tables"]] == [["HELD_ITEMS"]]
@@ -0,0 +1,43 @@
+from types import MappingProxyType
+
+import pytest
+
+from mongens.data import data
+from mongens.monsterseed import MonsterSeed, weighted_choice
+
+
+def test_tables_are_read_only():
+    with pytest.raises(TypeError):
+        data.MAJOR_MODS["NewMod"] = {}
+    with pytest.raises(TypeError):
+        data.SEED_TYPE_DATA["Axiom"]["attributes"]["mul"]["HP"] = 9.0
+    with pytest.raises(AttributeError):
+        data.SEED_TYPES.append("Nope")
+    assert isinstance(data.SEED_TYPE_DATA["Axiom"]["habitats"], tuple)
+    assert isinstance(data.INCOMPATIBLE_TYPE_PAIRS, frozenset)
+
+
+def test_no_public_table_is_mutable():
+    mutable = [
+        name
+        for name in dir(data)
+        if name.isupper() and not name.startswith("_") and isinstance(getattr(data, name), (dict, list, set))
+    ]
+    assert mutable == []
+
+
+def test_reloaded_tables_stay_frozen():
+    data.reload(["mutagens/major_mods.yaml"])
+    assert isinstance(data.MAJOR_MODS, MappingProxyType)
+    assert data.ALL_MODS[0] is data.MAJOR_MODS
+
+
+def test_generation_reads_frozen_tables():
+    assert weighted_choice(data.HELD_ITEMS) in data.HELD_ITEMS
+    for seed_type in data.SEED_TYPES:
+        seed = MonsterSeed.forge(1, primary_type=seed_type, secondary_type=None, secondary_chance=0.0)
+        assert seed.habitat in data.SEED_TYPE_DATA[seed_type]["habitats"]
+        assert seed.form in data.FORMS_BY_TYPE[seed_type]
+        # Seeds get their own mutable copies, never the shared tables.
+        seed.stats["HP"] += 1
+    assert data.BASE_STATS["HP"] == 100
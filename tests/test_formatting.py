@@ -44,3 +44,39 @@ def test_dex_formatter_includes_formatted_type():
     # Should include our formatted type and the raw type pair
     assert "Ore Inferno" in text
     assert "(Inferno/Mineral)" in text
+
+
+def test_dex_formatter_text_is_unchanged():
+    seed = MonsterSeed(
+        idnum=7,
+        name="Testling",
+        form="Wyrm",
+        primary_type="Inferno",
+        secondary_type="Mineral",
+        stats={"ATK": 50, "HP": 100, "XP": 3},
+        mutagens={"major": ["LumenCrest"], "utility": ["Cohort Harmony"]},
+        habitat="Caldera",
+        physical_traits=["spiky"],
+        held_item="Ember Charm",
+        tempers={"mood": "calm", "affinity": "none"},
+        meta={"tags": ["Hot"], "weak": ["Tide"]},
+    )
+    assert dex_formatter(seed) == (
+        "-" * 60 + "\n\n#007: 'Testling' --- a(n) Wyrm monster\n\n"
+        f"  -Types: {format_dual_type('Inferno', 'Mineral')} (Inferno/Mineral)\n\n"
+        "Documented Near-Lumen Mutagen: ['LumenCrest'] | Known Utility: ['Cohort Harmony']\n\n\n"
+        "Base Profile: HP 100 • ATK 50\n\n\n\nHabitat: Caldera\n\n\n"
+        "Physical Traits: spiky\nObserved carrying: Ember Charm\n\nTags: Hot\nWeak To: Tide"
+    )
+
+
+def test_render_dex_entries_matches_sink_output():
+    import io
+
+    from mongens.dex_entries import render_dex_entries
+    from mongens.pipeline import dex_text, mutate, sink, source
+
+    out = io.StringIO()
+    items = list(source(None, 5, run_seed=4) | mutate() | dex_text() | sink(txt=out))
+    assert render_dex_entries(item.seed for item in items) == out.getvalue()
+    assert render_dex_entries([]) == ""
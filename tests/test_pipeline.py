@@ -0,0 +1,109 @@
+import json
+from dataclasses import asdict
+
+import pytest
+
+from mongens import monster_cache, pipeline
+from mongens.pipeline import Spec, dedup, dex_text, generate_monster_at, mutate, name, sink, source
+
+
+@pytest.fixture(autouse=True)
+def _tmp_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(monster_cache, "CACHE_FILE", tmp_path / "cache.jsonl")
+
+
+def _texts(run, **kwargs):
+    return [item.text for item in run.iterate(**kwargs)]
+
+
+def test_pipeline_is_lazy_and_composable(monkeypatch):
+    calls = []
+    forge_item = pipeline.forge_item
+    monkeypatch.setattr(pipeline, "forge_item", lambda *a: calls.append(a) or forge_item(*a))
+
+    base = source(Spec("Axiom", "none"), 5, run_seed=3)
+    run = base | mutate(1, 1) | dex_text()
+    assert calls == [] and base.stages == ()
+
+    items = iter(run)
+    first = next(items)
+    assert len(calls) == 1
+    assert first.seed.primary_type == "Axiom"
+    assert first.text.startswith("-" * 60)
+
+
+def test_stats_only_run_skips_naming(monkeypatch):
+    from mongens import forge_name
+
+    monkeypatch.setattr(forge_name, "forge_monster_name", pytest.fail)
+    items = list(source(n=3, run_seed=1) | mutate(1, 0))
+    assert [item.seed.idnum for item in items] == [1, 2, 3]
+    assert all(item.seed.stats and item.text is None for item in items)
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_workers_match_serial_run(executor):
+    run = source(n=6, run_seed=11) | mutate() | name() | dex_text()
+    assert _texts(run, workers=3, executor=executor) == _texts(run)
+
+
+def test_generate_monster_at_matches_full_run_without_replay(monkeypatch):
+    full = [item.seed for item in source(None, 30, run_seed=11) | mutate(1, 2) | name()]
+
+    calls = []
+    forge_item = pipeline.forge_item
+    monkeypatch.setattr(pipeline, "forge_item", lambda *a: calls.append(a[0]) or forge_item(*a))
+    for k in (27, 3, 30):
+        seed = generate_monster_at(11, k, major_count=1, util_count=2)
+        assert asdict(seed) == asdict(full[k - 1])
+    assert calls == [26, 2, 29]
+
+    shard = [item.text for item in source(None, 5, run_seed=11, start=10) | mutate(1, 2) | name() | dex_text()]
+    whole = [item.text for item in source(None, 15, run_seed=11) | mutate(1, 2) | name() | dex_text()]
+    assert shard == whole[10:]
+
+    with pytest.raises(ValueError):
+        generate_monster_at(11, 0)
+
+
+def test_dedup_drops_or_rerolls_repeats_before_formatting(tmp_path):
+    index = tmp_path / "hashes.txt"
+    first = dedup(index)
+    assert (source(None, 6, run_seed=2) | mutate() | first | dex_text() | sink()).run() == 6
+    first.index.close()
+
+    # A second run with the same seed repeats every monster; the on-disk index catches them.
+    again = dedup(index)
+    items = list(source(None, 8, run_seed=2) | mutate() | again | dex_text())
+    again.index.close()
+    assert [item.duplicate for item in items] == [True] * 6 + [False] * 2
+    assert all(item.text is None for item in items[:6])
+    assert (again.checked, again.duplicates, again.dropped) == (8, 6, 6)
+    assert "6 of 8 duplicate (75.00%)" in again.report()
+
+    rerolled = dedup(index, reroll=2)
+    seeds = [item.seed for item in source(None, 6, run_seed=2) | mutate() | name() | rerolled]
+    rerolled.index.close()
+    assert rerolled.rerolled == 6 and all(seed.meta["origin"]["attempt"] == 1 for seed in seeds)
+    assert [s.idnum for s in seeds] == [1, 2, 3, 4, 5, 6]
+    assert asdict(pipeline.rebuild(seeds[3].meta["origin"])) == asdict(seeds[3])
+    assert len(index.read_text(encoding="utf-8").splitlines()) == 14
+
+
+def test_sink_writes_text_jsonl_and_json(tmp_path):
+    out = sink(
+        txt=tmp_path / "dex.txt",
+        jsonl=tmp_path / "seeds.jsonl",
+        json=tmp_path / "seeds.json",
+        cache=True,
+    )
+    items = list(source(n=3, run_seed=5) | mutate() | name() | dex_text() | out)
+
+    assert out.written == 3
+    text = (tmp_path / "dex.txt").read_text(encoding="utf-8")
+    assert text == pipeline.DEX_SEPARATOR.join(item.text for item in items) + "\n"
+    lines = (tmp_path / "seeds.jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["name"] for line in lines] == [item.seed.name for item in items]
+    array = json.loads((tmp_path / "seeds.json").read_text(encoding="utf-8"))
+    assert [s["meta"]["unique_id"] for s in array] == [item.seed.meta["unique_id"] for item in items]
+
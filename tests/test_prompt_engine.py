@@ -0,0 +1,80 @@
+import copy
+import io
+import json
+
+from mongens.pipeline import generate_monster_at
+from mongens.prompt_engine import (
+    PromptIndex,
+    construct_mon_prompt,
+    construct_mon_prompts,
+    prompt_hash,
+    translate_term,
+)
+
+
+def test_prompt_lines_use_the_translation_index():
+    seed = generate_monster_at(2, 7, major_count=2, util_count=1)
+    seed.mutagens["major"] = ["Stormborn", "BioLuminescent"]
+    seed.physical_traits = ["Nocturnal", "Unlisted Trait"]
+    lines = construct_mon_prompt(seed).split("\n")
+    assert lines[1].startswith(f"Subject: A {seed.species} monster, ")
+    assert lines[2] == (
+        f"Visual features: infused with {translate_term('Stormborn')}, {translate_term('BioLuminescent')}. "
+        "emitting a subtle bioluminescent glow, "
+    )
+    assert lines[3].endswith("distinctive features include: large pupils, dark coloration, Unlisted Trait.")
+    assert f"with a {seed.tempers['mood']} expression" in lines[4]
+
+
+def test_batch_prompts_one_line_per_pin_and_identical_prompts_once():
+    seeds = [generate_monster_at(2, k) for k in range(1, 5)]
+    for number, seed in enumerate(seeds):
+        seed.meta["unique_id"] = f"PIN{number:07d}"
+    twin = copy.deepcopy(seeds[0])
+    twin.meta["unique_id"] = "TWIN000000"
+    out = io.StringIO()
+    index = PromptIndex()
+    counts = construct_mon_prompts(seeds + [twin, seeds[1]], out, index)
+    assert counts == {"written": 5, "unique": 4, "duplicates": 1, "skipped": 1}
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [r["pin"] for r in records] == ["PIN0000000", "PIN0000001", "PIN0000002", "PIN0000003", "TWIN000000"]
+    assert records[0]["prompt"] == construct_mon_prompt(seeds[0])
+    assert records[0]["hash"] == prompt_hash(records[0]["prompt"])
+    assert records[-1] == {"pin": "TWIN000000", "name": twin.name, "hash": records[0]["hash"], "same_as": "PIN0000000"}
+
+    # PINs and prompts queued by an earlier call are not repeated either.
+    again = io.StringIO()
+    late_twin = copy.deepcopy(twin)
+    late_twin.meta["unique_id"] = "TWIN000001"
+    counts = construct_mon_prompts([seeds[0], late_twin], again, index)
+    assert counts == {"written": 1, "unique": 0, "duplicates": 1, "skipped": 1}
+    assert json.loads(again.getvalue())["same_as"] == "PIN0000000"
+
+
+def test_batch_prompts_without_a_pin_never_carry_a_prompt():
+    seed = generate_monster_at(2, 1)
+    pinned = copy.deepcopy(seed)
+    pinned.meta["unique_id"] = "PIN0000000"
+    out = io.StringIO()
+    construct_mon_prompts([seed, pinned, copy.deepcopy(seed)], out)
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [r["pin"] for r in records] == [None, "PIN0000000", None]
+    assert "prompt" in records[0] and "prompt" in records[1]
+    assert records[2]["same_as"] == "PIN0000000"
+
+
+def test_batch_prompts_to_a_path_skip_pins_already_in_the_file(tmp_path):
+    seeds = [generate_monster_at(2, k) for k in range(1, 4)]
+    for number, seed in enumerate(seeds):
+        seed.meta["unique_id"] = f"PIN{number:07d}"
+    twin = copy.deepcopy(seeds[0])
+    twin.meta["unique_id"] = "TWIN000000"
+    queue = tmp_path / "queue.jsonl"
+    assert construct_mon_prompts(seeds, queue)["written"] == 3
+
+    # A second run (fresh index) against the same file adds only the new PIN.
+    counts = construct_mon_prompts(seeds + [twin], queue)
+    assert counts == {"written": 1, "unique": 0, "duplicates": 1, "skipped": 3}
+    records = [json.loads(line) for line in queue.read_text().splitlines()]
+    assert [r["pin"] for r in records] == ["PIN0000000", "PIN0000001", "PIN0000002", "TWIN000000"]
+    assert records[-1]["same_as"] == "PIN0000000"
@@ -0,0 +1,92 @@
+import copy
+import io
+import json
+
+import pytest
+
+from mongens import cli, render_cache
+from mongens.dex_entries import dex_formatter
+from mongens.pipeline import generate_monster_at
+from mongens.render_cache import RenderCache
+
+
+def test_hits_match_a_fresh_render_and_survive_a_restart(tmp_path):
+    path = tmp_path / "render.cache"
+    seeds = [generate_monster_at(4, k, major_count=2) for k in range(1, 11)]
+    with RenderCache(path) as cache:
+        assert [cache.render("dex", s) for s in seeds] == [dex_formatter(s) for s in seeds]
+        assert (cache.hits, cache.misses) == (0, 10)
+
+    cache = RenderCache(path)
+    assert len(cache) == 10
+    moved = copy.deepcopy(seeds[0])
+    moved.meta["unique_id"] = "ABCDE12345"
+    moved.meta["origin"] = {"run_seed": 99}
+    assert cache.render("dex", moved) == dex_formatter(seeds[0])
+    reordered = copy.deepcopy(seeds[1])
+    reordered.mutagens["major"] = list(reversed(reordered.mutagens["major"]))
+    assert reordered.content_hash() == seeds[1].content_hash()
+    assert cache.render("dex", reordered) == dex_formatter(reordered)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    with pytest.raises(ValueError, match="Unknown renderer"):
+        cache.render("pdf", seeds[0])
+
+
+def test_bounded_and_stale_templates_dropped(tmp_path, monkeypatch):
+    path = tmp_path / "render.cache"
+    with RenderCache(path, max_entries=3) as cache:
+        for k in range(1, 6):
+            cache.render("dex", generate_monster_at(4, k))
+        assert len(cache) == 3
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 3
+
+    monkeypatch.setattr(render_cache, "template_version", lambda renderer, digest: "changed")
+    assert len(RenderCache(path)) == 0
+
+
+def test_dexentry_with_render_cache_writes_the_same_text(tmp_path, capsys):
+    args = ["dexentry", "-c", "5", "--seed", "8", "--render-cache", str(tmp_path / "r.cache")]
+    cli.main(args + ["-o", str(tmp_path / "a.txt")])
+    cli.main(args + ["-o", str(tmp_path / "b.txt")])
+    assert "5 of 5 hit" in capsys.readouterr().out
+    assert (tmp_path / "a.txt").read_text(encoding="utf-8") == (tmp_path / "b.txt").read_text(encoding="utf-8")
+    record = json.loads((tmp_path / "r.cache").read_text(encoding="utf-8").splitlines()[0])
+    assert set(record) == {"renderer", "version", "key", "text"}
+
+
+def test_pipeline_and_pin_keys():
+    from mongens.pipeline import dex_text, mutate, name, source
+    from mongens.prompt_engine import construct_mon_prompt, construct_mon_prompts
+
+    cache = RenderCache()
+    runs = [
+        [item.text for item in source(None, 4, run_seed=2) | mutate() | name() | dex_text(cache)]
+        for _ in range(2)
+    ]
+    assert runs[0] == runs[1] == [item.text for item in source(None, 4, run_seed=2) | mutate() | name() | dex_text()]
+    assert (cache.hits, cache.misses) == (4, 4)
+    unnamed = next(iter(source(None, 1, run_seed=2) | mutate() | dex_text(cache))).seed
+    assert render_cache.origin_key(unnamed) != render_cache.origin_key(generate_monster_at(2, 1))
+
+    seed = generate_monster_at(4, 2)
+    seed.meta["unique_id"] = "PIN0000000"
+    construct_mon_prompts([seed], io.StringIO(), cache=cache)
+    assert cache.render("artprompt", seed, render_cache.pin_key(seed)) == construct_mon_prompt(seed)
+    assert cache.hits == 5
+
+
+def test_origin_key_changes_with_generator_source(monkeypatch):
+    seed = generate_monster_at(2, 1)
+    before = render_cache.origin_key(seed)
+    assert render_cache.generator_version() in before
+
+    # Stands in for an edit to a forging module without a GENERATOR_VERSION bump.
+    monkeypatch.setattr(render_cache, "GENERATOR_MODULES", render_cache.GENERATOR_MODULES[:-1])
+    render_cache.generator_version.cache_clear()
+    try:
+        assert render_cache.origin_key(seed) != before
+    finally:
+        monkeypatch.undo()
+        render_cache.generator_version.cache_clear()
+    assert render_cache.origin_key(seed) == before
@@ -0,0 +1,66 @@
+import csv
+import io
+import json
+
+import pytest
+
+from mongens import cli
+from mongens.batch import default_outputs
+from mongens.pipeline import dex_text, mutate, name, sink, source
+from mongens.renderers import RENDERERS, open_renderer
+
+
+def _run(count=4, **outputs):
+    return list(source(None, count, run_seed=6) | mutate() | name() | dex_text() | sink(**outputs))
+
+
+def test_every_format_is_written_in_one_pass(tmp_path):
+    targets = {fmt: tmp_path / f"out{RENDERERS[fmt].extension}" for fmt in ("markdown", "csv", "html", "ndjson")}
+    jsonl = io.StringIO()
+    txt = io.StringIO()
+    items = _run(txt=txt, jsonl=jsonl, render={**targets, "dex": tmp_path / "dex.txt"})
+
+    assert targets["ndjson"].read_text(encoding="utf-8") == jsonl.getvalue()
+    assert (tmp_path / "dex.txt").read_text(encoding="utf-8") == txt.getvalue()
+    rows = list(csv.DictReader(targets["csv"].open(encoding="utf-8")))
+    assert [row["name"] for row in rows] == [item.seed.name for item in items]
+    assert rows[0]["HP"] == str(items[0].seed.stats["HP"])
+    page = targets["html"].read_text(encoding="utf-8")
+    assert page.startswith("<!DOCTYPE html>") and page.endswith("</html>\n")
+    assert page.count("<article ") == 4
+    assert targets["markdown"].read_text(encoding="utf-8").count("\n## #") == 3
+
+
+def test_appending_keeps_one_header_and_html_is_rewritten(tmp_path):
+    for _ in range(2):
+        _run(2, render={"csv": tmp_path / "a.csv", "html": tmp_path / "a.html"})
+    lines = (tmp_path / "a.csv").read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 5 and lines[0].startswith("idnum,name,")
+    assert (tmp_path / "a.html").read_text(encoding="utf-8").count("<article ") == 2
+
+    with pytest.raises(ValueError, match="Unknown output format"):
+        open_renderer("pdf", tmp_path / "a.pdf")
+
+
+def test_format_flag_writes_side_by_side(tmp_path, capsys):
+    out = tmp_path / "dex.txt"
+    cli.main(["dexentry", "-c", "2", "--seed", "3", "-o", str(out), "--format", "dex,csv,ndjson"])
+    assert out.read_text(encoding="utf-8").count("' --- a(n) ") == 2
+    assert len((tmp_path / "dex.csv").read_text(encoding="utf-8").splitlines()) == 3
+    assert [json.loads(line)["idnum"] for line in (tmp_path / "dex.ndjson").open(encoding="utf-8")] == [1, 2]
+    assert "Wrote 2 csv entries" in capsys.readouterr().out
+
+    with pytest.raises(ValueError, match="cannot share stdout"):
+        default_outputs(["csv", "html"])
+
+
+def test_unique_prints_every_requested_format(capsys):
+    cli.main(["unique", "-t1", "Echo", "--format", "csv,jsonl"])
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].startswith("idnum,name,") and lines[1].startswith("1,")
+    assert json.loads(lines[2])["primary_type"] == "Echo"
+
+    with pytest.raises(SystemExit) as exit_info:
+        cli.main(["unique", "--format", "csv,pdf"])
+    assert exit_info.value.code == 2
+    assert "invalid format" in capsys.readouterr().err
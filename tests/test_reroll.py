@@ -0,0 +1,89 @@
+import random
+
+import pytest
+
+from mongens import monster_cache, reroll
+from mongens.pipeline import generate_monster_at
+
+
+@pytest.mark.parametrize("k", range(1, 40))
+def test_derived_fields_match_a_generated_monster(k):
+    seed = generate_monster_at(11, k, major_count=k % 3, util_count=1 + k % 2)
+    assert reroll._derive_stats(seed) == seed.stats
+    assert reroll._derive_meta(seed) == seed.meta
+    assert reroll.forge_monster_name(seed) == seed.name
+
+
+def test_traits_reroll_only_dirties_text():
+    seed = generate_monster_at(3, 4, major_count=2, util_count=1)
+    new, changed = reroll.reroll(seed, ["traits"], random.Random(0))
+    assert changed == {"physical_traits", "text"}
+    assert new.stats is seed.stats and new.name == seed.name
+    assert new.physical_traits != seed.physical_traits
+
+
+def test_majors_reroll_recomputes_dependents():
+    seed = generate_monster_at(3, 4, major_count=2, util_count=1)
+    seed.meta["unique_id"] = "ABCDE12345"
+    new, changed = reroll.reroll(seed, ["majors"], random.Random(0))
+    assert changed == {"mutagens.major", "stats", "meta", "name", "text"}
+    assert len(new.mutagens["major"]) == len(seed.mutagens["major"])
+    assert new.mutagens["utility"] == seed.mutagens["utility"]
+    assert new.stats == reroll._derive_stats(new)
+    assert "unique_id" not in new.meta and seed.meta["unique_id"] == "ABCDE12345"
+
+    _, changed = reroll.reroll(seed, ["utilities"], random.Random(0))
+    assert "name" not in changed and "stats" in changed
+
+    with pytest.raises(ValueError, match="Unknown reroll option"):
+        reroll.reroll(seed, ["wings"])
+
+
+def test_reroll_monster_attributes_saves_a_new_pin(capsys):
+    seed = generate_monster_at(3, 4)
+    pin = monster_cache.save_monster(seed)
+    new = reroll.reroll_monster_attributes(pin, {"traits": True, "held_item": True})
+    assert new.meta["unique_id"] != pin
+    assert monster_cache.load_monster(pin).physical_traits == seed.physical_traits
+    assert monster_cache.load_monster(new.meta["unique_id"]).physical_traits == new.physical_traits
+    assert "New PIN" in capsys.readouterr().out
+
+
+def test_reroll_many_is_deterministic_per_pin():
+    pins = monster_cache.save_monsters([generate_monster_at(5, k, major_count=1) for k in range(1, 9)])
+    first = reroll.reroll_many(pins + ["NOPE"], ["majors", "traits"], run_seed=2)
+    second = reroll.reroll_many(list(reversed(pins)), ["majors", "traits"], run_seed=2, workers=2)
+    assert first["failed"].keys() == {"NOPE"} and not second["failed"]
+    assert list(first["rerolled"]) == pins
+
+    def content(pin):
+        seed = monster_cache.load_monster(pin)
+        seed.meta.pop("unique_id")
+        return seed
+
+    for pin in pins:
+        assert content(first["rerolled"][pin]) == content(second["rerolled"][pin])
+        assert content(first["rerolled"][pin]).mutagens != content(pin).mutagens
+
+
+def test_lineage_index_and_prune():
+    root = monster_cache.save_monster(generate_monster_at(9, 1))
+    child = reroll.reroll_monster_attributes(root, {"traits": True}).meta["unique_id"]
+    other = reroll.reroll_many([root], ["habitat"], run_seed=1, compact=True)["rerolled"][root]
+    grandchild = reroll.reroll_monster_attributes(child, {"tempers": True}).meta["unique_id"]
+    loner = monster_cache.save_monster(generate_monster_at(9, 2))
+
+    family = monster_cache.lineage(grandchild)
+    assert family["root"] == root and family["latest"] == grandchild
+    assert [(pin, parent, gen) for pin, parent, gen, _ in family["members"]] == [
+        (root, None, 0), (child, root, 1), (grandchild, child, 2), (other, root, 1)
+    ]
+    assert monster_cache.load_monster(grandchild).meta["lineage"]["root_id"] == root
+    assert monster_cache.lineage(loner)["members"] == [(loner, None, 0, True)]
+
+    assert monster_cache.prune_lineages() == 3
+    assert monster_cache.load_monster(grandchild) and monster_cache.load_monster(loner)
+    with pytest.raises(KeyError):
+        monster_cache.load_monster(child)
+    assert [cached for *_, cached in monster_cache.lineage(grandchild)["members"]] == [False, False, True]
+    assert monster_cache.prune_lineages() == 0
@@ -0,0 +1,92 @@
+import json
+import threading
+
+import pytest
+
+from mongens import cli, monster_cache, server
+from mongens.data import data
+from mongens.monsterseed import MonsterSeed
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    path = tmp_path / "mongen.sock"
+    srv = server.make_server(path)
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    yield path
+    srv.shutdown()
+    srv.server_close()
+
+
+def test_remote_request_runs_command_in_daemon(daemon):
+    response = server.request(["list", "--types"], daemon)
+    assert response["exit"] == 0
+    assert response["stdout"].splitlines()[1:] == [f"- {t}" for t in data.SEED_TYPES]
+
+    response = server.request(["reroll", "NOPE"], daemon)
+    assert response["exit"] == 1
+    assert "You must specify" in response["stderr"]
+
+
+def test_remote_falls_back_to_in_process(tmp_path, capsys):
+    assert server.request(["list", "--types"], tmp_path / "missing.sock") is None
+    cli.main(["--remote", "--socket", str(tmp_path / "missing.sock"), "list", "--types"])
+    assert capsys.readouterr().out.startswith("--- Available Monster Types ---")
+
+
+def test_strip_client_options():
+    argv = ["--remote", "--socket", "/x.sock", "dexentry", "--remote-ish", "-c", "2"]
+    assert cli._strip_client_options(argv) == ["dexentry", "--remote-ish", "-c", "2"]
+
+
+def test_cache_index_picks_up_appended_monsters(tmp_path, monkeypatch):
+    monkeypatch.setattr(monster_cache, "CACHE_FILE", tmp_path / "cache.jsonl")
+    first = MonsterSeed.forge(1, primary_type="Axiom", secondary_type=None)
+    first_id = monster_cache.save_monster(first)
+    assert monster_cache.load_monster(first_id).primary_type == "Axiom"
+
+    second = MonsterSeed.forge(2, primary_type="Bloom", secondary_type=None)
+    second_id = monster_cache.save_monster(second)
+    assert monster_cache.load_monster(second_id).primary_type == "Bloom"
+    assert set(monster_cache._INDEX) == {first_id, second_id}
+
+    with pytest.raises(KeyError):
+        monster_cache.load_monster("MISSING")
+
+
+def test_remote_command_reads_client_stdin(daemon, tmp_path):
+    pin = monster_cache.save_monster(MonsterSeed.forge(3, primary_type="Axiom", secondary_type=None))
+    queue = tmp_path / "queue.jsonl"
+    argv = ["artprompt", "--pins-file", "-", "--queue", str(queue)]
+    assert server.reads_stdin(argv)
+
+    response = server.request(argv, daemon, stdin=f"{pin}\n")
+    assert response["exit"] == 0, response["stderr"]
+    assert [json.loads(line)["pin"] for line in queue.read_text().splitlines()] == [pin]
+
+    # Without stdin in the request the command reads nothing, never the daemon's stdin.
+    response = server.request(argv, daemon)
+    assert response["exit"] == 0
+    assert response["stdout"].startswith("Queued 0 prompt(s)")
+
+
+def test_make_server_socket_is_owner_only(daemon):
+    assert daemon.stat().st_mode & 0o077 == 0
+
+
+def test_remote_falls_back_when_socket_not_ours(tmp_path, monkeypatch, capsys):
+    def refuse(self, address):
+        raise PermissionError(13, "Permission denied")
+
+    monkeypatch.setattr(server.socket.socket, "connect", refuse)
+    with pytest.raises(PermissionError, match="owned by another user"):
+        server.request(["list", "--types"], tmp_path / "theirs.sock")
+    (tmp_path / "theirs.sock").touch()
+    with pytest.raises(RuntimeError, match="MONGENS_SOCKET"):
+        server.make_server(tmp_path / "theirs.sock")
+
+    cli.main(["--remote", "--socket", str(tmp_path / "theirs.sock"), "list", "--types"])
+    captured = capsys.readouterr()
+    assert "running in-process" in captured.err
+    assert captured.out.startswith("--- Available Monster Types ---")
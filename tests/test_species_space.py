@@ -0,0 +1,70 @@
+import math
+import random
+
+import pytest
+
+from mongens.data import data
+from mongens.monsterseed import MonsterSeed
+from mongens.species_space import (
+    count_species,
+    iter_seeds,
+    iter_species,
+    pair_distribution,
+    validate_species,
+)
+
+SMALL = {"primary_type": "Axiom", "secondary_type": "none"}
+
+
+def _unknown_form(combo):
+    return "unknown form" if combo.form == "Unknown" else None
+
+
+def test_count_is_analytic_and_matches_enumeration():
+    combos = list(iter_species(SMALL))
+    assert count_species(SMALL) == len(combos) == len(set(c[:6] for c in combos))
+    assert math.isclose(sum(c.probability for c in combos), 1.0)
+    assert sum(count_species(by_primary=True).values()) == count_species()
+
+
+def test_pair_probabilities_are_exact():
+    pairs = dict(pair_distribution({"secondary_chance": 0.4}))
+    assert math.isclose(sum(pairs.values()), 1.0)
+    weights = data.SEED_TYPES_WEIGHTED
+    assert math.isclose(pairs[("Axiom", None)], weights["Axiom"] / sum(weights.values()) * 0.6)
+    assert ("Nadir", "Bastion") not in pairs and ("Bastion", "Nadir") not in pairs
+
+
+def test_forged_monsters_always_land_in_the_space():
+    space = {c[:6]: c.probability for c in iter_species({"primary_type": "Axiom"})}
+    for i in range(200):
+        seed = MonsterSeed.forge(i, "Axiom", rng=random.Random(i))
+        key = (seed.primary_type, seed.secondary_type, seed.form, seed.habitat,
+               seed.mutagens["major"][0], seed.mutagens["utility"][0])
+        assert space.get(key, 0) > 0
+
+
+def test_validation_streams_and_parallelizes_over_primaries():
+    spec = {"secondary_type": "none"}
+    serial = validate_species(_unknown_form, spec)
+    assert serial["combos"] == serial["expected"] == count_species(spec)
+    assert serial["failed"] == 0 and math.isclose(serial["probability"], 1.0)
+    assert validate_species(_unknown_form, spec, workers=2) == serial
+
+    failing = validate_species(lambda combo: "rare" if combo.probability < 1e-5 else None, spec, max_failures=5)
+    assert failing["failed"] > 5 and len(failing["failures"]) == 5
+
+
+def test_materialized_seeds_match_their_combination():
+    first = list(zip(range(20), iter_seeds(SMALL, run_seed=1)))
+    for i, (combo, seed) in first:
+        assert seed.idnum == i + 1
+        assert (seed.primary_type, seed.secondary_type, seed.form, seed.habitat) == combo[:4]
+        assert seed.mutagens == {"major": [combo.major], "utility": [combo.utility]}
+    again = list(zip(range(20), iter_seeds(SMALL, run_seed=1)))
+    assert again == first
+
+
+def test_impossible_spec_is_rejected():
+    with pytest.raises(ValueError, match="Incompatible"):
+        count_species({"primary_type": "Nadir", "secondary_type": "Bastion"})
@@ -0,0 +1,49 @@
+import json
+import random
+
+import pytest
+
+from mongens import cli, dex_entries, monster_cache
+from mongens.writers import JsonArrayWriter
+
+
+@pytest.mark.parametrize("indent", [2, None])
+@pytest.mark.parametrize("items", [[], [{"a": [1, 2], "b": "é"}], [{"x": {"y": 1}}, [1], "s", None]])
+def test_json_array_writer_matches_json_dump(tmp_path, items, indent):
+    path = tmp_path / "out.json"
+    with JsonArrayWriter(path, indent=indent) as out:
+        for item in items:
+            out.write(item)
+    assert path.read_text(encoding="utf-8") == json.dumps(items, indent=indent, ensure_ascii=False)
+
+
+def test_json_array_writer_closes_array_when_interrupted(tmp_path):
+    path = tmp_path / "out.json"
+    with pytest.raises(KeyboardInterrupt):
+        with JsonArrayWriter(path) as out:
+            out.write({"n": 1})
+            raise KeyboardInterrupt
+    assert json.loads(path.read_text(encoding="utf-8")) == [{"n": 1}]
+
+
+def test_dexentry_streams_seed_json(tmp_path):
+    out = tmp_path / "dex.txt"
+    cli.main(["dexentry", "-c", "4", "--seed", "3", "--json", "-o", str(out)])
+    seeds = json.loads((tmp_path / "dex.txt.seed.json").read_text(encoding="utf-8"))
+    assert [s["idnum"] for s in seeds] == [1, 2, 3, 4]
+    assert all(s["meta"]["unique_id"] for s in seeds)
+    assert len(monster_cache.CACHE_FILE.read_text(encoding="utf-8").splitlines()) == 4
+
+
+def test_generate_dex_batch_streams_same_text(tmp_path):
+    random.seed(11)
+    entries = dex_entries.generate_dex_batch(3, 1, 1, str(tmp_path / "a.txt"))
+    random.seed(11)
+    assert dex_entries.generate_dex_batch(3, 1, 1, str(tmp_path / "b.txt"), collect=False) == []
+
+    expected = "".join(
+        entry + "\n" + ("-" * 60 + "\n\n" if i != len(entries) - 1 else "")
+        for i, entry in enumerate(entries)
+    )
+    assert (tmp_path / "a.txt").read_text(encoding="utf-8") == expected
+    assert (tmp_path / "b.txt").read_text(encoding="utf-8") == expected
@@ -0,0 +1,62 @@
+import random
+
+import pytest
+
+from mongens import pipeline
+from mongens.data import data
+from mongens.monsterseed import check_type_pair, choose_type_pair, sample_type_pair, weighted_choice
+
+
+def _legal(p, s):
+    return s is None or (p != s and frozenset([p, s]) not in data.INCOMPATIBLE_TYPE_PAIRS)
+
+
+def _reference_choose_type_pair(secondary_chance, rng):
+    # The per-call candidate scan choose_type_pair() used before the pair space.
+    primary = weighted_choice(data.SEED_TYPES_WEIGHTED, rng)
+    if rng.random() > secondary_chance:
+        return primary, None
+    candidates = {
+        t: data.SEED_TYPES_WEIGHTED.get(t, 1.0) * data.TYPE_SYNERGY_BOOSTS.get(frozenset([primary, t]), 1.0)
+        for t in data.SEED_TYPES
+        if _legal(primary, t)
+    }
+    return primary, weighted_choice(candidates, rng)
+
+
+def test_pair_space_draws_match_per_call_scan():
+    for seed in range(500):
+        expected = _reference_choose_type_pair(0.65, random.Random(seed))
+        assert choose_type_pair(rng=random.Random(seed)) == expected
+
+
+def test_pinned_secondary_only_meets_compatible_primaries():
+    secondary = "Bastion"
+    primaries = {sample_type_pair("random", secondary, rng=random.Random(i))[0] for i in range(400)}
+    assert secondary not in primaries and "Nadir" not in primaries
+    assert all(_legal(p, secondary) for p in primaries)
+
+    items = list(pipeline.source({"secondary_type": secondary}, 50, run_seed=3))
+    assert len(items) == 50 and not any(item.skipped for item in items)
+    assert {item.seed.secondary_type for item in items} == {secondary}
+
+
+def test_none_means_no_secondary_type():
+    items = list(pipeline.source({"primary_type": "Axiom", "secondary_type": "none"}, 30, run_seed=1))
+    assert {item.seed.secondary_type for item in items} == {None}
+
+
+@pytest.mark.parametrize(
+    "primary, secondary, message",
+    [
+        ("Nadir", "Bastion", "Incompatible type pairing"),
+        ("Axiom", "Axiom", "cannot be the same"),
+        ("Nope", "random", "Unknown primary_type"),
+        ("random", "Nope", "Unknown secondary_type"),
+    ],
+)
+def test_impossible_constraints_fail_before_generating(primary, secondary, message):
+    with pytest.raises(ValueError, match=message):
+        check_type_pair(primary, secondary)
+    with pytest.raises(ValueError, match=message):
+        pipeline.source({"primary_type": primary, "secondary_type": secondary}, 10)
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+import yaml
+
+from mongens.data import data
+
+
+def _time_parse(loader: type, max_workers: int | None, rounds: int) -> list[float]:
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        data._prefetch_yaml(data.DATA_FILES, loader=loader, max_workers=max_workers)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def _time_cli_import(rounds: int) -> list[float]:
+    # Cumulative `import mongens.cli` time in seconds, as reported by -X importtime,
+    # each round in a fresh interpreter.
+    timings = []
+    for _ in range(rounds):
+        stderr = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import mongens.cli"],
+            capture_output=True, text=True, check=True,
+        ).stderr
+        for line in stderr.splitlines():
+            if line.startswith("import time:") and line.rstrip().endswith("| mongens.cli"):
+                timings.append(int(line.split("|")[1]) / 1e6)
+    return timings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Compare cold-start YAML parsing: pure-Python sequential vs libyaml + thread pool "
+        "(or, with --cli, time `import mongens.cli` against a budget)."
+    )
+    parser.add_argument("-n", "--rounds", type=int, default=5, help="Parses per variant.")
+    parser.add_argument(
+        "--cli",
+        action="store_true",
+        help="Instead, time `import mongens.cli` (the start-up cost of every command).",
+    )
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=120.0,
+        help="With --cli, exit 1 if the median import time exceeds this (default: 120).",
+    )
+    args = parser.parse_args()
+
+    if args.cli:
+        timings = _time_cli_import(args.rounds)
+        median = statistics.median(timings)
+        print(
+            f"import mongens.cli median {median * 1000:8.1f} ms  best {min(timings) * 1000:8.1f} ms"
+            f"  (budget {args.budget_ms:.0f} ms)"
+        )
+        return 0 if median * 1000 <= args.budget_ms else 1
+
+    variants = [("SafeLoader, sequential", yaml.SafeLoader, 1)]
+    if data.YAML_LOADER is not yaml.SafeLoader:
+        variants.append(("CSafeLoader, sequential", data.YAML_LOADER, 1))
+    variants.append((f"{data.YAML_LOADER.__name__}, thread pool", data.YAML_LOADER, 8))
+    print(f"Default at import: {data.YAML_LOADER.__name__}, {data._default_yaml_workers()} worker(s)")
+
+    print(f"Parsing {len(data.DATA_FILES)} data files, {args.rounds} round(s) each")
+    baseline = None
+    for label, loader, workers in variants:
+        timings = _time_parse(loader, workers, args.rounds)
+        median = statistics.median(timings)
+        baseline = baseline or median
+        print(
+            f"{label:28} median {median * 1000:8.1f} ms"
+            f"  best {min(timings) * 1000:8.1f} ms  x{baseline / median:5.2f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,19 +1,31 @@
 from __future__ import annotations
 
+import json
+import sys
 import time
 import threading
-import subprocess
 from pathlib import Path
-from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
 
-WATCH_DIR = Path("src/mongens/data")
-VALIDATE_CMD = [".venv/Scripts/python.exe", "tools/validate_yaml.py"]
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:  # fall back to polling file stamps
+    Observer = None
+    FileSystemEventHandler = object
+
+# Run from a checkout without installing the package.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from mongens.data import data  # noqa: E402  (parses and validates everything once)
+
+WATCH_DIR = data.DATA_DIR
 
 OUT_DIR = Path("output")
 OUT_FILE = OUT_DIR / "last_validation.txt"
+OUT_JSON = OUT_DIR / "last_validation.json"
 
-DEBOUNCE_SECONDS = 0.75
+DEBOUNCE_SECONDS = 0.25
+POLL_SECONDS = 0.5
 
 
 class DebouncedRunner:
@@ -21,11 +33,11 @@ class DebouncedRunner:
         self.debounce_seconds = debounce_seconds
         self._lock = threading.Lock()
         self._timer: threading.Timer | None = None
-        self._last_path: str | None = None
+        self._pending: set[str] = set()
 
     def trigger(self, changed_path: str) -> None:
         with self._lock:
-            self._last_path = changed_path
+            self._pending.add(changed_path)
             if self._timer:
                 self._timer.cancel()
             self._timer = threading.Timer(self.debounce_seconds, self._run)
@@ -34,45 +46,56 @@ class DebouncedRunner:
 
     def _run(self) -> None:
         with self._lock:
-            changed = self._last_path
-            self._last_path = None
+            changed = sorted(self._pending)
+            self._pending.clear()
             self._timer = None
 
         OUT_DIR.mkdir(exist_ok=True)
         stamp = time.strftime("%Y-%m-%d %H:%M:%S")
 
+        # Validate only the changed files and their dependents; a passing result
+        # is published so the next save is checked against it.
         try:
-            proc = subprocess.run(
-                VALIDATE_CMD,
-                cwd=Path("."),
-                capture_output=True,
-                text=True,
-            )
-            stdout = (proc.stdout or "").strip()
-            stderr = (proc.stderr or "").strip()
-            ok = proc.returncode == 0
+            result = data.validate(changed, publish=True)
         except Exception as e:
-            ok = False
-            stdout = ""
-            stderr = f"Watcher failed to run validator: {e}"
-            proc = None
-
-        status = "PASS" if ok else "FAIL"
+            result = {
+                "ok": False,
+                "elapsed_ms": 0.0,
+                "files": [],
+                "tables": [],
+                "error": f"Watcher failed to run validator: {e}",
+            }
+        result["changed"] = changed
+        result["timestamp"] = stamp
+
+        status = "PASS" if result["ok"] else "FAIL"
         lines = [
-            f"[{stamp}] {status}",
-            f"Changed: {changed}",
+            f"[{stamp}] {status} ({result['elapsed_ms']:.1f} ms)",
+            *(f"Changed: {path}" for path in changed),
             "",
         ]
-        if stdout:
-            lines += ["--- stdout ---", stdout, ""]
-        if stderr:
-            lines += ["--- stderr ---", stderr, ""]
-        lines += [f"ExitCode: {0 if ok else (proc.returncode if proc else 999)}", ""]
+        if not result["files"] and "error" not in result:
+            lines += ["(not a loaded data file; nothing to validate)", ""]
+        for entry in result["files"]:
+            mark = "ok  " if entry["ok"] else "FAIL"
+            lines.append(f"{mark} parse {entry['file']:40} {entry['parse_ms']:7.1f} ms")
+            if entry["error"]:
+                lines.append(f"     {entry['error']}")
+        for entry in result["tables"]:
+            mark = "ok  " if entry["ok"] else "FAIL"
+            tables = ", ".join(entry["tables"])
+            lines.append(f"{mark} build {tables:40} {entry['build_ms']:7.1f} ms")
+            if entry["error"]:
+                lines.append(f"     {entry['error']}")
+        if "error" in result:
+            lines.append(result["error"])
+        lines.append("")
 
         OUT_FILE.write_text("\n".join(lines), encoding="utf-8")
+        OUT_JSON.write_text(json.dumps(result, indent=2), encoding="utf-8")
 
         # Keep terminal output minimal
-        print(f"[watch_yaml] {status} -> {OUT_FILE}")
+        print(f"[watch_yaml] {status} in {result['elapsed_ms']:.1f} ms -> {OUT_FILE}")
 
 
 runner = DebouncedRunner(DEBOUNCE_SECONDS)
@@ -97,23 +120,44 @@ class Handler(FileSystemEventHandler):
             self._maybe(getattr(event, "dest_path", event.src_path))
 
 
+def _poll_forever() -> None:
+    # Without watchdog, compare the loaded files' stamps against the published data.
+    reported: dict[str, object] = {}
+    while True:
+        time.sleep(POLL_SECONDS)
+        for name in data.changed_files():
+            path = WATCH_DIR / name
+            stamp = path.stat().st_mtime_ns if path.exists() else None
+            if reported.get(name) != stamp:
+                reported[name] = stamp
+                runner.trigger(str(path))
+
+
 def main() -> int:
     if not WATCH_DIR.exists():
         print(f"[watch_yaml] WATCH_DIR not found: {WATCH_DIR.resolve()}")
         return 2
 
-    observer = Observer()
-    observer.schedule(Handler(), str(WATCH_DIR), recursive=True)
-    observer.start()
-    print(f"[watch_yaml] Watching: {WATCH_DIR.resolve()} (Ctrl+C to stop)")
+    observer = None
+    if Observer is not None:
+        observer = Observer()
+        observer.schedule(Handler(), str(WATCH_DIR), recursive=True)
+        observer.start()
+    mode = "events" if observer else "polling"
+    print(f"[watch_yaml] Watching: {WATCH_DIR.resolve()} ({mode}; Ctrl+C to stop)")
 
     try:
-        while True:
-            time.sleep(0.5)
+        if observer:
+            while True:
+                time.sleep(0.5)
+        else:
+            _poll_forever()
     except KeyboardInterrupt:
         print("\n[watch_yaml] Stopping...")
-        observer.stop()
-    observer.join()
+        if observer:
+            observer.stop()
+    if observer:
+        observer.join()
     return 0
 
 